@@ -0,0 +1,28 @@
+"""
+Keyset pagination cursors
+
+List endpoints return next_cursor as an opaque token holding the sort key
+of the last row on the page; the next request seeks past that key with a
+row comparison instead of OFFSET, so deep pages cost the same as the first.
+Clients must pass the token back unchanged and never parse it.
+"""
+import base64
+from typing import Any, Optional, Sequence
+
+import orjson
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Opaque cursor for a sort key (datetimes and UUIDs serialize as strings)."""
+    return base64.urlsafe_b64encode(orjson.dumps(list(key))).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> Optional[list]:
+    """Raw sort key values from encode_cursor; None if malformed or the wrong length."""
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(key, list) or len(key) != size:
+        return None
+    return key
@@ -1,10 +1,10 @@
 """
 Admin endpoints - connector management and manual ingestion
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
 from app.core.config import settings
@@ -160,3 +160,18 @@ async def trigger_ingestion(
         run_id=run.id,
         status=run.status
     )
+
+
+@router.post("/cache/congress-members/invalidate")
+async def invalidate_congress_members(
+    state: Optional[str] = Query(None, min_length=2, max_length=2, description="State code; omit for all states"),
+    _admin = Depends(require_admin),
+):
+    """
+    Drop cached Congress.gov member lists after a membership change
+    (resignation, special election, new Congress) so the next
+    representative refresh fetches current members.
+    """
+    from app.services.congress_api import congress_api_service
+    await congress_api_service.invalidate_members_cache(state)
+    return {"invalidated": state.upper() if state else "all"}
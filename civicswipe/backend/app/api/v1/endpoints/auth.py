@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 from app.core.database import get_db
 from app.core.security import (
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
     create_access_token,
     create_refresh_token,
     verify_token,
@@ -67,6 +67,7 @@ async def signup(
         first_name=user_data.first_name,
         last_name=user_data.last_name,
         birthday=user_data.birthday,
+        birth_year=user_data.birthday.year,
         state=user_data.state
     )
     db.add(new_user)
@@ -108,7 +109,6 @@ async def signup(
     # Create default preferences
     user_preferences = UserPreferences(
         user_id=new_user.id,
-        topics=[],
         notify_enabled=True
     )
     db.add(user_preferences)
@@ -178,12 +178,17 @@ async def login(
             detail="Invalid email or password"
         )
 
-    if not verify_password(credentials.password, user.password_hash):
+    verified, new_hash = verify_and_update_password(credentials.password, user.password_hash)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
 
+    # Upgrade legacy bcrypt hashes to argon2id now that we have the plaintext
+    if new_hash:
+        user.password_hash = new_hash
+
     # Update last login timestamp
     user.last_login_at = datetime.utcnow()
     await db.commit()
@@ -208,7 +213,7 @@ async def refresh(
     Implements token rotation — the old refresh token is blacklisted.
     """
     # Check if the refresh token has been revoked (replay detection)
-    if await is_token_blacklisted(token_data.refresh_token):
+    if await is_token_blacklisted(token_data.refresh_token, use_cache=False):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token has been revoked"
@@ -3,13 +3,15 @@ Feed endpoints - personalized swipe feed
 """
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, and_, func, text
+from sqlalchemy import select, or_, and_, func, text, tuple_
 from sqlalchemy.dialects.postgresql import ARRAY, array
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from uuid import UUID
 
-from app.core.database import get_db
-from app.schemas import FeedResponse, FeedCard, MeasureDetail, JurisdictionLevel, MeasureStatus, FeedMode
+from app.core.database import get_db, select_for_schema
+from app.api.pagination import encode_cursor, decode_cursor
+from app.schemas import FeedResponse, FeedCard, Source, ContentType, MeasureDetail, MeasureInfo, JurisdictionLevel, MeasureStatus, FeedMode
 from app.models import Measure, UserDivision, UserVote, MeasureSource, MeasureStatusEvent, VoteEvent
 from app.api.v1.endpoints.profile import get_current_user
 
@@ -57,11 +59,10 @@ async def get_categories(
 
     for category_name, topics in CATEGORY_MAPPING.items():
         # Count bills in this category using PostgreSQL array overlap operator
-        # Build OR conditions for each topic
-        topic_conditions = [Measure.topic_tags.any(topic) for topic in topics]
+        # (&& can use the GIN index on topic_tags; OR'd = ANY() checks cannot)
         count_stmt = select(func.count(Measure.id)).where(
             Measure.level == "federal",
-            or_(*topic_conditions)
+            Measure.topic_tags.overlap(topics)
         )
 
         # Apply mode filter
@@ -107,6 +108,46 @@ def get_category_icon(category: str) -> str:
     return icons.get(category, "📋")
 
 
+def _encode_feed_cursor(measure: Measure) -> str:
+    """Opaque keyset cursor: the sort key of the last unvoted card on a page."""
+    return encode_cursor((measure.scheduled_for, measure.updated_at, measure.id))
+
+
+def _decode_feed_cursor(cursor: str) -> Optional[Tuple[Optional[datetime], datetime, UUID]]:
+    """Inverse of _encode_feed_cursor; None for malformed (or legacy offset) cursors."""
+    key = decode_cursor(cursor, 3)
+    if key is None:
+        return None
+    try:
+        scheduled_for, updated_at, measure_id = key
+        return (
+            datetime.fromisoformat(scheduled_for) if scheduled_for else None,
+            datetime.fromisoformat(updated_at),
+            UUID(measure_id),
+        )
+    except (ValueError, TypeError):
+        return None
+
+
+def _after_feed_cursor(key: Tuple[Optional[datetime], datetime, UUID], historical: bool):
+    """
+    WHERE clause for rows after the cursor in feed sort order:
+    historical is (updated_at DESC, id DESC); everything else is
+    (scheduled_for ASC NULLS LAST, updated_at DESC, id DESC).
+    """
+    scheduled_for, updated_at, measure_id = key
+    later = tuple_(Measure.updated_at, Measure.id) < tuple_(updated_at, measure_id)
+    if historical:
+        return later
+    if scheduled_for is None:
+        return and_(Measure.scheduled_for.is_(None), later)
+    return or_(
+        Measure.scheduled_for > scheduled_for,
+        Measure.scheduled_for.is_(None),
+        and_(Measure.scheduled_for == scheduled_for, later),
+    )
+
+
 @router.get("/feed", response_model=FeedResponse)
 async def get_feed(
     cursor: Optional[str] = Query(None),
@@ -156,7 +197,8 @@ async def get_feed(
 
     # Build base query - Currently focused on federal legislation only (House & Senate)
     # City/local legislation will be added when we have enough users in relevant areas
-    base_stmt = select(Measure).where(Measure.level == "federal")
+    # Sources load in one selectin query; other relationships are raiseloaded
+    base_stmt = select_for_schema(Measure, FeedCard).where(Measure.level == "federal")
 
     # Filter out procedural items
     base_stmt = base_stmt.where(Measure.summary_short != "Procedural item - no action needed from voters.")
@@ -175,16 +217,10 @@ async def get_feed(
     if bill_status:
         base_stmt = base_stmt.where(Measure.status == bill_status.value)
     if resolved_topics:
-        topic_conditions = [Measure.topic_tags.any(t) for t in resolved_topics]
-        base_stmt = base_stmt.where(or_(*topic_conditions))
+        base_stmt = base_stmt.where(Measure.topic_tags.overlap(resolved_topics))
 
-    # Parse cursor — it's a simple integer offset (base-10 string)
-    offset = 0
-    if cursor:
-        try:
-            offset = int(cursor)
-        except ValueError:
-            offset = 0
+    # Parse cursor — keyset position of the previous page's last card
+    cursor_key = _decode_feed_cursor(cursor) if cursor else None
 
     # Build unvoted query (excludes yes/no votes; skips handled separately)
     unvoted_base = base_stmt.where(~Measure.id.in_(list(user_votes.keys()))) if user_votes else base_stmt
@@ -202,8 +238,7 @@ async def get_feed(
     if level:
         count_stmt = count_stmt.where(Measure.level == level.value)
     if resolved_topics:
-        topic_count_conditions = [Measure.topic_tags.any(t) for t in resolved_topics]
-        count_stmt = count_stmt.where(or_(*topic_count_conditions))
+        count_stmt = count_stmt.where(Measure.topic_tags.overlap(resolved_topics))
     # Exclude already-voted (yes/no) measures from the count
     if user_votes:
         voted_final_ids = [mid for mid, vote in user_votes.items() if vote in ("yes", "no")]
@@ -212,14 +247,21 @@ async def get_feed(
     count_result = await db.execute(count_stmt)
     total_remaining = count_result.scalar() or 0
 
-    # Sort: historical by updated_at DESC, upcoming by scheduled date
-    if mode == FeedMode.HISTORICAL:
-        unvoted_sorted = unvoted_base.order_by(Measure.updated_at.desc())
+    # Sort: historical by updated_at DESC, upcoming by scheduled date; id
+    # breaks ties so the keyset cursor is unambiguous
+    historical = mode == FeedMode.HISTORICAL
+    if historical:
+        unvoted_sorted = unvoted_base.order_by(Measure.updated_at.desc(), Measure.id.desc())
     else:
-        unvoted_sorted = unvoted_base.order_by(Measure.scheduled_for.asc().nullslast(), Measure.updated_at.desc())
+        unvoted_sorted = unvoted_base.order_by(
+            Measure.scheduled_for.asc().nullslast(), Measure.updated_at.desc(), Measure.id.desc()
+        )
 
-    # Apply offset + limit for pagination
-    unvoted_sorted = unvoted_sorted.offset(offset).limit(limit)
+    # Keyset pagination: continue after the cursor instead of OFFSET, which
+    # rescans skipped rows and drifts as the user votes cards out of the set
+    if cursor_key:
+        unvoted_sorted = unvoted_sorted.where(_after_feed_cursor(cursor_key, historical))
+    unvoted_sorted = unvoted_sorted.limit(limit)
 
     result = await db.execute(unvoted_sorted)
     unvoted_measures = list(result.scalars().all())
@@ -241,24 +283,16 @@ async def get_feed(
     # Determine next cursor — if we got a full page, there are likely more
     next_cursor_val = None
     if len(unvoted_measures) == limit:
-        next_cursor_val = str(offset + limit)
-
-    # Batch-load all sources in ONE query instead of N+1
-    measure_ids = [m.id for m in all_measures]
-    sources_by_measure = {}
-    if measure_ids:
-        sources_stmt = select(MeasureSource).where(MeasureSource.measure_id.in_(measure_ids))
-        sources_result = await db.execute(sources_stmt)
-        for s in sources_result.scalars().all():
-            sources_by_measure.setdefault(s.measure_id, []).append(s)
-
-    # Build feed cards
+        next_cursor_val = _encode_feed_cursor(unvoted_measures[-1])
+
+    # Build feed cards. Rows come straight from the database, so skip field
+    # validation here; FastAPI still checks the response against FeedResponse.
     items = []
     for measure in all_measures:
-        sources = sources_by_measure.get(measure.id, [])
+        sources = measure.sources
         was_skipped = measure.id in skipped_ids
 
-        items.append(FeedCard(
+        items.append(FeedCard.model_construct(
             measure_id=measure.id,
             title=measure.title,
             level=JurisdictionLevel(measure.level),
@@ -268,7 +302,7 @@ async def get_feed(
             topic_tags=measure.topic_tags or [],
             summary_short=measure.summary_short,
             sources=[
-                {"label": s.label, "url": s.url, "ctype": s.ctype}
+                Source.model_construct(label=s.label, url=s.url, ctype=ContentType(s.ctype))
                 for s in sources
             ],
             user_vote="skip" if was_skipped else None,
@@ -285,7 +319,10 @@ async def get_measure_detail(
     db: AsyncSession = Depends(get_db)
 ):
     """Get detailed information about a specific measure"""
-    measure = await db.get(Measure, measure_id)
+    result = await db.execute(
+        select_for_schema(Measure, MeasureInfo).where(Measure.id == measure_id)
+    )
+    measure = result.scalar_one_or_none()
     if not measure:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Measure not found")
     
@@ -3,21 +3,34 @@ Matching endpoints - compare user votes to official votes
 """
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from typing import Optional
+from sqlalchemy import select, and_, tuple_
+from datetime import datetime
+from typing import Optional, Tuple
 from uuid import UUID
 
 from app.core.database import get_db
+from app.api.pagination import encode_cursor, decode_cursor
 from app.schemas import (
     MatchesResponse, MatchSummary, MatchDetail,
     JurisdictionLevel, MeasureStatus, VoteValue
 )
-from app.models import MatchResult, Measure, UserVote, VoteEvent
+from app.models import MatchResult, MatchResultOfficial, Official, Measure, UserVote, VoteEvent
 from app.api.v1.endpoints.profile import get_current_user
 
 router = APIRouter()
 
 
+def _decode_match_cursor(cursor: str) -> Optional[Tuple[datetime, UUID]]:
+    """(computed_at, measure_id) of the last match on the previous page, or None if malformed."""
+    key = decode_cursor(cursor, 2)
+    if key is None:
+        return None
+    try:
+        return datetime.fromisoformat(key[0]), UUID(key[1])
+    except (ValueError, TypeError):
+        return None
+
+
 @router.get("", response_model=MatchesResponse)
 async def get_matches(
     cursor: Optional[str] = Query(None),
@@ -46,20 +59,21 @@ async def get_matches(
     if level:
         stmt = stmt.where(Measure.level == level.value)
     
-    # Parse cursor (offset-based, consistent with feed endpoint)
-    offset = 0
-    if cursor:
-        try:
-            offset = int(cursor)
-        except ValueError:
-            offset = 0
+    # Keyset cursor: seek past the last (computed_at, measure_id) seen; a
+    # malformed (or legacy offset) cursor restarts from the first page
+    cursor_key = _decode_match_cursor(cursor) if cursor else None
+    if cursor_key:
+        stmt = stmt.where(tuple_(MatchResult.computed_at, MatchResult.measure_id) < tuple_(*cursor_key))
 
-    # Order by computed date (most recent first)
-    stmt = stmt.order_by(MatchResult.computed_at.desc())
-    stmt = stmt.offset(offset).limit(limit)
+    # Order by computed date (most recent first); one extra row tells us
+    # whether there is a next page
+    stmt = stmt.order_by(MatchResult.computed_at.desc(), MatchResult.measure_id.desc())
+    stmt = stmt.limit(limit + 1)
 
     result = await db.execute(stmt)
     rows = result.fetchall()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
     # Build response items
     items = []
@@ -74,8 +88,10 @@ async def get_matches(
             computed_at=match_result.computed_at
         ))
 
-    # Next page cursor if we got a full page
-    next_cursor = str(offset + limit) if len(items) == limit else None
+    next_cursor = None
+    if has_more:
+        last_match = rows[-1][0]
+        next_cursor = encode_cursor((last_match.computed_at, last_match.measure_id))
 
     return MatchesResponse(
         items=items,
@@ -140,6 +156,27 @@ async def get_match_detail(
             detail="Vote event not found"
         )
     
+    # Get per-official breakdown
+    stmt = (
+        select(MatchResultOfficial, Official.name, Official.office)
+        .join(Official, MatchResultOfficial.official_id == Official.id)
+        .where(
+            MatchResultOfficial.measure_id == measure_id,
+            MatchResultOfficial.user_id == current_user.id
+        )
+    )
+    result = await db.execute(stmt)
+    breakdown_officials = [
+        {
+            "official_id": row.official_id,
+            "name": name,
+            "office": office or "",
+            "official_vote": row.official_vote,
+            "matches_user": row.matches_user
+        }
+        for row, name, office in result.all()
+    ]
+    
     return MatchDetail(
         measure_id=measure.id,
         title=measure.title,
@@ -153,6 +190,6 @@ async def get_match_detail(
         },
         match={
             "match_score": float(match_result.match_score),
-            "breakdown": match_result.breakdown
+            "breakdown": {"officials": breakdown_officials}
         }
     )
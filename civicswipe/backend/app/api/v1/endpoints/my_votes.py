@@ -3,18 +3,32 @@ My Votes endpoints - user's voting history
 """
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from typing import Optional
+from sqlalchemy import select, and_, tuple_
+from datetime import datetime
+from typing import Optional, Tuple
 from uuid import UUID
 
 from app.core.database import get_db
+from app.api.pagination import encode_cursor, decode_cursor
 from app.schemas import MyVotesResponse, MyVoteItem, JurisdictionLevel, MeasureStatus, SwipeResponse, SwipeRequest
 from app.models import UserVote, Measure
+from app.services.user_stats import record_vote_change
 from app.api.v1.endpoints.profile import get_current_user
 
 router = APIRouter()
 
 
+def _decode_vote_cursor(cursor: str) -> Optional[Tuple[datetime, UUID]]:
+    """(created_at, id) of the last vote on the previous page, or None if malformed."""
+    key = decode_cursor(cursor, 2)
+    if key is None:
+        return None
+    try:
+        return datetime.fromisoformat(key[0]), UUID(key[1])
+    except (ValueError, TypeError):
+        return None
+
+
 @router.get("", response_model=MyVotesResponse)
 async def get_my_votes(
     cursor: Optional[str] = Query(None),
@@ -49,20 +63,21 @@ async def get_my_votes(
     if topic:
         stmt = stmt.where(Measure.topic_tags.contains([topic]))
 
-    # Parse cursor (offset-based, consistent with feed endpoint)
-    offset = 0
-    if cursor:
-        try:
-            offset = int(cursor)
-        except ValueError:
-            offset = 0
+    # Keyset cursor: seek past the last (created_at, id) seen; a malformed
+    # (or legacy offset) cursor restarts from the first page
+    cursor_key = _decode_vote_cursor(cursor) if cursor else None
+    if cursor_key:
+        stmt = stmt.where(tuple_(UserVote.created_at, UserVote.id) < tuple_(*cursor_key))
 
-    # Order by vote date (most recent first)
-    stmt = stmt.order_by(UserVote.created_at.desc())
-    stmt = stmt.offset(offset).limit(limit)
+    # Order by vote date (most recent first); one extra row tells us whether
+    # there is a next page
+    stmt = stmt.order_by(UserVote.created_at.desc(), UserVote.id.desc())
+    stmt = stmt.limit(limit + 1)
 
     result = await db.execute(stmt)
     rows = result.fetchall()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
     # Build response items
     items = []
@@ -90,8 +105,10 @@ async def get_my_votes(
             outcome_matches_user=outcome_matches
         ))
 
-    # Next page cursor if we got a full page
-    next_cursor = str(offset + limit) if len(items) == limit else None
+    next_cursor = None
+    if has_more:
+        last_vote = rows[-1][0]
+        next_cursor = encode_cursor((last_vote.created_at, last_vote.id))
 
     return MyVotesResponse(
         items=items,
@@ -117,13 +134,14 @@ async def update_vote(
             detail="Measure not found"
         )
 
-    # Get existing vote
+    # Get existing vote, locked so a concurrent change can't slip between
+    # reading the old value and applying the stats delta
     stmt = select(UserVote).where(
         and_(
             UserVote.user_id == current_user.id,
             UserVote.measure_id == measure_id
         )
-    )
+    ).with_for_update()
     result = await db.execute(stmt)
     existing_vote = result.scalar_one_or_none()
 
@@ -134,7 +152,12 @@ async def update_vote(
         )
 
     # Update vote
+    old_vote = existing_vote.vote
     existing_vote.vote = swipe_data.vote.value
+    await record_vote_change(
+        db, current_user.id, old_vote, existing_vote.vote,
+        measure.status, measure.level, measure.external_id,
+    )
     await db.commit()
     await db.refresh(existing_vote)
 
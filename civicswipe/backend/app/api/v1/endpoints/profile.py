@@ -65,7 +65,7 @@ async def get_profile(
             lon=float(profile.lon) if profile and profile.lon else None
         ),
         preferences=Preferences(
-            topics=preferences.topics if preferences else [],
+            topics=(preferences.topics or []) if preferences else [],
             notify_enabled=preferences.notify_enabled if preferences else True
         )
     )
@@ -103,8 +103,8 @@ async def update_address(
     )
     
     if coords:
-        profile.lat = str(coords[0])
-        profile.lon = str(coords[1])
+        profile.lat = float(coords[0])
+        profile.lon = float(coords[1])
         await division_resolver.resolve_divisions(
             db=db, user_id=current_user.id, lat=coords[0], lon=coords[1],
             state=address.state, city=address.city
@@ -212,6 +212,7 @@ async def update_profile(
             current_bd = current_bd.date()
         if profile_update.birthday != current_bd:
             current_user.birthday = profile_update.birthday
+            current_user.birth_year = profile_update.birthday.year
             changed_fields.append("birthday")
 
     if changed_fields:
@@ -254,7 +255,7 @@ async def update_preferences(
         user_prefs = UserPreferences(user_id=current_user.id)
         db.add(user_prefs)
     
-    user_prefs.topics = preferences.topics
+    user_prefs.topics = preferences.topics or None
     user_prefs.notify_enabled = preferences.notify_enabled
     await db.commit()
     
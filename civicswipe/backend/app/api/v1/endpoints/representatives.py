@@ -7,6 +7,7 @@ from typing import Optional, Tuple, List, Dict
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, case, literal_column
+from sqlalchemy.orm import undefer
 
 from app.core.database import get_db
 from app.core.cache import cache_get, cache_set, cache_delete, reps_key
@@ -103,7 +104,11 @@ async def refresh_representatives(
     Re-fetch representatives based on user's current address.
     Calls Congress.gov API and Census Geocoder.
     """
-    stmt = select(UserProfile).where(UserProfile.user_id == current_user.id)
+    stmt = (
+        select(UserProfile)
+        .options(undefer(UserProfile.address_line1_enc))
+        .where(UserProfile.user_id == current_user.id)
+    )
     result = await db.execute(stmt)
     profile = result.scalar_one_or_none()
 
@@ -3,7 +3,8 @@ Voting endpoints - record user votes (swipes)
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Header
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from uuid import UUID
 from typing import Optional
 
@@ -11,6 +12,7 @@ from app.core.database import get_db
 from app.core.cache import cache_delete, reps_key
 from app.schemas import SwipeRequest, SwipeResponse, UserVote as UserVoteSchema
 from app.models import Measure, UserVote
+from app.services.user_stats import record_vote_change
 from app.api.v1.endpoints.profile import get_current_user
 
 router = APIRouter()
@@ -28,58 +30,67 @@ async def swipe(
     Record user vote (swipe) on a measure
     Supports idempotency via Idempotency-Key header
     """
-    # Verify measure exists
-    measure = await db.get(Measure, measure_id)
-    if not measure:
+    # Verify measure exists (columns only; loading the entity would pull its
+    # eagerly-loaded relationships too). The stats update needs all three.
+    measure = (await db.execute(
+        select(Measure.status, Measure.level, Measure.external_id)
+        .where(Measure.id == measure_id)
+    )).one_or_none()
+    if measure is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Measure not found"
         )
-    
-    # Check if user already voted
-    stmt = select(UserVote).where(
-        and_(
-            UserVote.user_id == current_user.id,
-            UserVote.measure_id == measure_id
-        )
-    )
-    result = await db.execute(stmt)
-    existing_vote = result.scalar_one_or_none()
-    
-    if existing_vote:
-        # Update existing vote
-        existing_vote.vote = swipe_data.vote.value
-        await db.commit()
-        await db.refresh(existing_vote)
 
-        # Invalidate representatives cache so alignment recomputes
-        await cache_delete(reps_key(current_user.id))
+    # The stats delta needs the vote this swipe replaced, read atomically
+    # with the write: a double-tap must not count as two first votes.
+    # A first vote is an INSERT that wins the unique constraint (a concurrent
+    # duplicate waits on it, then does nothing); otherwise the existing row
+    # is locked and updated in one statement that returns its pre-image.
+    # Values are bound parameters, so every swipe reuses the same compiled SQL.
+    stmt = insert(UserVote).values(
+        user_id=current_user.id,
+        measure_id=measure_id,
+        vote=swipe_data.vote.value
+    )
+    stmt = stmt.on_conflict_do_nothing(
+        index_elements=[UserVote.user_id, UserVote.measure_id],
+    ).returning(UserVote.vote, UserVote.created_at)
+    saved_vote = (await db.execute(stmt)).one_or_none()
+    old_vote = None
 
-        return SwipeResponse(
-            saved=True,
-            user_vote=UserVoteSchema(
-                vote=existing_vote.vote,
-                created_at=existing_vote.created_at
+    if saved_vote is None:
+        prev = (
+            select(UserVote.id, UserVote.vote)
+            .where(
+                UserVote.user_id == current_user.id,
+                UserVote.measure_id == measure_id,
             )
+            .with_for_update()
+            .subquery("prev")
         )
-    else:
-        # Create new vote
-        new_vote = UserVote(
-            user_id=current_user.id,
-            measure_id=measure_id,
-            vote=swipe_data.vote.value
-        )
-        db.add(new_vote)
-        await db.commit()
-        await db.refresh(new_vote)
+        saved_vote = (await db.execute(
+            update(UserVote)
+            .where(UserVote.id == prev.c.id)
+            .values(vote=swipe_data.vote.value)
+            .returning(UserVote.vote, UserVote.created_at, prev.c.vote.label("old_vote"))
+            .execution_options(synchronize_session=False)
+        )).one()
+        old_vote = saved_vote.old_vote
 
-        # Invalidate representatives cache so alignment recomputes
-        await cache_delete(reps_key(current_user.id))
+    await record_vote_change(
+        db, current_user.id, old_vote, saved_vote.vote,
+        measure.status, measure.level, measure.external_id,
+    )
+    await db.commit()
 
-        return SwipeResponse(
-            saved=True,
-            user_vote=UserVoteSchema(
-                vote=new_vote.vote,
-                created_at=new_vote.created_at
-            )
+    # Invalidate representatives cache so alignment recomputes
+    await cache_delete(reps_key(current_user.id))
+
+    return SwipeResponse(
+        saved=True,
+        user_vote=UserVoteSchema(
+            vote=saved_vote.vote,
+            created_at=saved_vote.created_at
         )
+    )
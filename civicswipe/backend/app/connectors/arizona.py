@@ -21,6 +21,7 @@ from sqlalchemy import select
 
 from app.core.config import settings
 from app.models import Measure, MeasureSource, MeasureStatusEvent, VoteEvent, OfficialVote, Connector, IngestionRun
+from app.services.user_stats import record_status_changes
 
 logger = logging.getLogger(__name__)
 
@@ -168,7 +169,7 @@ class ArizonaConnector:
             "level": "state",
             "status": status,
             "introduced_at": introduced_at,
-            "topic_tags": [t for t in topics if t][:10],  # Limit to 10 tags
+            "topic_tags": [t for t in topics if t][:10] or None,  # Limit to 10 tags; NULL when untagged
             "canonical_key": f"us:az:{session}:{identifier}".lower(),
         }
 
@@ -272,6 +273,7 @@ class ArizonaConnector:
                 stats["bills_fetched"] += len(bills)
                 logger.info(f"Fetched {len(bills)} Arizona bills (page {page})")
 
+                status_changes = []
                 for bill in bills:
                     try:
                         # Map to measure schema
@@ -287,6 +289,11 @@ class ArizonaConnector:
                         existing = result.scalar_one_or_none()
 
                         if existing:
+                            if existing.status != measure_data["status"]:
+                                status_changes.append((
+                                    existing.id, existing.level, existing.external_id,
+                                    existing.status, measure_data["status"],
+                                ))
                             # Update existing measure
                             for key, value in measure_data.items():
                                 if value is not None:
@@ -315,6 +322,9 @@ class ArizonaConnector:
                         logger.error(f"Error processing bill {bill.get('identifier')}: {e}")
                         stats["errors"] += 1
 
+                # Shift dashboard stats of users who voted on bills that changed status
+                await record_status_changes(self.db, status_changes)
+
             # Update run status
             run.status = "succeeded"
             run.finished_at = datetime.utcnow()
@@ -12,18 +12,30 @@ This connector:
 - Supports full pagination for loading all bills in a congress
 """
 import asyncio
+import hashlib
+import os
+import sys
 import httpx
+import ijson
+import orjson
+from ciso8601 import parse_datetime
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from uuid import UUID, uuid4
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable, Set, Tuple
+from uuid import UUID
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, literal_column
 from sqlalchemy.dialects.postgresql import insert
 
 from app.core.config import settings
+from app.core.database import uuid7, utcnow
+from app.core.cache import cache_get, cache_set, federal_bills_key
 from app.models import Measure, MeasureSource, MeasureStatusEvent, VoteEvent, OfficialVote, Connector, IngestionRun
+from app.services.user_stats import current_statuses, record_status_changes
+from app.models.measure import SourceSystemCode, JurisdictionLevelCode, MeasureStatusCode, ContentTypeCode
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +45,127 @@ CONGRESS_API_BASE = "https://api.congress.gov/v3"
 # Current congress number
 CURRENT_CONGRESS = 119
 
+# Chamber by first letter of bill type (hr, hjres, ... -> house; s, sjres, ... -> senate)
+_CHAMBER = {"h": "house", "s": "senate"}
+
+# Public congress.gov page for a bill
+_SOURCE_URL_TMPL = "https://www.congress.gov/bill/{congress}th-congress/{chamber}-bill/{number}"
+
+# Rows per INSERT ... ON CONFLICT statement (8 params/row, well under PG's 32767 limit)
+UPSERT_BATCH_SIZE = 500
+
+# Batches smaller than this are mapped inline; pickling overhead outweighs the pool
+MAP_IN_POOL_MIN_BATCH = 200
+
+# Sentinel returned by _make_request when a page hasn't changed since the last run
+UNCHANGED = object()
+
+
+def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Congress.gov date/timestamp (trailing "Z" included), or None."""
+    if not value:
+        return None
+    try:
+        return parse_datetime(value)
+    except ValueError:
+        return None
+
+
+def _external_id(bill: Dict) -> str:
+    """Measure external_id for a bill-like dict, without mapping the rest of it."""
+    congress = bill.get("congress", CURRENT_CONGRESS)
+    return f"{congress}-{bill.get('type', '').lower()}-{bill.get('number', '')}"
+
+
+def _map_bill_to_measure(bill: Dict, details: Optional[Dict] = None) -> Dict:
+    """
+    Map Congress.gov bill data to CivicSwipe Measure schema.
+
+    Args:
+        bill: Bill data from API
+        details: Optional detailed bill data
+
+    Returns:
+        Dictionary ready for Measure creation
+    """
+    # Extract bill info. Values repeated across thousands of rows (bill types,
+    # policy areas) are interned so every row shares one string object; the
+    # "congress"/"federal"/status literals below are already interned constants.
+    bill_type = sys.intern(bill.get("type", "").lower())
+    bill_number = bill.get("number", "")
+    congress = bill.get("congress", CURRENT_CONGRESS)
+
+    # Build external ID
+    external_id = _external_id(bill)
+
+    # Map status
+    status = _map_status(bill.get("latestAction", {}).get("text", ""))
+
+    # Get dates
+    introduced_at = _parse_dt(bill.get("introducedDate"))
+
+    # Build title
+    title = bill.get("title", f"{bill_type.upper()} {bill_number}")
+
+    # Extract topics from policy area
+    topics = []
+    if details and "policyArea" in details:
+        topics.append(sys.intern(details["policyArea"].get("name", "")))
+    if details and "subjects" in details:
+        for subject in details.get("subjects", {}).get("legislativeSubjects", []):
+            topics.append(sys.intern(subject.get("name", "")))
+
+    return {
+        "source": "congress",
+        "external_id": external_id,
+        "title": title,
+        "level": "federal",
+        "status": status,
+        "introduced_at": introduced_at,
+        "topic_tags": [t for t in topics if t][:10] or None,  # Limit to 10 tags; NULL when untagged
+        "canonical_key": f"us:congress:{congress}:{bill_type}:{bill_number}",
+    }
+
+
+def _map_status(action_text: str) -> str:
+    """Map action text to status enum."""
+    action_lower = action_text.lower()
+
+    if "became public law" in action_lower or "signed by president" in action_lower:
+        return "passed"
+    elif "passed" in action_lower or "agreed to" in action_lower:
+        return "passed"
+    elif "failed" in action_lower or "rejected" in action_lower:
+        return "failed"
+    elif "referred to" in action_lower or "committee" in action_lower:
+        return "in_committee"
+    elif "introduced" in action_lower or "sponsor" in action_lower:
+        return "introduced"
+    elif "scheduled" in action_lower or "calendar" in action_lower:
+        return "scheduled"
+    elif "tabled" in action_lower:
+        return "tabled"
+    elif "withdrawn" in action_lower:
+        return "withdrawn"
+    else:
+        return "unknown"
+
+
+def _safe_map(bill: Dict) -> Tuple[Optional[Dict], Optional[Tuple[Any, str]]]:
+    """Map one bill, returning (row, None) or (None, (bill number, error))."""
+    try:
+        return _map_bill_to_measure(bill), None
+    except Exception as e:
+        return None, (bill.get("number"), str(e))
+
+
+def _map_batch(bills: List[Dict]) -> List[Tuple[Optional[Dict], Optional[Tuple[Any, str]]]]:
+    """
+    Map a list of bills to measure rows (module-level so it can run in a worker process).
+    Results line up with `bills`; bad rows carry their error instead of failing the batch.
+    """
+    return [_safe_map(bill) for bill in bills]
+
 
 class FederalConnector:
     """
@@ -45,11 +178,53 @@ class FederalConnector:
         if not self.api_key:
             raise ValueError("CONGRESS_API_KEY is not configured")
         self._client: Optional[httpx.AsyncClient] = None
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._cpu_pool_disabled = False
+        # Per-page validators persisted in Connector.config between runs
+        self._etags: Dict[str, str] = {}
+        self._body_hashes: Dict[str, str] = {}
+        # external_ids on each streamed page, so a 304 page still counts as seen
+        self._page_ids: Dict[str, List[str]] = {}
+
+    def _get_cpu_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily create the process pool used for JSON -> Measure mapping."""
+        if self._cpu_pool is None and not self._cpu_pool_disabled:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._cpu_pool
+
+    def _shutdown_cpu_pool(self):
+        """Shut down the mapping process pool."""
+        if self._cpu_pool:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
+
+    async def _map_bills(self, bills: List[Dict]) -> List[Tuple[Optional[Dict], Optional[Tuple[Any, str]]]]:
+        """
+        Map bills to measure rows, off the event loop for large batches so
+        HTTP streaming keeps flowing while workers crunch the mapping.
+        Falls back to mapping inline if worker processes can't be started
+        (e.g. inside a daemonic Celery prefork child).
+        """
+        pool = self._get_cpu_pool() if len(bills) >= MAP_IN_POOL_MIN_BATCH else None
+        if pool is None:
+            return _map_batch(bills)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, _map_batch, bills)
+        except (BrokenProcessPool, AssertionError, OSError) as e:
+            logger.warning(f"Process pool unavailable, mapping bills inline: {e}")
+            self._shutdown_cpu_pool()
+            self._cpu_pool_disabled = True
+            return _map_batch(bills)
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create a shared httpx client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            # httpx decodes gzip natively and brotli once the brotli package is installed
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                headers={"Accept-Encoding": "br, gzip"},
+            )
         return self._client
 
     async def _close_client(self):
@@ -58,110 +233,267 @@ class FederalConnector:
             await self._client.aclose()
             self._client = None
 
-    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make a request to the Congress.gov API."""
+    @staticmethod
+    def _validator_key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """Stable cache key for a page (endpoint + query, without the API key)."""
+        query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return f"{endpoint}?{query}"
+
+    def _forget_validator(self, endpoint: str, params: Optional[Dict] = None):
+        """Drop stored validators for a page so it is always re-fetched."""
+        key = self._validator_key(endpoint, params)
+        self._etags.pop(key, None)
+        self._body_hashes.pop(key, None)
+        self._page_ids.pop(key, None)
+
+    async def _make_request(
+        self, endpoint: str, params: Optional[Dict] = None, conditional: bool = False
+    ) -> Any:
+        """
+        Make a request to the Congress.gov API.
+
+        With conditional=True (list pages whose contents were stored on a
+        previous run), sends If-None-Match when an ETag was recorded for this
+        page. Returns UNCHANGED on 304, or when the server sends no ETag but
+        the body hashes to the same value as last time. A page's validator is
+        only recorded once its body has parsed. Other calls always return the
+        parsed body, since their callers need the data itself.
+        """
         url = f"{CONGRESS_API_BASE}{endpoint}"
-        params = params or {}
+        params = dict(params or {})
+        key = self._validator_key(endpoint, params)
         params["api_key"] = self.api_key
         params["format"] = "json"
 
+        headers = {}
+        if conditional and key in self._etags:
+            headers["If-None-Match"] = self._etags[key]
+
         client = await self._get_client()
-        response = await client.get(url, params=params)
+        response = await client.get(url, params=params, headers=headers)
+        if response.status_code == 304:
+            return UNCHANGED
         response.raise_for_status()
-        return response.json()
+        logger.debug(f"{endpoint} content-encoding: {response.headers.get('content-encoding', 'identity')}")
+
+        if not conditional:
+            return orjson.loads(response.content)
+
+        etag = response.headers.get("ETag")
+        body_hash = None
+        if not etag:
+            body_hash = hashlib.sha256(response.content).hexdigest()
+            if self._body_hashes.get(key) == body_hash:
+                return UNCHANGED
+
+        data = orjson.loads(response.content)
+        if etag:
+            self._etags[key] = etag
+        else:
+            self._body_hashes[key] = body_hash
+        return data
 
     async def get_recent_bills(
         self,
         congress: int = CURRENT_CONGRESS,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        force: bool = False,
+        stats: Optional[Dict] = None,
     ) -> List[Dict]:
         """
         Fetch recent bills from Congress.
+        Cached in Redis for 5 minutes so back-to-back runs skip the HTTP round trip.
 
         Args:
             congress: Congress number (e.g., 119 for 2025-2026)
             limit: Number of bills to fetch (max 250)
             offset: Pagination offset
+            force: Bypass the cache and always hit the API
+            stats: Run stats; a failed fetch is counted in stats["errors"]
 
         Returns:
             List of bill data dictionaries
         """
+        limit = min(limit, 250)
+        key = federal_bills_key(congress, limit, offset)
+        if not force:
+            cached = await cache_get(key)
+            if cached is not None:
+                return cached
+
         try:
             data = await self._make_request(
                 f"/bill/{congress}",
-                params={"limit": min(limit, 250), "offset": offset}
+                params={"limit": limit, "offset": offset},
+                conditional=True,
             )
-            return data.get("bills", [])
+            if data is UNCHANGED:
+                logger.info(f"Recent bills unchanged at offset {offset}, skipping")
+                return []
+            bills = data.get("bills", [])
+            await cache_set(key, bills, ttl=300)  # 5 min
+            return bills
         except Exception as e:
             logger.error(f"Error fetching bills: {e}")
+            if stats is not None:
+                stats["errors"] += 1
             return []
 
-    async def get_enacted_laws(
-        self,
-        congress: int = CURRENT_CONGRESS,
-        limit: int = 250,
-    ) -> List[Dict]:
+    async def _stream_items(
+        self, endpoint: str, params: Optional[Dict], item_path: str
+    ) -> AsyncIterator[Any]:
+        """
+        Stream one API page and yield the objects under `item_path` as they are parsed.
+
+        Peak memory is a single item rather than the whole page body. Yields the
+        UNCHANGED sentinel (and nothing else) when the server answers 304. The
+        page's ETag is only recorded once the whole body has been parsed and
+        every item yielded, so a page cut off mid-stream is re-fetched.
+        """
+        url = f"{CONGRESS_API_BASE}{endpoint}"
+        params = dict(params or {})
+        key = self._validator_key(endpoint, params)
+        params["api_key"] = self.api_key
+        params["format"] = "json"
+
+        headers = {}
+        if key in self._etags:
+            headers["If-None-Match"] = self._etags[key]
+
+        client = await self._get_client()
+        async with client.stream("GET", url, params=params, headers=headers) as response:
+            if response.status_code == 304:
+                yield UNCHANGED
+                return
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, item_path)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            parser.close()
+            for item in items:
+                yield item
+
+            if etag:
+                self._etags[key] = etag
+
+    async def _paginate(
+        self, endpoint: str, item_path: str, page_size: int, label: str,
+        stats: Optional[Dict] = None,
+        item_id: Optional[Callable[[Dict], Optional[str]]] = None,
+        unchanged_ids: Optional[Set[str]] = None,
+    ) -> AsyncIterator[Dict]:
         """
-        Fetch all enacted public laws for a congress via /law/{congress}/pub.
-        Paginates automatically.
+        Yield every item of a paginated list endpoint, one streamed page at a time.
+        A failed page stops pagination and is counted in stats["errors"], so the
+        run doesn't persist validators for a partly ingested list.
+
+        With item_id, each page's item ids are stored alongside its ETag, and
+        a page that comes back unchanged adds its stored ids to unchanged_ids
+        instead of yielding anything.
         """
-        all_laws = []
         offset = 0
-        page_size = min(limit, 250)
+        total = 0
         while True:
+            params = {"limit": page_size, "offset": offset}
+            key = self._validator_key(endpoint, params)
+            if item_id and key in self._etags and key not in self._page_ids:
+                # Validator saved before page ids were tracked: re-fetch once
+                self._forget_validator(endpoint, params)
+            count = 0
+            ids: List[str] = []
             try:
-                data = await self._make_request(
-                    f"/law/{congress}/pub",
-                    params={"limit": page_size, "offset": offset}
-                )
-                # API returns laws under "bills" key
-                laws = data.get("bills", data.get("laws", []))
-                if not laws:
-                    break
-                all_laws.extend(laws)
-                logger.info(f"Fetched {len(laws)} laws at offset {offset} (total: {len(all_laws)})")
-                offset += len(laws)
-                if len(laws) < page_size:
-                    break
-                await asyncio.sleep(0.3)
+                async for item in self._stream_items(endpoint, params, item_path):
+                    if item is UNCHANGED:
+                        break
+                    count += 1
+                    if item_id:
+                        ext_id = item_id(item)
+                        if ext_id:
+                            ids.append(ext_id)
+                    yield item
+                else:
+                    if count == 0:
+                        # Never cache the end-of-list page, or pagination would stop finding it
+                        self._forget_validator(endpoint, params)
+                        break
+                    if item_id:
+                        self._page_ids[key] = ids
+                    total += count
+                    logger.info(f"Fetched {count} {label} at offset {offset} (total: {total})")
+                    offset += count
+                    if count < page_size:
+                        break
+                    await asyncio.sleep(0.3)
+                    continue
             except Exception as e:
-                logger.error(f"Error fetching laws at offset {offset}: {e}")
+                logger.error(f"Error fetching {label} at offset {offset}: {e}")
+                if stats is not None:
+                    stats["errors"] += 1
                 break
-        return all_laws
 
-    async def get_house_roll_call_votes(
+            logger.info(f"{label.capitalize()} unchanged at offset {offset}, skipping page")
+            if unchanged_ids is not None:
+                unchanged_ids.update(self._page_ids.get(key, ()))
+            offset += page_size
+            await asyncio.sleep(0.3)
+
+    def get_enacted_laws(
         self,
         congress: int = CURRENT_CONGRESS,
         limit: int = 250,
-    ) -> List[Dict]:
+        stats: Optional[Dict] = None,
+        unchanged_ids: Optional[Set[str]] = None,
+    ) -> AsyncIterator[Dict]:
         """
-        Fetch all House roll call votes for a congress via /house-vote/{congress}.
-        Returns vote records that include legislationNumber and legislationUrl.
-        Paginates automatically.
+        Stream all enacted public laws for a congress via /law/{congress}/pub.
+        Paginates automatically; fetch errors are counted in stats["errors"].
+        Laws on pages that haven't changed since the last run aren't yielded;
+        their external_ids are added to unchanged_ids instead.
         """
-        all_votes = []
-        offset = 0
-        page_size = min(limit, 250)
-        while True:
+        def law_id(law: Dict) -> Optional[str]:
             try:
-                data = await self._make_request(
-                    f"/house-vote/{congress}",
-                    params={"limit": page_size, "offset": offset}
-                )
-                votes = data.get("houseRollCallVotes", data.get("houseVotes", data.get("votes", [])))
-                if not votes:
-                    break
-                all_votes.extend(votes)
-                logger.info(f"Fetched {len(votes)} house votes at offset {offset} (total: {len(all_votes)})")
-                offset += len(votes)
-                if len(votes) < page_size:
-                    break
-                await asyncio.sleep(0.3)
-            except Exception as e:
-                logger.error(f"Error fetching house votes at offset {offset}: {e}")
-                break
-        return all_votes
+                return _external_id(self._map_law_to_bill(law, congress))
+            except Exception:
+                return None
+
+        # API returns laws under "bills" key
+        return self._paginate(
+            f"/law/{congress}/pub", "bills.item", min(limit, 250), "laws", stats,
+            item_id=law_id, unchanged_ids=unchanged_ids,
+        )
+
+    def get_house_roll_call_votes(
+        self,
+        congress: int = CURRENT_CONGRESS,
+        limit: int = 250,
+        stats: Optional[Dict] = None,
+        unchanged_ids: Optional[Set[str]] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream all House roll call votes for a congress via /house-vote/{congress}.
+        Yields vote records that include legislationNumber and legislationUrl.
+        Paginates automatically; fetch errors are counted in stats["errors"].
+        Bills voted on in pages that haven't changed since the last run are
+        added to unchanged_ids instead of being yielded.
+        """
+        def vote_bill_id(vote: Dict) -> Optional[str]:
+            try:
+                bill = self._extract_bill_from_house_vote(vote, congress)
+                return _external_id(bill) if bill else None
+            except Exception:
+                return None
+
+        return self._paginate(
+            f"/house-vote/{congress}", "houseRollCallVotes.item", min(limit, 250), "house votes", stats,
+            item_id=vote_bill_id, unchanged_ids=unchanged_ids,
+        )
 
     async def get_bill_details(self, congress: int, bill_type: str, bill_number: int) -> Optional[Dict]:
         """
@@ -194,88 +526,6 @@ class FederalConnector:
             logger.error(f"Error fetching bill actions: {e}")
             return []
 
-    def _map_bill_to_measure(self, bill: Dict, details: Optional[Dict] = None) -> Dict:
-        """
-        Map Congress.gov bill data to CivicSwipe Measure schema.
-
-        Args:
-            bill: Bill data from API
-            details: Optional detailed bill data
-
-        Returns:
-            Dictionary ready for Measure creation
-        """
-        # Extract bill info
-        bill_type = bill.get("type", "").lower()
-        bill_number = bill.get("number", "")
-        congress = bill.get("congress", CURRENT_CONGRESS)
-
-        # Build external ID
-        external_id = f"{congress}-{bill_type}-{bill_number}"
-
-        # Map status
-        status = self._map_status(bill.get("latestAction", {}).get("text", ""))
-
-        # Get dates
-        introduced_at = None
-        if "introducedDate" in bill:
-            try:
-                introduced_at = datetime.fromisoformat(bill["introducedDate"])
-            except (ValueError, TypeError):
-                pass
-
-        updated_at = None
-        if "updateDate" in bill:
-            try:
-                updated_at = datetime.fromisoformat(bill["updateDate"].replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                pass
-
-        # Build title
-        title = bill.get("title", f"{bill_type.upper()} {bill_number}")
-
-        # Extract topics from policy area
-        topics = []
-        if details and "policyArea" in details:
-            topics.append(details["policyArea"].get("name", ""))
-        if details and "subjects" in details:
-            for subject in details.get("subjects", {}).get("legislativeSubjects", []):
-                topics.append(subject.get("name", ""))
-
-        return {
-            "source": "congress",
-            "external_id": external_id,
-            "title": title,
-            "level": "federal",
-            "status": status,
-            "introduced_at": introduced_at,
-            "topic_tags": [t for t in topics if t][:10],  # Limit to 10 tags
-            "canonical_key": f"us:congress:{congress}:{bill_type}:{bill_number}",
-        }
-
-    def _map_status(self, action_text: str) -> str:
-        """Map action text to status enum."""
-        action_lower = action_text.lower()
-
-        if "became public law" in action_lower or "signed by president" in action_lower:
-            return "passed"
-        elif "passed" in action_lower or "agreed to" in action_lower:
-            return "passed"
-        elif "failed" in action_lower or "rejected" in action_lower:
-            return "failed"
-        elif "referred to" in action_lower or "committee" in action_lower:
-            return "in_committee"
-        elif "introduced" in action_lower or "sponsor" in action_lower:
-            return "introduced"
-        elif "scheduled" in action_lower or "calendar" in action_lower:
-            return "scheduled"
-        elif "tabled" in action_lower:
-            return "tabled"
-        elif "withdrawn" in action_lower:
-            return "withdrawn"
-        else:
-            return "unknown"
-
     async def _get_or_create_connector(self) -> Connector:
         """Get or create the federal connector record."""
         result = await self.db.execute(
@@ -284,7 +534,9 @@ class FederalConnector:
         connector = result.scalar_one_or_none()
 
         if not connector:
+            # Client-side id so the IngestionRun can reference it without a flush
             connector = Connector(
+                id=uuid7(),
                 name="congress",
                 source="congress",
                 enabled=True,
@@ -294,10 +546,23 @@ class FederalConnector:
                 }
             )
             self.db.add(connector)
-            await self.db.flush()
+
+        config = connector.config or {}
+        self._etags = dict(config.get("etags", {}))
+        self._body_hashes = dict(config.get("body_hashes", {}))
+        self._page_ids = dict(config.get("page_ids", {}))
 
         return connector
 
+    def _save_validators(self, connector: Connector):
+        """Persist page validators back to the connector config (reassigned so JSONB is flagged dirty)."""
+        connector.config = {
+            **(connector.config or {}),
+            "etags": self._etags,
+            "body_hashes": self._body_hashes,
+            "page_ids": self._page_ids,
+        }
+
     def _map_law_to_bill(self, law: Dict, congress: int) -> Dict:
         """
         Convert a /law/{congress}/pub response item into a bill-like dict.
@@ -361,43 +626,179 @@ class FederalConnector:
             "updateDate": vote.get("updateDate"),
         }
 
-    async def _upsert_bill(self, bill: Dict, congress: int, stats: Dict):
-        """Upsert a single bill into the measures table."""
-        measure_data = self._map_bill_to_measure(bill)
+    async def _build_rows(
+        self, bills: List[Dict], congress: int, stats: Dict
+    ) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+        """Map bills to measure rows keyed by external_id, plus each row's source URL."""
+        mapped = await self._map_bills(bills)
+        errors = [err for _, err in mapped if err]
+        if errors:
+            stats["errors"] += len(errors)
+            logger.warning(f"Skipped {len(errors)} unmappable bills: {errors[:5]}")
+
+        rows: Dict[str, Dict] = {}
+        source_urls: Dict[str, str] = {}
+        for bill, (measure_data, _) in zip(bills, mapped):
+            if measure_data is None:
+                continue
+            external_id = measure_data["external_id"]
+            rows[external_id] = measure_data
 
-        result = await self.db.execute(
-            select(Measure).where(
-                Measure.source == measure_data["source"],
-                Measure.external_id == measure_data["external_id"]
+            bill_type = bill.get("type", "").lower()
+            source_urls[external_id] = _SOURCE_URL_TMPL.format(
+                congress=congress,
+                chamber=_CHAMBER.get(bill_type[:1], "house"),
+                number=bill.get("number", ""),
             )
+        return rows, source_urls
+
+    async def _is_cold_start(self) -> bool:
+        """True when no congress measures have been loaded yet."""
+        result = await self.db.execute(
+            select(Measure.id).where(Measure.source == "congress").limit(1)
         )
-        existing = result.scalar_one_or_none()
+        return result.scalar_one_or_none() is None
 
-        if existing:
-            for key, value in measure_data.items():
-                if value is not None:
-                    setattr(existing, key, value)
-            stats["updated_measures"] += 1
-        else:
-            measure = Measure(**measure_data)
-            self.db.add(measure)
-            await self.db.flush()
+    async def _copy_bills(self, bills: List[Dict], congress: int, stats: Dict):
+        """
+        Bulk-load a batch of bills with PostgreSQL COPY (cold-start seeding only).
 
-            bill_type = bill.get("type", "").lower()
-            bill_number = bill.get("number", "")
-            source_url = f"https://www.congress.gov/bill/{congress}th-congress/{self._get_chamber(bill_type)}-bill/{bill_number}"
-
-            source = MeasureSource(
-                measure_id=measure.id,
-                label="Congress.gov",
-                url=source_url,
-                ctype="html",
-                is_primary=True
+        COPY has no ON CONFLICT, so this is only safe when the measures table has
+        no congress rows yet and the caller has already deduplicated the batch.
+        Runs on the session's own asyncpg connection, inside a savepoint, so it
+        shares the ingestion transaction.
+        """
+        if not bills:
+            return
+
+        rows: Dict[str, Dict] = {}
+        try:
+            rows, source_urls = await self._build_rows(bills, congress, stats)
+            if not rows:
+                return
+
+            # COPY bypasses the ORM column types, so enum labels are mapped
+            # to their SMALLINT codes here
+            measure_records = []
+            source_records = []
+            html = ContentTypeCode.html.value
+            for external_id, m in rows.items():
+                measure_id = uuid7()
+                measure_records.append((
+                    measure_id, SourceSystemCode[m["source"]].value, external_id, m["title"],
+                    JurisdictionLevelCode[m["level"]].value, MeasureStatusCode[m["status"]].value,
+                    m["introduced_at"], m["topic_tags"], m["canonical_key"],
+                ))
+                source_records.append((
+                    uuid7(), measure_id, "Congress.gov", source_urls[external_id], html, True,
+                ))
+
+            async with self.db.begin_nested():
+                conn = await self.db.connection()
+                raw = (await conn.get_raw_connection()).driver_connection
+                await raw.copy_records_to_table(
+                    Measure.__tablename__,
+                    records=measure_records,
+                    columns=[
+                        "id", "source", "external_id", "title", "level",
+                        "status", "introduced_at", "topic_tags", "canonical_key",
+                    ],
+                )
+                await raw.copy_records_to_table(
+                    MeasureSource.__tablename__,
+                    records=source_records,
+                    columns=["id", "measure_id", "label", "url", "ctype", "is_primary"],
+                )
+        except Exception as e:
+            failed = len(rows) or len(bills)
+            logger.error(f"Error copying batch of {failed} bills: {e}")
+            stats["errors"] += failed
+            return
+
+        stats["new_measures"] += len(rows)
+
+    async def _upsert_bills(self, bills: List[Dict], congress: int, stats: Dict):
+        """
+        Upsert a batch of bills into the measures table with one
+        INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement.
+
+        New vs. updated counts come from the returned `xmax = 0` flag instead of
+        per-row bookkeeping. The batch runs in a savepoint so a bad row fails
+        only its own batch, not the whole ingestion run.
+        """
+        if not bills:
+            return
+
+        rows: Dict[str, Dict] = {}
+        try:
+            rows, source_urls = await self._build_rows(bills, congress, stats)
+            if not rows:
+                return
+
+            # Statuses before the upsert, to shift voters' dashboard stats
+            old_statuses = await current_statuses(self.db, "congress", rows.keys())
+
+            # One client-side timestamp for the whole batch
+            now = utcnow()
+            measures = Measure.__table__
+            stmt = insert(Measure).values([{**row, "updated_at": now} for row in rows.values()])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Measure.source, Measure.external_id],
+                set_={
+                    "title": stmt.excluded.title,
+                    "level": stmt.excluded.level,
+                    "status": stmt.excluded.status,
+                    "introduced_at": func.coalesce(stmt.excluded.introduced_at, measures.c.introduced_at),
+                    "topic_tags": stmt.excluded.topic_tags,
+                    "canonical_key": stmt.excluded.canonical_key,
+                    "updated_at": now,
+                },
+            ).returning(
+                Measure.id, Measure.external_id, Measure.level, Measure.status,
+                literal_column("(xmax = 0)").label("is_new"),
             )
-            self.db.add(source)
-            stats["new_measures"] += 1
 
-    async def run(self, congress: int = CURRENT_CONGRESS, limit: int = 50, fetch_all: bool = False) -> Dict[str, Any]:
+            async with self.db.begin_nested():
+                result = await self.db.execute(stmt)
+                returned = result.all()
+                new_rows = [r for r in returned if r.is_new]
+                await record_status_changes(self.db, [
+                    (r.id, r.level, r.external_id, old_statuses[r.external_id], r.status)
+                    for r in returned
+                    if not r.is_new and old_statuses.get(r.external_id, r.status) != r.status
+                ])
+                if new_rows:
+                    # Ids come straight from RETURNING, so sources go in one more
+                    # statement with no intermediate flush
+                    await self.db.execute(
+                        insert(MeasureSource).values([
+                            {
+                                "measure_id": r.id,
+                                "label": "Congress.gov",
+                                "url": source_urls[r.external_id],
+                                "ctype": "html",
+                                "is_primary": True,
+                            }
+                            for r in new_rows
+                        ])
+                    )
+        except Exception as e:
+            failed = len(rows) or len(bills)
+            logger.error(f"Error upserting batch of {failed} bills: {e}")
+            stats["errors"] += failed
+            return
+
+        stats["new_measures"] += len(new_rows)
+        stats["updated_measures"] += len(returned) - len(new_rows)
+
+    async def run(
+        self,
+        congress: int = CURRENT_CONGRESS,
+        limit: int = 50,
+        fetch_all: bool = False,
+        force: bool = False,
+        bulk_copy: bool = False,
+    ) -> Dict[str, Any]:
         """
         Run the federal connector to fetch and store bills.
 
@@ -406,6 +807,9 @@ class FederalConnector:
             limit: Maximum number of bills to process per page
             fetch_all: If True, fetch enacted laws + bills with House votes
                        (much faster than paginating all bills)
+            force: Bypass the recent-bills response cache
+            bulk_copy: With fetch_all on an empty database, load rows with
+                       COPY instead of INSERT ... ON CONFLICT
 
         Returns:
             Statistics about the ingestion run
@@ -429,71 +833,86 @@ class FederalConnector:
             stats={}
         )
         self.db.add(run)
-        await self.db.flush()
 
         try:
             if fetch_all:
                 # Strategy: fetch enacted laws + bills with House floor votes
                 # This gives us all "historical" bills without fetching thousands of in-committee bills
                 seen_external_ids = set()
-
-                # 1. Fetch enacted public laws
-                laws = await self.get_enacted_laws(congress=congress)
-                stats["laws_fetched"] = len(laws)
-                logger.info(f"Fetched {len(laws)} enacted laws")
-
-                for law in laws:
+                pending: List[Dict] = []
+
+                write_batch = self._upsert_bills
+                if bulk_copy and await self._is_cold_start():
+                    logger.info("No congress measures yet, seeding with COPY")
+                    write_batch = self._copy_bills
+
+                async def queue(bill: Dict):
+                    pending.append(bill)
+                    stats["bills_fetched"] += 1
+                    if len(pending) >= UPSERT_BATCH_SIZE:
+                        await write_batch(pending, congress, stats)
+                        pending.clear()
+
+                # 1. Fetch enacted public laws (upserted as each page streams in).
+                #    Laws on unchanged pages are still marked seen, so the House
+                #    vote pass below can't overwrite them with a roll-call row.
+                async for law in self.get_enacted_laws(
+                    congress=congress, stats=stats, unchanged_ids=seen_external_ids
+                ):
+                    stats["laws_fetched"] += 1
                     try:
                         bill = self._map_law_to_bill(law, congress)
-                        ext_id = f"{congress}-{bill['type']}-{bill['number']}"
-                        seen_external_ids.add(ext_id)
-                        await self._upsert_bill(bill, congress, stats)
-                        stats["bills_fetched"] += 1
+                        ext_id = _external_id(bill)
                     except Exception as e:
                         logger.error(f"Error processing law: {e}")
                         stats["errors"] += 1
+                        continue
+                    seen_external_ids.add(ext_id)
+                    await queue(bill)
+                logger.info(f"Fetched {stats['laws_fetched']} enacted laws")
 
                 # 2. Fetch bills that had House floor votes
-                house_votes = await self.get_house_roll_call_votes(congress=congress)
-                for hv in house_votes:
+                async for hv in self.get_house_roll_call_votes(
+                    congress=congress, stats=stats, unchanged_ids=seen_external_ids
+                ):
                     try:
                         bill = self._extract_bill_from_house_vote(hv, congress)
                         if not bill:
                             continue
-                        ext_id = f"{congress}-{bill['type']}-{bill['number']}"
-                        if ext_id in seen_external_ids:
-                            continue  # Already processed via laws
-                        seen_external_ids.add(ext_id)
-                        await self._upsert_bill(bill, congress, stats)
-                        stats["bills_fetched"] += 1
-                        stats["voted_bills_fetched"] += 1
+                        ext_id = _external_id(bill)
                     except Exception as e:
                         logger.error(f"Error processing house vote bill: {e}")
                         stats["errors"] += 1
+                        continue
+                    if ext_id in seen_external_ids:
+                        continue  # Already processed via laws
+                    seen_external_ids.add(ext_id)
+                    stats["voted_bills_fetched"] += 1
+                    await queue(bill)
 
                 # 3. Also fetch the most recent bills (upcoming)
-                recent_bills = await self.get_recent_bills(congress=congress, limit=limit)
+                recent_bills = await self.get_recent_bills(
+                    congress=congress, limit=limit, force=force, stats=stats
+                )
                 for bill in recent_bills:
-                    try:
-                        measure_data = self._map_bill_to_measure(bill)
-                        ext_id = measure_data["external_id"]
-                        if ext_id in seen_external_ids:
-                            continue
-                        seen_external_ids.add(ext_id)
-                        await self._upsert_bill(bill, congress, stats)
-                        stats["bills_fetched"] += 1
-                    except Exception as e:
-                        logger.error(f"Error processing recent bill: {e}")
-                        stats["errors"] += 1
+                    ext_id = _external_id(bill)
+                    if ext_id in seen_external_ids:
+                        continue
+                    seen_external_ids.add(ext_id)
+                    await queue(bill)
+
+                await write_batch(pending, congress, stats)
             else:
-                bills = await self.get_recent_bills(congress=congress, limit=limit)
+                bills = await self.get_recent_bills(
+                    congress=congress, limit=limit, force=force, stats=stats
+                )
                 stats["bills_fetched"] = len(bills)
-                for bill in bills:
-                    try:
-                        await self._upsert_bill(bill, congress, stats)
-                    except Exception as e:
-                        logger.error(f"Error processing bill {bill.get('number')}: {e}")
-                        stats["errors"] += 1
+                await self._upsert_bills(bills, congress, stats)
+
+            # Only remember page validators if every item was stored, so a
+            # failed bill is retried on the next run instead of being skipped
+            if stats["errors"] == 0:
+                self._save_validators(connector)
 
             # Update run status
             run.status = "succeeded"
@@ -513,19 +932,19 @@ class FederalConnector:
             raise
         finally:
             await self._close_client()
+            self._shutdown_cpu_pool()
 
         return stats
 
-    def _get_chamber(self, bill_type: str) -> str:
-        """Get chamber name from bill type."""
-        if bill_type.startswith("h"):
-            return "house"
-        elif bill_type.startswith("s"):
-            return "senate"
-        return "house"
-
 
-async def run_federal_connector(db: AsyncSession, congress: int = CURRENT_CONGRESS, limit: int = 50, fetch_all: bool = False) -> Dict[str, Any]:
+async def run_federal_connector(
+    db: AsyncSession,
+    congress: int = CURRENT_CONGRESS,
+    limit: int = 50,
+    fetch_all: bool = False,
+    force: bool = False,
+    bulk_copy: bool = False,
+) -> Dict[str, Any]:
     """
     Convenience function to run the federal connector.
 
@@ -534,4 +953,6 @@ async def run_federal_connector(db: AsyncSession, congress: int = CURRENT_CONGRE
         stats = await run_federal_connector(db, congress=119, limit=100)
     """
     connector = FederalConnector(db)
-    return await connector.run(congress=congress, limit=limit, fetch_all=fetch_all)
+    return await connector.run(
+        congress=congress, limit=limit, fetch_all=fetch_all, force=force, bulk_copy=bulk_copy
+    )
@@ -10,19 +10,26 @@ This connector:
 - Extracts voting outcomes when available
 - Maps data to the CivicSwipe schema
 """
+import asyncio
 import httpx
+import orjson
+from ciso8601 import parse_datetime
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from uuid import UUID, uuid4
 import logging
 import re
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, literal_column
+from sqlalchemy.dialects.postgresql import insert
 
 from app.core.config import settings
+from app.core.cache import cache_get, cache_set, connector_key, redis_memoize
+from app.core.database import utcnow
 from app.models import Measure, MeasureSource, MeasureStatusEvent, Connector, IngestionRun
+from app.services.user_stats import current_statuses, record_status_changes
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +39,64 @@ LEGISTAR_BASE_URL = "https://phoenix.legistar.com"
 # Legistar Web API (if available) or fallback to scraping
 LEGISTAR_API_BASE = "https://webapi.legistar.com/v1/phoenix"
 
+# Request concurrency is tuned AIMD-style: start small, add a fraction of a
+# permit after each fast clean response, halve on 429/5xx
+INITIAL_CONCURRENCY = 4
+MAX_CONCURRENCY = 16
+TARGET_LATENCY_SECONDS = 2.0
+
+# Retry policy for throttled/transient failures
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 1.0
+
+# Pause before the next request when the server says we're nearly out of quota
+RATE_LIMIT_LOW_WATER = 2
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Legistar detail links carry the record id as ?ID=<n>
+_ID_RE = re.compile(r'ID=(\d+)')
+
+# Action text -> status, checked in order (first match wins)
+_STATUS_PATTERNS = [
+    (re.compile(r'approved|passed|adopted', re.I), "passed"),
+    (re.compile(r'denied|rejected|failed', re.I), "failed"),
+    (re.compile(r'tabled|continued|postponed', re.I), "tabled"),
+    (re.compile(r'withdrawn', re.I), "withdrawn"),
+]
+
+
+class _AimdLimiter:
+    """Concurrency limit that grows additively and shrinks multiplicatively."""
+
+    def __init__(self):
+        self.limit = float(INITIAL_CONCURRENCY)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def release(self, latency: float, congested: bool):
+        async with self._cond:
+            self._in_flight -= 1
+            if congested:
+                self.limit = max(1.0, self.limit * 0.5)
+            elif latency < TARGET_LATENCY_SECONDS:
+                self.limit = min(float(MAX_CONCURRENCY), self.limit + 0.5)
+            self._cond.notify_all()
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, if it is given in seconds."""
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
 
 class PhoenixLegistarConnector:
     """
@@ -41,14 +106,77 @@ class PhoenixLegistarConnector:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.base_url = settings.PHOENIX_LEGISTAR_BASE_URL or LEGISTAR_BASE_URL
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limiter = _AimdLimiter()
+        self._connector: Optional[Connector] = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create a shared httpx client."""
+        if self._client is None:
+            # Everything goes to one or two Legistar hosts, so HTTP/2 lets the
+            # concurrent event-item fetches multiplex over a single connection
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                headers={"User-Agent": "CivicSwipe/1.0"},
+            )
+        return self._client
 
-    async def _fetch_page(self, url: str) -> Optional[str]:
-        """Fetch HTML content from a URL."""
+    async def _close_client(self):
+        """Close the httpx client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get(self, url: str, params: Optional[Dict] = None) -> httpx.Response:
+        """
+        GET through the concurrency limiter, backing off and retrying on
+        throttling (429), server errors and transport errors.
+        """
+        client = await self._get_client()
+        for attempt in range(MAX_RETRIES + 1):
+            last_try = attempt == MAX_RETRIES
+            backoff = BACKOFF_BASE_SECONDS * 2 ** attempt
+
+            await self._limiter.acquire()
+            started = asyncio.get_running_loop().time()
+            congested = True
+            try:
+                response = await client.get(url, params=params)
+                congested = response.status_code in RETRYABLE_STATUS
+            except httpx.TransportError as e:
+                if last_try:
+                    raise
+                logger.warning(f"Transport error for {url} ({e}), retrying in {backoff:.0f}s")
+                await asyncio.sleep(backoff)
+                continue
+            finally:
+                await self._limiter.release(
+                    asyncio.get_running_loop().time() - started, congested
+                )
+
+            if congested and not last_try:
+                wait = _retry_after(response) or backoff
+                logger.warning(f"HTTP {response.status_code} for {url}, retrying in {wait:.0f}s")
+                await asyncio.sleep(wait)
+                continue
+
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            if remaining is not None and remaining.isdigit() and int(remaining) < RATE_LIMIT_LOW_WATER:
+                await asyncio.sleep(_retry_after(response) or BACKOFF_BASE_SECONDS)
+
+            return response
+
+    async def _fetch_page(self, url: str) -> Optional[bytes]:
+        """
+        Fetch raw HTML bytes from a URL. selectolax sniffs the encoding itself,
+        so skipping response.text avoids holding a decoded copy of the page.
+        """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.text
+            response = await self._get(url)
+            response.raise_for_status()
+            return response.content
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
@@ -57,14 +185,15 @@ class PhoenixLegistarConnector:
         """Fetch data from Legistar Web API."""
         try:
             url = f"{LEGISTAR_API_BASE}{endpoint}"
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
+            response = await self._get(url, params=params)
+            response.raise_for_status()
+            # Decode straight from bytes; skips httpx's str decode + stdlib json
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Error fetching API {endpoint}: {e}")
             return None
 
+    @redis_memoize("legistar:events", ttl=900)
     async def get_upcoming_events(self, days: int = 30) -> List[Dict]:
         """
         Fetch upcoming city council events/meetings.
@@ -98,54 +227,63 @@ class PhoenixLegistarConnector:
 
     async def _scrape_calendar(self) -> List[Dict]:
         """Scrape the Legistar calendar page for events."""
-        events = []
-
         try:
             html = await self._fetch_page(f"{self.base_url}/Calendar.aspx")
             if not html:
-                return events
+                return []
 
-            soup = BeautifulSoup(html, 'html.parser')
+            # Parsing is pure CPU; keep it off the event loop so other
+            # in-flight fetches keep making progress
+            return await asyncio.to_thread(self._parse_calendar_html, html)
+        except Exception as e:
+            logger.error(f"Error scraping calendar: {e}")
+            return []
 
-            # Find event rows in the calendar table
-            event_rows = soup.find_all('tr', class_='rgRow') + soup.find_all('tr', class_='rgAltRow')
+    def _parse_calendar_html(self, html: bytes) -> List[Dict]:
+        """Extract events from calendar page HTML."""
+        events = []
+        tree = HTMLParser(html)
 
-            for row in event_rows:
-                try:
-                    cells = row.find_all('td')
-                    if len(cells) >= 3:
-                        # Extract event info
-                        date_cell = cells[0].get_text(strip=True)
-                        name_cell = cells[1].get_text(strip=True)
-                        location_cell = cells[2].get_text(strip=True) if len(cells) > 2 else ""
-
-                        # Get link to event details
-                        link = cells[1].find('a')
-                        event_url = None
-                        event_id = None
-                        if link and link.get('href'):
-                            event_url = f"{self.base_url}/{link.get('href')}"
-                            # Extract event ID from URL
-                            match = re.search(r'ID=(\d+)', link.get('href'))
-                            if match:
-                                event_id = match.group(1)
-
-                        events.append({
-                            'EventId': event_id,
-                            'EventDate': date_cell,
-                            'EventBodyName': name_cell,
-                            'EventLocation': location_cell,
-                            'EventUrl': event_url,
-                        })
-                except Exception as e:
-                    logger.warning(f"Error parsing event row: {e}")
-                    continue
+        # Find event rows in the calendar table
+        event_rows = tree.css('tr.rgRow, tr.rgAltRow')
 
-        except Exception as e:
-            logger.error(f"Error scraping calendar: {e}")
+        for row in event_rows:
+            try:
+                # Select just the cells we read instead of listing every <td>
+                name_td = row.css_first('td:nth-child(2)')
+                location_td = row.css_first('td:nth-child(3)')
+                if location_td is not None:
+                    # Extract event info
+                    date_cell = row.css_first('td:nth-child(1)').text(strip=True)
+                    name_cell = name_td.text(strip=True)
+                    location_cell = location_td.text(strip=True)
+
+                    # Get link to event details
+                    link = row.css_first('td:nth-child(2) a')
+                    href = link.attributes.get('href') if link else None
+                    event_url = None
+                    event_id = None
+                    if href:
+                        event_url = f"{self.base_url}/{href}"
+                        # Extract event ID from URL
+                        match = _ID_RE.search(href)
+                        if match:
+                            event_id = match.group(1)
+
+                    events.append({
+                        'EventId': event_id,
+                        'EventDate': date_cell,
+                        'EventBodyName': name_cell,
+                        'EventLocation': location_cell,
+                        'EventUrl': event_url,
+                    })
+            except Exception as e:
+                logger.warning(f"Error parsing event row: {e}")
+                continue
 
         return events
 
+    @redis_memoize("legistar:items", ttl=3600)
     async def get_event_items(self, event_id: str) -> List[Dict]:
         """
         Fetch agenda items for a specific event/meeting.
@@ -169,56 +307,60 @@ class PhoenixLegistarConnector:
 
     async def _scrape_event_items(self, event_id: str) -> List[Dict]:
         """Scrape agenda items from event detail page."""
-        items = []
-
         try:
             url = f"{self.base_url}/MeetingDetail.aspx?ID={event_id}"
             html = await self._fetch_page(url)
             if not html:
-                return items
+                return []
 
-            soup = BeautifulSoup(html, 'html.parser')
+            return await asyncio.to_thread(self._parse_event_items_html, event_id, html)
+        except Exception as e:
+            logger.error(f"Error scraping event items: {e}")
+            return []
 
-            # Find agenda items table
-            item_rows = soup.find_all('tr', class_='rgRow') + soup.find_all('tr', class_='rgAltRow')
+    def _parse_event_items_html(self, event_id: str, html: bytes) -> List[Dict]:
+        """Extract agenda items from meeting detail page HTML."""
+        items = []
+        tree = HTMLParser(html)
 
-            for row in item_rows:
-                try:
-                    cells = row.find_all('td')
-                    if len(cells) >= 2:
-                        # Extract item info
-                        number = cells[0].get_text(strip=True)
-                        title = cells[1].get_text(strip=True)
-
-                        # Get action/result if available
-                        action = ""
-                        if len(cells) > 2:
-                            action = cells[-1].get_text(strip=True)
-
-                        # Get link to matter details
-                        link = cells[1].find('a')
-                        matter_url = None
-                        matter_id = None
-                        if link and link.get('href'):
-                            matter_url = f"{self.base_url}/{link.get('href')}"
-                            match = re.search(r'ID=(\d+)', link.get('href'))
-                            if match:
-                                matter_id = match.group(1)
-
-                        items.append({
-                            'EventItemId': f"{event_id}-{number}",
-                            'EventItemAgendaNumber': number,
-                            'EventItemTitle': title,
-                            'EventItemActionName': action,
-                            'EventItemMatterId': matter_id,
-                            'EventItemMatterUrl': matter_url,
-                        })
-                except Exception as e:
-                    logger.warning(f"Error parsing agenda item: {e}")
-                    continue
+        # Find agenda items table
+        item_rows = tree.css('tr.rgRow, tr.rgAltRow')
 
-        except Exception as e:
-            logger.error(f"Error scraping event items: {e}")
+        for row in item_rows:
+            try:
+                title_td = row.css_first('td:nth-child(2)')
+                if title_td is not None:
+                    # Extract item info
+                    number = row.css_first('td:nth-child(1)').text(strip=True)
+                    title = title_td.text(strip=True)
+
+                    # Get action/result if available
+                    action = ""
+                    if row.css_first('td:nth-child(3)') is not None:
+                        action = row.css_first('td:last-child').text(strip=True)
+
+                    # Get link to matter details
+                    link = row.css_first('td:nth-child(2) a')
+                    href = link.attributes.get('href') if link else None
+                    matter_url = None
+                    matter_id = None
+                    if href:
+                        matter_url = f"{self.base_url}/{href}"
+                        match = _ID_RE.search(href)
+                        if match:
+                            matter_id = match.group(1)
+
+                    items.append({
+                        'EventItemId': f"{event_id}-{number}",
+                        'EventItemAgendaNumber': number,
+                        'EventItemTitle': title,
+                        'EventItemActionName': action,
+                        'EventItemMatterId': matter_id,
+                        'EventItemMatterUrl': matter_url,
+                    })
+            except Exception as e:
+                logger.warning(f"Error parsing agenda item: {e}")
+                continue
 
         return items
 
@@ -254,13 +396,13 @@ class PhoenixLegistarConnector:
         if event_date:
             try:
                 if isinstance(event_date, str):
-                    # Try various date formats
-                    for fmt in ['%m/%d/%Y', '%Y-%m-%d', '%Y-%m-%dT%H:%M:%S']:
-                        try:
-                            scheduled_for = datetime.strptime(event_date.split()[0], fmt)
-                            break
-                        except ValueError:
-                            continue
+                    # The Web API returns ISO timestamps and the scraped calendar
+                    # returns m/d/Y, so pick the parser from the string's shape
+                    date_part = event_date.split()[0]
+                    if '/' in date_part:
+                        scheduled_for = datetime.strptime(date_part, '%m/%d/%Y')
+                    else:
+                        scheduled_for = parse_datetime(date_part)
                 elif isinstance(event_date, datetime):
                     scheduled_for = event_date
             except Exception as e:
@@ -283,7 +425,7 @@ class PhoenixLegistarConnector:
             "level": "city",
             "status": status,
             "scheduled_for": scheduled_for,
-            "topic_tags": topics[:10],
+            "topic_tags": topics[:10] or None,
             "canonical_key": f"us:az:phoenix:{external_id}",
         }
 
@@ -291,27 +433,32 @@ class PhoenixLegistarConnector:
         """Map action text to status enum."""
         if not action:
             return "scheduled"
-        action_lower = action.lower()
-
-        if 'approved' in action_lower or 'passed' in action_lower or 'adopted' in action_lower:
-            return "passed"
-        elif 'denied' in action_lower or 'rejected' in action_lower or 'failed' in action_lower:
-            return "failed"
-        elif 'tabled' in action_lower or 'continued' in action_lower or 'postponed' in action_lower:
-            return "tabled"
-        elif 'withdrawn' in action_lower:
-            return "withdrawn"
-        elif action_lower:
-            return "scheduled"
-        else:
-            return "scheduled"
+
+        for pattern, status in _STATUS_PATTERNS:
+            if pattern.search(action):
+                return status
+        return "scheduled"
 
     async def _get_or_create_connector(self) -> Connector:
         """Get or create the Phoenix Legistar connector record."""
-        result = await self.db.execute(
-            select(Connector).where(Connector.name == "phoenix_legistar")
-        )
-        connector = result.scalar_one_or_none()
+        if self._connector is not None:
+            return self._connector
+
+        # The row almost never changes, so its id is kept in Redis and
+        # resolved with a primary-key get (served from the identity map
+        # when the session already holds it)
+        connector = None
+        cached_id = await cache_get(connector_key("phoenix_legistar"))
+        if cached_id:
+            connector = await self.db.get(Connector, UUID(cached_id))
+
+        if connector is None:
+            result = await self.db.execute(
+                select(Connector).where(Connector.name == "phoenix_legistar")
+            )
+            connector = result.scalar_one_or_none()
+            if connector:
+                await cache_set(connector_key("phoenix_legistar"), str(connector.id), ttl=86400)
 
         if not connector:
             connector = Connector(
@@ -327,8 +474,68 @@ class PhoenixLegistarConnector:
             self.db.add(connector)
             await self.db.flush()
 
+        self._connector = connector
         return connector
 
+    async def _upsert_measures(self, rows: Dict[str, Dict], source_urls: Dict[str, str], stats: Dict):
+        """
+        Upsert mapped agenda items with one INSERT ... ON CONFLICT DO UPDATE
+        on (source, external_id), and add a source link for each new measure.
+        """
+        try:
+            # Statuses before the upsert, to shift voters' dashboard stats
+            old_statuses = await current_statuses(self.db, "legistar", rows.keys())
+
+            # One client-side timestamp for the whole batch
+            now = utcnow()
+            measures = Measure.__table__
+            stmt = insert(Measure).values([{**row, "updated_at": now} for row in rows.values()])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Measure.source, Measure.external_id],
+                set_={
+                    "title": stmt.excluded.title,
+                    "level": stmt.excluded.level,
+                    "status": stmt.excluded.status,
+                    "scheduled_for": func.coalesce(stmt.excluded.scheduled_for, measures.c.scheduled_for),
+                    "topic_tags": stmt.excluded.topic_tags,
+                    "canonical_key": stmt.excluded.canonical_key,
+                    "updated_at": now,
+                },
+            ).returning(
+                Measure.id, Measure.external_id, Measure.level, Measure.status,
+                literal_column("(xmax = 0)").label("is_new"),
+            )
+
+            async with self.db.begin_nested():
+                result = await self.db.execute(stmt)
+                returned = result.all()
+                new_rows = [r for r in returned if r.is_new]
+                await record_status_changes(self.db, [
+                    (r.id, r.level, r.external_id, old_statuses[r.external_id], r.status)
+                    for r in returned
+                    if not r.is_new and old_statuses.get(r.external_id, r.status) != r.status
+                ])
+                if new_rows:
+                    await self.db.execute(
+                        insert(MeasureSource).values([
+                            {
+                                "measure_id": r.id,
+                                "label": "Phoenix Legistar",
+                                "url": source_urls[r.external_id],
+                                "ctype": "html",
+                                "is_primary": True,
+                            }
+                            for r in new_rows
+                        ])
+                    )
+        except Exception as e:
+            logger.error(f"Error upserting {len(rows)} agenda items: {e}")
+            stats["errors"] += len(rows)
+            return
+
+        stats["new_measures"] += len(new_rows)
+        stats["updated_measures"] += len(returned) - len(new_rows)
+
     async def run(self, days: int = 30, max_events: int = 10) -> Dict[str, Any]:
         """
         Run the Phoenix Legistar connector to fetch and store agenda items.
@@ -367,55 +574,26 @@ class PhoenixLegistarConnector:
             stats["events_fetched"] = len(events)
             logger.info(f"Fetched {len(events)} Phoenix events")
 
-            for event in events:
-                try:
-                    event_id = event.get('EventId')
-                    if not event_id:
-                        continue
+            # Fetch agenda items for every event concurrently; the DB work
+            # below stays sequential since it shares one session
+            events = [event for event in events if event.get('EventId')]
+            items_lists = await asyncio.gather(
+                *[self.get_event_items(event['EventId']) for event in events],
+                return_exceptions=True,
+            )
 
-                    # Fetch agenda items for this event
-                    items = await self.get_event_items(event_id)
+            # Map every agenda item first so they can be written with a
+            # single upsert instead of a SELECT + INSERT/UPDATE per item
+            mapped = []
+            for event, items in zip(events, items_lists):
+                try:
+                    if isinstance(items, BaseException):
+                        raise items
                     stats["items_fetched"] += len(items)
 
                     for item in items:
                         try:
-                            # Map to measure schema
-                            measure_data = self._map_event_to_measure(event, item)
-
-                            # Check if measure already exists
-                            result = await self.db.execute(
-                                select(Measure).where(
-                                    Measure.source == measure_data["source"],
-                                    Measure.external_id == measure_data["external_id"]
-                                )
-                            )
-                            existing = result.scalar_one_or_none()
-
-                            if existing:
-                                # Update existing measure
-                                for key, value in measure_data.items():
-                                    if value is not None:
-                                        setattr(existing, key, value)
-                                stats["updated_measures"] += 1
-                            else:
-                                # Create new measure
-                                measure = Measure(**measure_data)
-                                self.db.add(measure)
-                                await self.db.flush()
-
-                                # Add source link
-                                source_url = item.get('EventItemMatterUrl') or event.get('EventUrl') or f"{self.base_url}/MeetingDetail.aspx?ID={event_id}"
-                                source = MeasureSource(
-                                    measure_id=measure.id,
-                                    label="Phoenix Legistar",
-                                    url=source_url,
-                                    ctype="html",
-                                    is_primary=True
-                                )
-                                self.db.add(source)
-
-                                stats["new_measures"] += 1
-
+                            mapped.append((event, item, self._map_event_to_measure(event, item)))
                         except Exception as e:
                             logger.error(f"Error processing agenda item: {e}")
                             stats["errors"] += 1
@@ -424,6 +602,21 @@ class PhoenixLegistarConnector:
                     logger.error(f"Error processing event {event.get('EventId')}: {e}")
                     stats["errors"] += 1
 
+            # Last mapping wins if an item repeats within the run
+            rows: Dict[str, Dict] = {}
+            source_urls: Dict[str, str] = {}
+            for event, item, measure_data in mapped:
+                external_id = measure_data["external_id"]
+                rows[external_id] = measure_data
+                source_urls[external_id] = (
+                    item.get('EventItemMatterUrl')
+                    or event.get('EventUrl')
+                    or f"{self.base_url}/MeetingDetail.aspx?ID={event['EventId']}"
+                )
+
+            if rows:
+                await self._upsert_measures(rows, source_urls, stats)
+
             # Update run status
             run.status = "succeeded"
             run.finished_at = datetime.utcnow()
@@ -440,6 +633,8 @@ class PhoenixLegistarConnector:
             run.stats = stats
             await self.db.commit()
             raise
+        finally:
+            await self._close_client()
 
         return stats
 
@@ -4,10 +4,14 @@ Redis caching layer for frequently accessed data.
 Caches representatives, user profiles, and other hot-path data
 to avoid redundant DB queries and external API calls.
 """
-import json
+import functools
+import hashlib
+import inspect
 import logging
-from typing import Optional, Any
+import random
+from typing import Optional, Any, Awaitable, Callable, Dict, List
 
+import orjson
 import redis.asyncio as aioredis
 
 from app.core.config import settings
@@ -23,10 +27,10 @@ async def get_redis() -> Optional[aioredis.Redis]:
     global _pool
     if _pool is None:
         try:
+            # Values are orjson bytes, so responses are left undecoded
             _pool = aioredis.from_url(
                 settings.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
                 max_connections=20,
             )
             await _pool.ping()
@@ -47,6 +51,19 @@ async def close_redis():
 
 # --------------- helpers ---------------
 
+def _dumps(value: Any) -> bytes:
+    # orjson handles datetime/UUID natively; str() covers the rest (e.g. Decimal)
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def jittered_ttl(ttl: int, jitter: int) -> int:
+    """
+    ttl +/- a random jitter (seconds), so entries written together (e.g.
+    after a restart) don't all expire and refetch in the same moment.
+    """
+    return ttl + random.randint(-jitter, jitter)
+
+
 async def cache_get(key: str) -> Optional[Any]:
     """Retrieve a JSON-serialized value from cache."""
     r = await get_redis()
@@ -54,7 +71,7 @@ async def cache_get(key: str) -> Optional[Any]:
         return None
     try:
         raw = await r.get(key)
-        return json.loads(raw) if raw else None
+        return orjson.loads(raw) if raw else None
     except Exception as e:
         logger.debug(f"Cache get failed for {key}: {e}")
         return None
@@ -66,7 +83,7 @@ async def cache_set(key: str, value: Any, ttl: int = 300):
     if r is None:
         return
     try:
-        await r.set(key, json.dumps(value, default=str), ex=ttl)
+        await r.set(key, _dumps(value), ex=ttl)
     except Exception as e:
         logger.debug(f"Cache set failed for {key}: {e}")
 
@@ -82,21 +99,100 @@ async def cache_delete(key: str):
         logger.debug(f"Cache delete failed for {key}: {e}")
 
 
+async def cache_delete_many(keys: List[str]):
+    """Delete several cache keys in one round trip."""
+    if not keys:
+        return
+    r = await get_redis()
+    if r is None:
+        return
+    try:
+        await r.unlink(*keys)
+    except Exception as e:
+        logger.debug(f"Cache delete failed for {len(keys)} keys: {e}")
+
+
 async def cache_delete_pattern(pattern: str):
     """Delete all keys matching a pattern (e.g. 'user:*:reps')."""
     r = await get_redis()
     if r is None:
         return
     try:
-        cursor = "0"
-        while cursor != 0:
-            cursor, keys = await r.scan(cursor=cursor, match=pattern, count=100)
-            if keys:
-                await r.delete(*keys)
+        # Queue the deletes for every SCAN page and send them in one round trip
+        async with r.pipeline(transaction=False) as pipe:
+            cursor = "0"
+            while cursor != 0:
+                cursor, keys = await r.scan(cursor=cursor, match=pattern, count=500)
+                if keys:
+                    pipe.unlink(*keys)
+            await pipe.execute()
     except Exception as e:
         logger.debug(f"Cache pattern delete failed for {pattern}: {e}")
 
 
+async def cache_mget(keys: List[str]) -> List[Optional[Any]]:
+    """Retrieve several JSON-serialized values in one round trip (None for misses)."""
+    if not keys:
+        return []
+    r = await get_redis()
+    if r is None:
+        return [None] * len(keys)
+    try:
+        raws = await r.mget(keys)
+        return [orjson.loads(raw) if raw else None for raw in raws]
+    except Exception as e:
+        logger.debug(f"Cache mget failed for {len(keys)} keys: {e}")
+        return [None] * len(keys)
+
+
+async def cache_mset(values: Dict[str, Any], ttl: int = 300):
+    """Store several JSON-serializable values with a shared TTL in one round trip."""
+    if not values:
+        return
+    r = await get_redis()
+    if r is None:
+        return
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(key, _dumps(value), ex=ttl)
+            await pipe.execute()
+    except Exception as e:
+        logger.debug(f"Cache mset failed for {len(values)} keys: {e}")
+
+
+def redis_memoize(prefix: str, ttl: int = 300):
+    """
+    Cache an async function's JSON-serializable result in Redis.
+
+    The key is the prefix plus the call's arguments (``self`` is skipped for
+    methods), so arguments should have stable string forms. Empty results
+    are not cached, so a failed fetch is retried on the next call.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        params = list(inspect.signature(fn).parameters)
+        skip = 1 if params and params[0] == "self" else 0
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            parts = [str(a) for a in args[skip:]]
+            parts += [f"{k}={v}" for k, v in sorted(kwargs.items())]
+            key = ":".join([prefix, *parts])
+
+            cached = await cache_get(key)
+            if cached is not None:
+                return cached
+
+            result = await fn(*args, **kwargs)
+            if result:
+                await cache_set(key, result, ttl)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 # --------------- key builders ---------------
 
 def reps_key(user_id) -> str:
@@ -108,4 +204,19 @@ def dashboard_key(user_id) -> str:
 
 
 def congress_members_key(state_code: str) -> str:
-    return f"congress:members:{state_code.upper()}"
+    # v2: value is the chamber-indexed form, not the raw Congress.gov list
+    return f"congress:members:v2:{state_code.upper()}"
+
+
+def census_district_key(state_code: str, zip_code: str, street: str) -> str:
+    # The (normalized) street is hashed so raw addresses never sit in Redis keys
+    digest = hashlib.sha256(street.encode()).hexdigest()[:32]
+    return f"geo:cd:{state_code.upper()}:{zip_code.strip()[:5]}:{digest}"
+
+
+def connector_key(name: str) -> str:
+    return f"connector:{name}"
+
+
+def federal_bills_key(congress: int, limit: int, offset: int) -> str:
+    return f"congress:bills:{congress}:{limit}:{offset}"
@@ -1,15 +1,38 @@
 """
 Database connection and session management
 """
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import inspect, select, Select
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from sqlalchemy.orm import declarative_base, raiseload, selectinload
+from typing import AsyncGenerator, Iterable, List
 
 from app.core.config import settings
 
 # Only echo SQL in development — massive I/O overhead in production
 _echo_sql = settings.ENVIRONMENT == "development"
 
+if settings.DB_PGBOUNCER_TRANSACTION_MODE:
+    # PgBouncer hands each transaction a different server connection, so a
+    # statement prepared on one may not exist on the next: turn off both
+    # statement caches and give every prepared statement a unique name
+    _connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4().hex}__",
+    }
+else:
+    # Direct connections: keep hot statements (swipe upsert, feed, auth
+    # lookups) prepared per connection so repeat calls skip parse/plan
+    _connect_args = {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -18,6 +41,14 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=20,
     max_overflow=40,
+    # Recycle before server/proxy idle timeouts drop connections, and fail
+    # fast instead of queueing for 30s when the pool is exhausted
+    pool_recycle=1800,
+    pool_timeout=10,
+    # Compiled-SQL LRU; the default 500 entries churns once the ORM loader,
+    # upsert and endpoint statement shapes are all warm
+    query_cache_size=2048,
+    connect_args=_connect_args,
 )
 
 # Create async session factory
@@ -33,6 +64,28 @@ async_session_maker = async_sessionmaker(
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    """Timezone-aware current UTC time, for client-side timestamp defaults."""
+    return datetime.now(timezone.utc)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7) for primary key defaults.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land
+    on the right-hand edge of the primary key B-tree instead of a random page.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")  # 74 of these 80 bits are used
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                        # version 7
+    value |= ((rand >> 62) & 0xFFF) << 64     # rand_a
+    value |= 0b10 << 62                       # RFC 9562 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF     # rand_b
+    return uuid.UUID(int=value)
+
+
 async def init_db():
     """Initialize database connection"""
     # Test connection
@@ -60,3 +113,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+def selectinload_for(model, fields: Iterable[str]) -> List:
+    """selectinload() options for the given field names that are relationships on model"""
+    relationships = inspect(model).relationships
+    return [
+        selectinload(getattr(model, name))
+        for name in fields
+        if name in relationships
+    ]
+
+
+def select_for_schema(model, schema_cls) -> Select:
+    """
+    SELECT for model that loads only the relationships schema_cls renders.
+
+    Relationships are matched to schema fields by name; every other
+    relationship is raiseloaded, so an attribute the response doesn't
+    declare fails loudly instead of issuing a hidden query.
+    """
+    return select(model).options(
+        raiseload("*"),
+        *selectinload_for(model, schema_cls.model_fields),
+    )
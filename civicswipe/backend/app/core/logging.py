@@ -3,24 +3,53 @@ Logging configuration for CivicSwipe
 
 Provides structured JSON logging for production and readable logs for development.
 """
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
 import json
-from datetime import datetime
-from typing import Any, Dict
+import time
+from datetime import datetime, timezone
+import orjson
+from typing import Any, Dict, Optional
 from pythonjsonlogger import jsonlogger
 
 from app.core.config import settings
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted record;
+# records within the same second only reformat the microsecond suffix
+_TS_CACHE = (-1, "")
+
+
+def _iso_timestamp(created: float) -> str:
+    """
+    UTC ISO-8601 timestamp for a LogRecord.created value, formatted like
+    datetime.isoformat(): microseconds rounded as datetime rounds them, and
+    left out entirely on a whole second.
+    """
+    global _TS_CACHE
+    micros = datetime.fromtimestamp(created, timezone.utc).microsecond
+    # Whole second the rounded value falls in (rounding can carry into the next)
+    sec = round(created - micros / 1e6)
+    cached_sec, prefix = _TS_CACHE
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_CACHE = (sec, prefix)
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
+
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter with additional fields."""
 
     def add_fields(self, log_record: Dict[str, Any], record: logging.LogRecord, message_dict: Dict[str, Any]) -> None:
         super().add_fields(log_record, record, message_dict)
 
-        # Add timestamp
-        log_record['timestamp'] = datetime.utcnow().isoformat()
+        # Add timestamp (the record's own creation time, not a second clock read)
+        log_record['timestamp'] = _iso_timestamp(record.created)
 
         # Add standard fields
         log_record['level'] = record.levelname
@@ -32,6 +61,14 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         if record.exc_info:
             log_record['exception'] = self.formatException(record.exc_info)
 
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        # orjson instead of the stdlib encoder; str() covers arbitrary `extra` values
+        return orjson.dumps(
+            log_record,
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z,
+        ).decode()
+
 
 class DevelopmentFormatter(logging.Formatter):
     """Human-readable formatter for development."""
@@ -45,10 +82,89 @@ class DevelopmentFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored = {level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()}
+
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # Swap in the colored level only for this format call; other handlers
+        # (and Sentry breadcrumbs) must keep seeing the plain level name
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the writer thread.
+
+    The stock prepare() formats the record up front and drops exc_info, which
+    would bake tracebacks into the JSON message field. The writer runs in this
+    process, so only the message args are merged here.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+class _BatchingLogWriter:
+    """Background thread that formats queued records and writes them in batches."""
+
+    _STOP = object()
+
+    def __init__(self, handler: logging.StreamHandler, max_batch: int = 256):
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.handler = handler
+        self.max_batch = max_batch
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread and self._thread.is_alive():
+            self.queue.put(self._STOP)
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            stop = False
+            for record in batch:
+                if record is self._STOP:
+                    stop = True
+                    continue
+                try:
+                    lines.append(self.handler.format(record))
+                except Exception:
+                    self.handler.handleError(record)
+
+            # One write + flush per batch instead of per record
+            if lines:
+                try:
+                    self.handler.stream.write(self.handler.terminator.join(lines) + self.handler.terminator)
+                    self.handler.flush()
+                except Exception:
+                    pass
+            if stop:
+                return
+
+
+_log_writer: Optional[_BatchingLogWriter] = None
 
 
 def setup_logging() -> None:
@@ -77,12 +193,27 @@ def setup_logging() -> None:
         )
 
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+
+    # Request threads only enqueue; formatting and the stdout write happen on
+    # a background thread so a slow pipe never stalls request handling
+    global _log_writer
+    if _log_writer is not None:
+        _log_writer.stop()
+    else:
+        atexit.register(lambda: _log_writer and _log_writer.stop())
+        # Threads don't survive fork(); give forked children their own writer
+        os.register_at_fork(after_in_child=lambda: _log_writer and _log_writer.start())
+    _log_writer = _BatchingLogWriter(console_handler)
+    _log_writer.start()
+    root_logger.addHandler(_DeferredQueueHandler(_log_writer.queue))
 
     # Suppress noisy loggers
     logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
     logging.getLogger('httpx').setLevel(logging.WARNING)
     logging.getLogger('httpcore').setLevel(logging.WARNING)
+    if settings.ENVIRONMENT != 'development':
+        # Keep statement logging off even if LOG_LEVEL is INFO/DEBUG
+        logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
 
     # Log startup info
     logger = logging.getLogger(__name__)
@@ -98,6 +229,8 @@ def get_logger(name: str) -> logging.Logger:
 class RequestLogger:
     """Context manager for request logging."""
 
+    __slots__ = ('logger', 'request_id', 'method', 'path', 'start_time')
+
     def __init__(self, logger: logging.Logger, request_id: str, method: str, path: str):
         self.logger = logger
         self.request_id = request_id
@@ -106,7 +239,7 @@ class RequestLogger:
         self.start_time = None
 
     def __enter__(self):
-        self.start_time = datetime.utcnow()
+        self.start_time = time.monotonic_ns()
         self.logger.info(
             f"Request started",
             extra={
@@ -118,7 +251,7 @@ class RequestLogger:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.utcnow() - self.start_time).total_seconds() * 1000
+        duration = (time.monotonic_ns() - self.start_time) / 1e6
 
         if exc_type:
             self.logger.error(
@@ -4,16 +4,24 @@ Monitoring and error tracking for CivicSwipe
 Integrates with Sentry for error tracking and provides custom metrics.
 """
 import logging
-from typing import Optional, Dict, Any
+import threading
+from array import array
+from collections import defaultdict
+from typing import Optional, Dict, Any, Tuple
 from functools import wraps
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# sentry_sdk module once init_sentry() has succeeded; None means disabled.
+# The capture helpers check this instead of re-importing on every call.
+_sentry = None
+
 
 def init_sentry() -> None:
     """Initialize Sentry for error tracking."""
+    global _sentry
     if not settings.SENTRY_DSN:
         logger.info("Sentry DSN not configured, error tracking disabled")
         return
@@ -43,6 +51,7 @@ def init_sentry() -> None:
             before_send_transaction=_filter_transactions,
         )
 
+        _sentry = sentry_sdk
         logger.info("Sentry initialized successfully")
 
     except ImportError:
@@ -62,49 +71,37 @@ def _filter_transactions(event: Dict[str, Any], hint: Dict[str, Any]) -> Optiona
 
 def capture_exception(error: Exception, extra: Optional[Dict[str, Any]] = None) -> None:
     """Capture an exception to Sentry."""
-    if not settings.SENTRY_DSN:
+    if _sentry is None:
         return
 
-    try:
-        import sentry_sdk
-        with sentry_sdk.push_scope() as scope:
-            if extra:
-                for key, value in extra.items():
-                    scope.set_extra(key, value)
-            sentry_sdk.capture_exception(error)
-    except ImportError:
-        pass
+    with _sentry.push_scope() as scope:
+        if extra:
+            for key, value in extra.items():
+                scope.set_extra(key, value)
+        _sentry.capture_exception(error)
 
 
 def capture_message(message: str, level: str = 'info', extra: Optional[Dict[str, Any]] = None) -> None:
     """Capture a message to Sentry."""
-    if not settings.SENTRY_DSN:
+    if _sentry is None:
         return
 
-    try:
-        import sentry_sdk
-        with sentry_sdk.push_scope() as scope:
-            if extra:
-                for key, value in extra.items():
-                    scope.set_extra(key, value)
-            sentry_sdk.capture_message(message, level=level)
-    except ImportError:
-        pass
+    with _sentry.push_scope() as scope:
+        if extra:
+            for key, value in extra.items():
+                scope.set_extra(key, value)
+        _sentry.capture_message(message, level=level)
 
 
 def set_user_context(user_id: str, email: Optional[str] = None) -> None:
     """Set user context for error tracking."""
-    if not settings.SENTRY_DSN:
+    if _sentry is None:
         return
 
-    try:
-        import sentry_sdk
-        sentry_sdk.set_user({
-            'id': user_id,
-            'email': email,
-        })
-    except ImportError:
-        pass
+    _sentry.set_user({
+        'id': user_id,
+        'email': email,
+    })
 
 
 def track_task(task_name: str):
@@ -125,23 +122,96 @@ def track_task(task_name: str):
     return decorator
 
 
+# (name, sorted (tag, value) pairs)
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Histogram:
+    """
+    Fixed-memory latency histogram with power-of-two buckets.
+
+    Bucket i counts values whose integer part has bit_length i, i.e. the
+    range [2**(i-1), 2**i - 1] (bucket 0 holds zero).
+    """
+
+    __slots__ = ('buckets', '_lock')
+
+    def __init__(self, lock: Optional[threading.Lock] = None):
+        self.buckets = array('Q', [0] * 64)
+        # Shared with the owning Metrics, so get_all(reset=True) can read
+        # and clear the buckets without losing a concurrent observe
+        self._lock = lock or threading.Lock()
+
+    def observe(self, value: float) -> None:
+        v = int(value)
+        with self._lock:
+            self.buckets[min(v.bit_length(), 63) if v > 0 else 0] += 1
+
+    def snapshot(self, reset: bool = False) -> Dict[str, int]:
+        """
+        Non-empty buckets keyed by their inclusive upper bound, optionally
+        zeroing them. The caller holds the lock.
+        """
+        snap = {f"le_{(1 << i) - 1}": n for i, n in enumerate(self.buckets) if n}
+        if reset:
+            self.buckets = array('Q', [0] * 64)
+        return snap
+
+
+class LabeledCounter:
+    """A counter bound to one precomputed name+tags key."""
+
+    __slots__ = ('_owner', 'key')
+
+    def __init__(self, owner: "Metrics", key: MetricKey):
+        self._owner = owner
+        self.key = key
+
+    def inc(self, value: int = 1) -> None:
+        owner = self._owner
+        with owner._lock:
+            owner._counters[self.key] += value
+
+
 # Simple in-memory metrics (replace with Prometheus/StatsD in production)
 class Metrics:
     """Simple metrics collection."""
 
+    __slots__ = ('_counters', '_gauges', '_histograms', '_lock')
+
     def __init__(self):
-        self._counters: Dict[str, int] = {}
-        self._gauges: Dict[str, float] = {}
+        self._counters: Dict[MetricKey, int] = defaultdict(int)
+        self._gauges: Dict[MetricKey, float] = {}
+        self._histograms: Dict[MetricKey, Histogram] = {}
+        # Taken by every counter/gauge write and by get_all, so a write on
+        # another thread (Celery thread pools, free-threaded builds) lands
+        # either before the reset swap or in the fresh dict, never in an
+        # already-exported one. Uncontended, it costs far less than a request.
+        self._lock = threading.Lock()
 
     def increment(self, name: str, value: int = 1, tags: Optional[Dict[str, str]] = None) -> None:
         """Increment a counter."""
         key = self._make_key(name, tags)
-        self._counters[key] = self._counters.get(key, 0) + value
+        with self._lock:
+            self._counters[key] += value
+
+    def labeled(self, name: str, **tags: str) -> LabeledCounter:
+        """Bind a counter to a fixed tag set, sorting its tags once instead of per increment."""
+        return LabeledCounter(self, self._make_key(name, tags))
+
+    def histogram(self, name: str, **tags: str) -> Histogram:
+        """Get (or create) the histogram for a name+tags; callers keep the reference."""
+        key = self._make_key(name, tags)
+        hist = self._histograms.get(key)
+        if hist is None:
+            hist = self._histograms.setdefault(key, Histogram(self._lock))
+        return hist
 
     def gauge(self, name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
         """Set a gauge value."""
         key = self._make_key(name, tags)
-        self._gauges[key] = value
+        with self._lock:
+            self._gauges[key] = value
 
     def get_counter(self, name: str, tags: Optional[Dict[str, str]] = None) -> int:
         """Get a counter value."""
@@ -153,30 +223,72 @@ class Metrics:
         key = self._make_key(name, tags)
         return self._gauges.get(key, 0.0)
 
-    def get_all(self) -> Dict[str, Any]:
-        """Get all metrics."""
+    def get_all(self, reset: bool = False) -> Dict[str, Any]:
+        """
+        Get all metrics, with keys rendered as "name[k=v,...]".
+
+        With reset=True the live counters are swapped for a fresh dict so
+        the export reads the old one undisturbed, and histogram buckets are
+        zeroed in place (callers hold histogram references), so the whole
+        export is per-interval deltas. The default keeps cumulative values
+        for the /metrics endpoint.
+        """
+        with self._lock:
+            if reset:
+                counters, self._counters = self._counters, defaultdict(int)
+                gauges, self._gauges = self._gauges, {}
+            else:
+                counters, gauges = dict(self._counters), self._gauges.copy()
+            histograms = {key: hist.snapshot(reset) for key, hist in self._histograms.items()}
         return {
-            'counters': self._counters.copy(),
-            'gauges': self._gauges.copy(),
+            'counters': {_format_key(k): v for k, v in counters.items()},
+            'gauges': {_format_key(k): v for k, v in gauges.items()},
+            'histograms': {_format_key(k): v for k, v in histograms.items()},
         }
 
-    def _make_key(self, name: str, tags: Optional[Dict[str, str]] = None) -> str:
-        """Create a unique key for a metric."""
+    def _make_key(self, name: str, tags: Optional[Dict[str, str]] = None) -> MetricKey:
+        """
+        Create a unique key for a metric. Keys are tuples (hashed in C, no
+        string building); they're only formatted when exported.
+        """
         if not tags:
-            return name
-        tag_str = ','.join(f"{k}={v}" for k, v in sorted(tags.items()))
-        return f"{name}[{tag_str}]"
+            return (name, ())
+        return (name, tuple(sorted(tags.items())))
+
+
+def _format_key(key: MetricKey) -> str:
+    name, tags = key
+    if not tags:
+        return name
+    tag_str = ','.join(f"{k}={v}" for k, v in tags)
+    return f"{name}[{tag_str}]"
 
 
 # Global metrics instance
 metrics = Metrics()
 
 
+# (method, status_code) -> bound api.requests.total counter; the set of
+# methods and status codes is small, so this stays bounded
+_api_request_counters: Dict[Tuple[str, int], LabeledCounter] = {}
+_api_latency: Dict[str, Histogram] = {}
+
+
 # Track common operations
 def track_api_request(method: str, path: str, status_code: int, duration_ms: float) -> None:
     """Track an API request."""
-    metrics.increment('api.requests.total', tags={'method': method, 'status': str(status_code)})
-    metrics.gauge('api.request.duration_ms', duration_ms, tags={'method': method, 'path': path})
+    counter = _api_request_counters.get((method, status_code))
+    if counter is None:
+        counter = metrics.labeled('api.requests.total', method=method, status=str(status_code))
+        _api_request_counters[(method, status_code)] = counter
+    counter.inc()
+
+    # One bounded histogram per method; tagging by path grew without limit
+    # and a gauge only ever kept the last sample
+    hist = _api_latency.get(method)
+    if hist is None:
+        hist = _api_latency[method] = metrics.histogram('api.request.duration_ms', method=method)
+    hist.observe(duration_ms)
 
 
 def track_vote(level: str) -> None:
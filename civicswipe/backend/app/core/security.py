@@ -1,26 +1,53 @@
 """
 Security utilities for authentication and encryption
 """
-from datetime import datetime, timedelta
-from typing import Optional
+import asyncio
+import time
+from datetime import timedelta
+from typing import List, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from cachetools import TTLCache
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 import base64
+import functools
 import hashlib
+import os
 
 from app.core.config import settings
 
-# Password hashing - use bcrypt with truncation for long passwords
+# JWT parameters are read on every request; bind them once as plain strings
+_JWT_SECRET = settings.SECRET_KEY
+_JWT_ALGORITHM = settings.ALGORITHM
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_TTL_SECONDS = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+# Password hashing - argon2id for new hashes (OWASP minimum parameters).
+# bcrypt stays verifiable for existing users and is rehashed on their next login.
 pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
     bcrypt__rounds=12
 )
 
 # Initialize Fernet for address encryption
+@functools.lru_cache(maxsize=4)
 def _derive_key_pbkdf2(key_bytes: bytes) -> bytes:
-    """PBKDF2-based key derivation (preferred — new encryptions use this)."""
+    """
+    PBKDF2-based key derivation (preferred — new encryptions use this).
+
+    600k iterations take a few hundred ms, so the result is memoized per
+    input key. The salt recipe must stay as-is: changing it would change the
+    derived key and make every stored address undecryptable.
+    """
     salt = hashlib.sha256(b"civicswipe-address-enc-salt" + key_bytes[:8]).digest()[:16]
     derived = hashlib.pbkdf2_hmac("sha256", key_bytes, salt, iterations=600_000)
     return base64.urlsafe_b64encode(derived)
@@ -36,9 +63,43 @@ def get_encryption_key() -> bytes:
     return _derive_key_pbkdf2(settings.ENCRYPTION_KEY.encode())
 
 
-# Primary Fernet uses PBKDF2; legacy Fernet used for decryption fallback
-fernet = Fernet(get_encryption_key())
-_fernet_legacy = Fernet(_derive_key_legacy(settings.ENCRYPTION_KEY.encode()))
+# Fernet instances only decrypt pre-AES-GCM data: primary uses PBKDF2, legacy
+# the old SHA256 derivation. All ciphers are built on first use so processes
+# that only verify tokens (or never touch addresses, like Celery workers) skip
+# the PBKDF2 cost at import.
+@functools.cache
+def _fernet() -> Fernet:
+    return Fernet(get_encryption_key())
+
+
+@functools.cache
+def _fernet_legacy() -> Fernet:
+    return Fernet(_derive_key_legacy(settings.ENCRYPTION_KEY.encode()))
+
+
+# New address ciphertexts are AES-256-GCM: version byte + 12-byte nonce +
+# ciphertext/tag. Fernet tokens always start with 0x80 base64-encoded ("g"),
+# so the version byte tells the formats apart.
+_AESGCM_VERSION = b"\x01"
+_AESGCM_NONCE_BYTES = 12
+
+
+@functools.cache
+def _aesgcm() -> AESGCM:
+    # Separate the GCM key from the Fernet key derived from the same secret
+    pbkdf2_key = base64.urlsafe_b64decode(get_encryption_key())
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"civicswipe-address-aesgcm",
+    ).derive(pbkdf2_key)
+    return AESGCM(key)
+
+
+def warm_encryption_keys() -> None:
+    """Derive the address-encryption key ahead of the first request that needs it."""
+    _aesgcm()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -46,6 +107,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password[:72], hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, if its hash uses a deprecated scheme, return a
+    replacement hash to persist (None when the stored hash is current).
+    """
+    return pwd_context.verify_and_update(plain_password[:72], hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """Hash a password (truncated to 72 bytes for bcrypt compatibility)"""
     # Bcrypt has a 72-byte limit
@@ -56,18 +125,17 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """Create JWT access token"""
     to_encode = data.copy()
     
+    # Integer epoch seconds: what jose would convert a datetime to anyway
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = int(time.time()) + _ACCESS_TOKEN_TTL_SECONDS
     
     to_encode.update({"exp": expire, "type": "access"})
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        _JWT_SECRET,
+        algorithm=_JWT_ALGORITHM
     )
     return encoded_jwt
 
@@ -75,13 +143,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 def create_refresh_token(data: dict) -> str:
     """Create JWT refresh token"""
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int(time.time()) + _REFRESH_TOKEN_TTL_SECONDS
     
     to_encode.update({"exp": expire, "type": "refresh"})
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        _JWT_SECRET,
+        algorithm=_JWT_ALGORITHM
     )
     return encoded_jwt
 
@@ -91,8 +159,8 @@ def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
+            _JWT_SECRET,
+            algorithms=_JWT_ALGORITHMS
         )
         
         if payload.get("type") != token_type:
@@ -104,21 +172,29 @@ def verify_token(token: str, token_type: str = "access") -> Optional[dict]:
 
 
 def encrypt_address(address: str) -> bytes:
-    """Encrypt address for storage (uses PBKDF2-derived key)."""
-    return fernet.encrypt(address.encode())
+    """Encrypt address for storage (AES-256-GCM, key derived from the PBKDF2 key)."""
+    nonce = os.urandom(_AESGCM_NONCE_BYTES)
+    return _AESGCM_VERSION + nonce + _aesgcm().encrypt(nonce, address.encode(), None)
 
 
 def decrypt_address(encrypted_address: bytes) -> str:
     """
     Decrypt stored address.
-    Tries PBKDF2-derived key first, falls back to legacy SHA256 key
+    AES-GCM values are recognised by their version byte. Older Fernet values
+    try the PBKDF2-derived key first, then fall back to the legacy SHA256 key
     for data encrypted before the key-derivation upgrade.
     """
+    encrypted_address = bytes(encrypted_address)
+    if encrypted_address[:1] == _AESGCM_VERSION:
+        nonce = encrypted_address[1:1 + _AESGCM_NONCE_BYTES]
+        ciphertext = encrypted_address[1 + _AESGCM_NONCE_BYTES:]
+        return _aesgcm().decrypt(nonce, ciphertext, None).decode()
+
     try:
-        return fernet.decrypt(encrypted_address).decode()
+        return _fernet().decrypt(encrypted_address).decode()
     except Exception:
         # Fallback to legacy key for pre-upgrade data
-        return _fernet_legacy.decrypt(encrypted_address).decode()
+        return _fernet_legacy().decrypt(encrypted_address).decode()
 
 
 def hash_address(address_line1: str, city: str, state: str, postal_code: str, country: str) -> str:
@@ -132,6 +208,90 @@ def hash_address(address_line1: str, city: str, state: str, postal_code: str, co
 
 # --- Token blacklist (Redis-backed) ---
 
+# Tokens recently confirmed NOT revoked. Almost every check is a miss, so this
+# skips the hash + Redis round trip for a token seen in the last 30s. A token
+# revoked by another worker can therefore still pass here for up to 30s;
+# refresh-token rotation bypasses the cache for that reason.
+_not_blacklisted = TTLCache(maxsize=10_000, ttl=30)
+
+
+def _blacklist_key(token: str) -> str:
+    """Redis key for a revoked token: a 128-bit BLAKE2b digest (half of SHA-256's)."""
+    return f"bl:{hashlib.blake2b(token.encode(), digest_size=16).hexdigest()}"
+
+
+def _legacy_blacklist_key(token: str) -> str:
+    # Pre-BLAKE2b key format. Entries expire after REFRESH_TOKEN_EXPIRE_DAYS,
+    # so this lookup can go once that window has passed since the switch.
+    return f"bl:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+class TokenBlacklistBatcher:
+    """
+    Coalesces concurrent blacklist checks into one pipelined Redis round trip.
+
+    The first check in an idle period schedules a flush after `window`
+    seconds; every check that arrives meanwhile rides the same pipeline of
+    EXISTS commands.
+
+    Pending futures and the flush task belong to one event loop, so state is
+    reset when checks start arriving on a different loop (Celery runs each
+    task on a fresh one). A flush that is cancelled fails its waiters rather
+    than leaving them, and every later check, hanging.
+    """
+
+    def __init__(self, window: float = 0.001):
+        self.window = window
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[Tuple[str, ...], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def check(self, r, keys: Tuple[str, ...]) -> bool:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = []
+            self._flush_task = None
+        future = loop.create_future()
+        self._pending.append((keys, future))
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush(r))
+        return await future
+
+    def _take_batch(self) -> List[Tuple[Tuple[str, ...], asyncio.Future]]:
+        """Detach the pending checks; later checks schedule a new flush."""
+        batch, self._pending = self._pending, []
+        if self._flush_task is asyncio.current_task():
+            self._flush_task = None
+        return batch
+
+    async def _flush(self, r):
+        batch = []
+        try:
+            await asyncio.sleep(self.window)
+            batch = self._take_batch()
+            async with r.pipeline(transaction=False) as pipe:
+                for keys, _ in batch:
+                    pipe.exists(*keys)
+                results = await pipe.execute()
+        except BaseException as e:
+            if self._flush_task is asyncio.current_task():
+                batch = self._take_batch()  # cancelled before the batch was taken
+            error = e if isinstance(e, Exception) else RuntimeError("Blacklist check cancelled")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for (_, future), count in zip(batch, results):
+            if not future.done():
+                future.set_result(count > 0)
+
+
+_blacklist_batcher = TokenBlacklistBatcher()
+
+
 async def blacklist_token(token: str, ttl_seconds: Optional[int] = None) -> None:
     """
     Add a token to the Redis blacklist.
@@ -145,19 +305,33 @@ async def blacklist_token(token: str, ttl_seconds: Optional[int] = None) -> None
     try:
         if ttl_seconds is None:
             ttl_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
-        await r.setex(f"bl:{hashlib.sha256(token.encode()).hexdigest()}", ttl_seconds, "1")
+        await r.setex(_blacklist_key(token), ttl_seconds, "1")
+        _not_blacklisted.pop(token, None)
     except Exception:
         pass  # Best-effort
 
 
-async def is_token_blacklisted(token: str) -> bool:
-    """Check if a token has been revoked."""
+async def is_token_blacklisted(token: str, use_cache: bool = True) -> bool:
+    """
+    Check if a token has been revoked.
+
+    Negative answers are cached in-process for a few seconds; pass
+    use_cache=False where a just-revoked token must be caught immediately.
+    """
     from app.core.cache import get_redis
 
+    if use_cache and token in _not_blacklisted:
+        return False
+
     r = await get_redis()
     if r is None:
         return False  # Fail open — same as rate limiter policy
     try:
-        return await r.exists(f"bl:{hashlib.sha256(token.encode()).hexdigest()}") > 0
+        revoked = await _blacklist_batcher.check(
+            r, (_blacklist_key(token), _legacy_blacklist_key(token))
+        )
     except Exception:
         return False
+    if not revoked:
+        _not_blacklisted[token] = True
+    return revoked
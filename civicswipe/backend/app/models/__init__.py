@@ -6,7 +6,7 @@ from app.models.user import User, UserProfile, UserPreferences
 from app.models.division import Division, UserDivision
 from app.models.official import Official, OfficialDivision, UserOfficial
 from app.models.measure import Measure, MeasureSource, MeasureStatusEvent
-from app.models.vote import VoteEvent, OfficialVote, UserVote, MatchResult
+from app.models.vote import VoteEvent, OfficialVote, UserVote, MatchResult, MatchResultOfficial, UserStats
 from app.models.connector import Connector, IngestionRun, RawArtifact
 
 __all__ = [
@@ -34,6 +34,8 @@ __all__ = [
     "OfficialVote",
     "UserVote",
     "MatchResult",
+    "MatchResultOfficial",
+    "UserStats",
     
     # Connector models
     "Connector",
@@ -1,25 +1,13 @@
 """
 SQLAlchemy models for data connectors and ingestion pipeline
 """
-from sqlalchemy import Column, String, ForeignKey, DateTime, Text, Boolean, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
+from sqlalchemy import Column, String, ForeignKey, DateTime, Text, Boolean, UniqueConstraint, Index, LargeBinary
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 
-from app.core.database import Base
-
-
-# PostgreSQL enum types that match the database schema
-source_system_enum = ENUM(
-    'congress', 'govinfo', 'openstates', 'legiscan', 'legistar', 'custom',
-    name='source_system', create_type=False
-)
-
-content_type_enum = ENUM(
-    'html', 'pdf', 'api', 'text',
-    name='content_type', create_type=False
-)
+from app.core.database import Base, uuid7, utcnow
+from app.models.measure import source_system_enum, content_type_enum
 
 
 class Connector(Base):
@@ -28,12 +16,12 @@ class Connector(Base):
     """
     __tablename__ = "connectors"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String, nullable=False, unique=True, index=True)  # e.g., "phoenix_legistar", "congress"
     source = Column(source_system_enum, nullable=False)  # Enum: congress, govinfo, openstates, legiscan, legistar, custom
     enabled = Column(Boolean, nullable=False, default=True)
     config = Column(JSONB, nullable=False, default={})  # Connector-specific configuration (URLs, keys, etc.)
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow, server_default=func.now())
     
     # Relationships
     ingestion_runs = relationship("IngestionRun", back_populates="connector", cascade="all, delete-orphan")
@@ -49,8 +37,8 @@ class IngestionRun(Base):
     """
     __tablename__ = "ingestion_runs"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    connector_id = Column(UUID(as_uuid=True), ForeignKey("connectors.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    connector_id = Column(UUID(as_uuid=True), ForeignKey("connectors.id", ondelete="CASCADE"), nullable=False)
     started_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
     finished_at = Column(DateTime(timezone=True), nullable=True)
     status = Column(String, nullable=False, default="running")  # running, succeeded, failed
@@ -59,6 +47,11 @@ class IngestionRun(Base):
     
     # Relationships
     connector = relationship("Connector", back_populates="ingestion_runs")
+
+    __table_args__ = (
+        # Latest runs per connector; also serves plain connector_id lookups
+        Index('idx_ingestion_runs_connector_started', 'connector_id', started_at.desc()),
+    )
     
     def __repr__(self):
         return f"<IngestionRun(id={self.id}, connector_id={self.connector_id}, status={self.status})>"
@@ -71,17 +64,26 @@ class RawArtifact(Base):
     """
     __tablename__ = "raw_artifacts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    connector_id = Column(UUID(as_uuid=True), ForeignKey("connectors.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    connector_id = Column(UUID(as_uuid=True), ForeignKey("connectors.id", ondelete="CASCADE"), nullable=False)
     measure_id = Column(UUID(as_uuid=True), ForeignKey("measures.id", ondelete="SET NULL"), nullable=True, index=True)
     url = Column(Text, nullable=True)
     ctype = Column(content_type_enum, nullable=True)  # Enum: html, pdf, api, text
     fetched_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
     blob_ref = Column(Text, nullable=False)  # S3/GCS key or local path
-    sha256 = Column(String, nullable=True, index=True)  # For deduplication
+    sha256 = Column(LargeBinary(32), nullable=True)  # Raw 32-byte digest (hashlib...digest()), for deduplication
     
     # Relationships
     connector = relationship("Connector", back_populates="raw_artifacts")
+
+    __table_args__ = (
+        # Dedup check (connector_id, sha256) and recent artifacts per connector;
+        # together they cover plain connector_id lookups
+        Index('idx_raw_artifacts_connector_sha256', 'connector_id', 'sha256'),
+        Index('idx_raw_artifacts_connector_fetched', 'connector_id', fetched_at.desc()),
+        # Digest lookups are equality-only, so a hash index is enough
+        Index('idx_raw_artifacts_sha256', 'sha256', postgresql_using='hash'),
+    )
     
     def __repr__(self):
         return f"<RawArtifact(id={self.id}, url={self.url}, connector_id={self.connector_id})>"
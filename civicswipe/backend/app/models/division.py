@@ -5,9 +5,8 @@ from sqlalchemy import Column, String, ForeignKey, DateTime, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 
-from app.core.database import Base
+from app.core.database import Base, uuid7
 
 
 class Division(Base):
@@ -17,7 +16,7 @@ class Division(Base):
     """
     __tablename__ = "divisions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     division_type = Column(String, nullable=False)  # Enum: country, state, county, city, etc.
     ocd_id = Column(String, nullable=True, index=True)  # e.g., ocd-division/country:us/state:az/place:phoenix
     name = Column(String, nullable=False)
@@ -1,35 +1,55 @@
 """
 SQLAlchemy models for measures (bills, ordinances, agenda items)
 """
-from sqlalchemy import Column, String, ForeignKey, DateTime, Text, Boolean, ARRAY, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID, ENUM
+from sqlalchemy import Column, String, ForeignKey, DateTime, Text, Boolean, ARRAY, UniqueConstraint, Index, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
+from enum import IntEnum
 
-from app.core.database import Base
+from app.core.database import Base, uuid7, utcnow
+from app.models.types import IntEnumType
 
 
-# PostgreSQL enum types that match the database schema
-source_system_enum = ENUM(
-    'congress', 'govinfo', 'openstates', 'legiscan', 'legistar', 'custom',
-    name='source_system', create_type=False
-)
+# SMALLINT codes for enum columns (see database/008); append only, never renumber
+class SourceSystemCode(IntEnum):
+    congress = 1
+    govinfo = 2
+    openstates = 3
+    legiscan = 4
+    legistar = 5
+    custom = 6
 
-jurisdiction_level_enum = ENUM(
-    'federal', 'state', 'county', 'city',
-    name='jurisdiction_level', create_type=False
-)
 
-measure_status_enum = ENUM(
-    'introduced', 'scheduled', 'in_committee', 'passed', 'failed', 'tabled', 'withdrawn', 'unknown',
-    name='measure_status', create_type=False
-)
+class JurisdictionLevelCode(IntEnum):
+    federal = 1
+    state = 2
+    county = 3
+    city = 4
 
-content_type_enum = ENUM(
-    'html', 'pdf', 'api', 'text',
-    name='content_type', create_type=False
-)
+
+class MeasureStatusCode(IntEnum):
+    introduced = 1
+    scheduled = 2
+    in_committee = 3
+    passed = 4
+    failed = 5
+    tabled = 6
+    withdrawn = 7
+    unknown = 8
+
+
+class ContentTypeCode(IntEnum):
+    html = 1
+    pdf = 2
+    api = 3
+    text = 4
+
+
+source_system_enum = IntEnumType(SourceSystemCode)
+jurisdiction_level_enum = IntEnumType(JurisdictionLevelCode)
+measure_status_enum = IntEnumType(MeasureStatusCode)
+content_type_enum = IntEnumType(ContentTypeCode)
 
 
 class Measure(Base):
@@ -38,7 +58,7 @@ class Measure(Base):
     """
     __tablename__ = "measures"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     source = Column(source_system_enum, nullable=False)  # Enum: congress, openstates, legistar, etc.
     external_id = Column(String, nullable=False)  # ID from source system
     title = Column(Text, nullable=False)
@@ -49,24 +69,34 @@ class Measure(Base):
     status = Column(measure_status_enum, nullable=False, default="unknown")  # Enum: introduced, scheduled, passed, failed, etc.
     introduced_at = Column(DateTime(timezone=True), nullable=True)
     scheduled_for = Column(DateTime(timezone=True), nullable=True, index=True)
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow, server_default=func.now())
     
-    topic_tags = Column(ARRAY(String), nullable=False, default=[])
+    topic_tags = Column(ARRAY(String), nullable=True)  # NULL when untagged; readers coerce to []
     summary_short = Column(Text, nullable=True)
     summary_long = Column(Text, nullable=True)
     
     canonical_key = Column(String, nullable=True, index=True)  # For deduplication
     
     # Relationships
-    division = relationship("Division", back_populates="measures")
-    sources = relationship("MeasureSource", back_populates="measure", cascade="all, delete-orphan")
-    status_events = relationship("MeasureStatusEvent", back_populates="measure", cascade="all, delete-orphan")
-    vote_events = relationship("VoteEvent", back_populates="measure", cascade="all, delete-orphan")
+    # Small per-measure collections load eagerly; user_votes/match_results grow
+    # with the user base, so they stay on the default lazy loader
+    division = relationship("Division", back_populates="measures", lazy="joined")
+    sources = relationship("MeasureSource", back_populates="measure", cascade="all, delete-orphan", lazy="selectin")
+    status_events = relationship("MeasureStatusEvent", back_populates="measure", cascade="all, delete-orphan", lazy="selectin")
+    vote_events = relationship("VoteEvent", back_populates="measure", cascade="all, delete-orphan", lazy="selectin")
     user_votes = relationship("UserVote", back_populates="measure", cascade="all, delete-orphan")
     match_results = relationship("MatchResult", back_populates="measure", cascade="all, delete-orphan")
     
     __table_args__ = (
         UniqueConstraint('source', 'external_id', name='uq_measure_source_external_id'),
+        # Upcoming feed: only the statuses FeedMode.UPCOMING filters on
+        Index(
+            'idx_measures_level_scheduled_upcoming', 'level', 'scheduled_for',
+            # introduced, scheduled, in_committee (MeasureStatusCode)
+            postgresql_where=text("status IN (1, 2, 3)"),
+        ),
+        # Topic/category filters use array overlap (&&)
+        Index('idx_measures_topic_tags_gin', 'topic_tags', postgresql_using='gin'),
     )
     
     def __repr__(self):
@@ -79,7 +109,7 @@ class MeasureSource(Base):
     """
     __tablename__ = "measure_sources"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     measure_id = Column(UUID(as_uuid=True), ForeignKey("measures.id", ondelete="CASCADE"), nullable=False)
     label = Column(String, nullable=False)  # e.g., "Official page", "Agenda PDF"
     url = Column(Text, nullable=False)
@@ -99,15 +129,20 @@ class MeasureStatusEvent(Base):
     """
     __tablename__ = "measure_status_events"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    measure_id = Column(UUID(as_uuid=True), ForeignKey("measures.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    measure_id = Column(UUID(as_uuid=True), ForeignKey("measures.id", ondelete="CASCADE"), nullable=False)
     status = Column(measure_status_enum, nullable=False)  # Enum: same as measure.status
-    effective_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    effective_at = Column(DateTime(timezone=True), nullable=False)
     source_url = Column(Text, nullable=True)
     raw_ref = Column(Text, nullable=True)  # Reference to blob storage (S3/GCS) if needed
     
     # Relationships
     measure = relationship("Measure", back_populates="status_events")
+
+    __table_args__ = (
+        # Per-measure timeline; also serves plain measure_id lookups
+        Index('idx_measure_status_events_measure', 'measure_id', effective_at.desc()),
+    )
     
     def __repr__(self):
         return f"<MeasureStatusEvent(id={self.id}, measure_id={self.measure_id}, status={self.status})>"
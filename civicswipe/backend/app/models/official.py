@@ -5,9 +5,8 @@ from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, UniqueCons
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 
-from app.core.database import Base
+from app.core.database import Base, uuid7, utcnow
 
 
 class Official(Base):
@@ -16,7 +15,7 @@ class Official(Base):
     """
     __tablename__ = "officials"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     external_id = Column(String, unique=True, nullable=True, index=True)  # From external API (Open States, etc.)
     name = Column(String, nullable=False)
     office = Column(String, nullable=True)  # e.g., "U.S. Senator", "State Representative"
@@ -26,11 +25,12 @@ class Official(Base):
     photo_url = Column(String, nullable=True)  # Official portrait URL
     bioguide_id = Column(String, nullable=True, index=True)  # Congress bioguide ID
     lis_member_id = Column(String, nullable=True, index=True)  # Senate LIS member ID (e.g. "S354")
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow, server_default=func.now())
     
     # Relationships
-    divisions = relationship("OfficialDivision", back_populates="official", cascade="all, delete-orphan")
+    divisions = relationship("OfficialDivision", back_populates="official", cascade="all, delete-orphan", lazy="selectin")
     user_officials = relationship("UserOfficial", back_populates="official", cascade="all, delete-orphan")
+    # votes holds every roll call the official has cast, so it stays lazy
     votes = relationship("OfficialVote", back_populates="official", cascade="all, delete-orphan")
     
     def __repr__(self):
@@ -51,8 +51,8 @@ class OfficialDivision(Base):
     role = Column(String, nullable=True)  # "member", "chair", etc.
     
     # Relationships
-    official = relationship("Official", back_populates="divisions")
-    division = relationship("Division", back_populates="official_divisions")
+    official = relationship("Official", back_populates="divisions", lazy="joined")
+    division = relationship("Division", back_populates="official_divisions", lazy="joined")
     
     def __repr__(self):
         return f"<OfficialDivision(official_id={self.official_id}, division_id={self.division_id})>"
@@ -0,0 +1,37 @@
+"""
+Custom SQLAlchemy column types
+"""
+from enum import IntEnum
+from typing import Type
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class IntEnumType(TypeDecorator):
+    """
+    Stores an enum label as a SMALLINT code.
+
+    ORM code keeps reading and writing the string labels ('passed', 'html', ...);
+    only the database sees the integer value of the matching enum_cls member.
+    Codes are persisted, so new members get new numbers and existing numbers
+    never change.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: Type[IntEnum]):
+        super().__init__()
+        self.enum_cls = enum_cls
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, self.enum_cls):
+            return value.value
+        return self.enum_cls[value].value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_cls(value).name
@@ -1,52 +1,70 @@
 """
 SQLAlchemy models for users and profiles
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, ARRAY, LargeBinary, Enum, Numeric
-from sqlalchemy.dialects.postgresql import UUID, BYTEA, ENUM
+from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, ARRAY, LargeBinary, Enum, Float, SmallInteger, Index, CheckConstraint
+from sqlalchemy.dialects.postgresql import UUID, BYTEA, CITEXT
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-import uuid
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, uuid7, utcnow
+from app.models.types import IntEnumType
 
 
-# Define the auth_provider enum to match the database
-class AuthProviderEnum(str, enum.Enum):
-    password = "password"
-    google = "google"
-    apple = "apple"
+# SMALLINT codes for users.provider (see database/008); append only, never renumber
+class AuthProviderEnum(enum.IntEnum):
+    password = 1
+    google = 2
+    apple = 3
 
 
-# Create PostgreSQL ENUM type that references the existing database enum
-auth_provider_enum = ENUM('password', 'google', 'apple', name='auth_provider', create_type=False)
+auth_provider_enum = IntEnumType(AuthProviderEnum)
+
+# Storage-level guard for state columns (schemas.py validates the same set)
+_VALID_STATE_SQL = "state IN ({})".format(", ".join(f"'{code}'" for code in (
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC',
+)))
 
 
 class User(Base):
     """User account"""
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String, unique=True, index=True, nullable=True)
-    phone = Column(String, unique=True, index=True, nullable=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    # citext (as in the SQL schema) so lookups bind as citext and compare
+    # case-insensitively against the unique index
+    email = Column(CITEXT, unique=True, index=True, nullable=True)
+    phone = Column(CITEXT, unique=True, index=True, nullable=True)
     provider = Column(auth_provider_enum, nullable=False, default='password')
     password_hash = Column(Text, nullable=True)
     first_name = Column(String(100), nullable=True)
     last_name = Column(String(100), nullable=True)
     birthday = Column(DateTime, nullable=True)
+    birth_year = Column(SmallInteger, nullable=True)  # Derived from birthday, for age-range queries
     state = Column(String(2), nullable=True, index=True)  # Required state for filtering legislation
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     last_login_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
-    profile = relationship("UserProfile", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    preferences = relationship("UserPreferences", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    divisions = relationship("UserDivision", back_populates="user", cascade="all, delete-orphan")
-    officials = relationship("UserOfficial", back_populates="user", cascade="all, delete-orphan")
+    # votes/match_results are unbounded history and stay lazy; User is loaded
+    # on every authenticated request
+    profile = relationship("UserProfile", back_populates="user", uselist=False, cascade="all, delete-orphan", lazy="joined")
+    preferences = relationship("UserPreferences", back_populates="user", uselist=False, cascade="all, delete-orphan", lazy="joined")
+    divisions = relationship("UserDivision", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
+    officials = relationship("UserOfficial", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
     votes = relationship("UserVote", back_populates="user", cascade="all, delete-orphan")
     match_results = relationship("MatchResult", back_populates="user", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        Index('idx_users_birth_year', 'birth_year'),
+        CheckConstraint(_VALID_STATE_SQL, name='ck_user_valid_state'),
+    )
+    
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email})>"
 
@@ -57,27 +75,32 @@ class UserProfile(Base):
     
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     
-    # Encrypted address fields
-    address_line1_enc = Column(BYTEA, nullable=False)
-    address_line2_enc = Column(BYTEA, nullable=True)
+    # Encrypted address fields. Deferred so the ciphertext isn't fetched with
+    # every profile load; callers that decrypt must undefer() them explicitly
+    address_line1_enc = deferred(Column(BYTEA, nullable=False), raiseload=True)
+    address_line2_enc = deferred(Column(BYTEA, nullable=True), raiseload=True)
     city = Column(String, nullable=False, index=True)
     state = Column(String, nullable=False, index=True)
     postal_code = Column(String, nullable=False, index=True)
     country = Column(String, nullable=False, default="US")
     
-    # Geospatial (numeric(9,6) in database)
-    lat = Column(Numeric(9, 6), nullable=True)
-    lon = Column(Numeric(9, 6), nullable=True)
+    # Geospatial (double precision in database)
+    lat = Column(Float(precision=53), nullable=True)
+    lon = Column(Float(precision=53), nullable=True)
     
     # Address hash for deduplication
     address_hash = Column(String, nullable=False, unique=True, index=True)
     
     timezone = Column(String, nullable=False, default="America/Phoenix")
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow, server_default=func.now())
     
     # Relationships
     user = relationship("User", back_populates="profile")
     
+    __table_args__ = (
+        CheckConstraint(_VALID_STATE_SQL, name='ck_user_profile_valid_state'),
+    )
+    
     def __repr__(self):
         return f"<UserProfile(user_id={self.user_id}, city={self.city}, state={self.state})>"
 
@@ -87,9 +110,9 @@ class UserPreferences(Base):
     __tablename__ = "user_preferences"
     
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
-    topics = Column(ARRAY(String), nullable=False, default=[])
+    topics = Column(ARRAY(String), nullable=True)  # NULL when none selected; readers coerce to []
     notify_enabled = Column(Boolean, nullable=False, default=True)
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow, server_default=func.now())
     
     # Relationships
     user = relationship("User", back_populates="preferences")
@@ -1,13 +1,36 @@
 """
 SQLAlchemy models for votes (official roll calls and user votes)
 """
-from sqlalchemy import Column, String, ForeignKey, DateTime, Text, UniqueConstraint, Numeric
+from sqlalchemy import Column, String, ForeignKey, DateTime, Text, UniqueConstraint, Float, Index, Boolean, ForeignKeyConstraint, CheckConstraint, Integer
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
+from enum import IntEnum
 
-from app.core.database import Base
+from app.core.database import Base, uuid7, utcnow
+from app.models.measure import measure_status_enum
+from app.models.types import IntEnumType
+
+
+# SMALLINT codes for vote columns (see database/011); append only, never renumber
+class UserVoteCode(IntEnum):
+    no = 0
+    yes = 1
+    skip = 2  # Read paths filter on it; ck_user_vote_value does not accept it yet
+
+
+class OfficialVoteCode(IntEnum):
+    yea = 1
+    nay = 2
+    abstain = 3
+    absent = 4
+    present = 5
+    not_voting = 6
+    unknown = 7
+
+
+user_vote_enum = IntEnumType(UserVoteCode)
+official_vote_enum = IntEnumType(OfficialVoteCode)
 
 
 class VoteEvent(Base):
@@ -16,7 +39,7 @@ class VoteEvent(Base):
     """
     __tablename__ = "vote_events"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     measure_id = Column(UUID(as_uuid=True), ForeignKey("measures.id", ondelete="CASCADE"), nullable=False, index=True)
     
     body = Column(String, nullable=False)  # e.g., "U.S. House", "AZ Senate", "Phoenix City Council"
@@ -24,9 +47,9 @@ class VoteEvent(Base):
     
     scheduled_for = Column(DateTime(timezone=True), nullable=True)
     held_at = Column(DateTime(timezone=True), nullable=True, index=True)
-    result = Column(String, nullable=False, default="unknown")  # Enum: passed, failed, tabled, unknown
+    result = Column(measure_status_enum, nullable=False, default="unknown")  # Enum: passed, failed, tabled, unknown
     
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow, server_default=func.now())
     
     # Relationships
     measure = relationship("Measure", back_populates="vote_events")
@@ -44,11 +67,11 @@ class OfficialVote(Base):
     
     vote_event_id = Column(UUID(as_uuid=True), ForeignKey("vote_events.id", ondelete="CASCADE"), primary_key=True)
     official_id = Column(UUID(as_uuid=True), ForeignKey("officials.id", ondelete="CASCADE"), primary_key=True)
-    vote = Column(String, nullable=False, default="unknown")  # Enum: yea, nay, abstain, absent, present, not_voting, unknown
+    vote = Column(official_vote_enum, nullable=False, default="unknown")  # Enum: yea, nay, abstain, absent, present, not_voting, unknown
     
     # Relationships
     vote_event = relationship("VoteEvent", back_populates="official_votes")
-    official = relationship("Official", back_populates="votes")
+    official = relationship("Official", back_populates="votes", lazy="joined")
     
     def __repr__(self):
         return f"<OfficialVote(vote_event_id={self.vote_event_id}, official_id={self.official_id}, vote={self.vote})>"
@@ -60,11 +83,11 @@ class UserVote(Base):
     """
     __tablename__ = "user_votes"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     measure_id = Column(UUID(as_uuid=True), ForeignKey("measures.id", ondelete="CASCADE"), nullable=False, index=True)
-    vote = Column(String, nullable=False)  # Enum: yes, no
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+    vote = Column(user_vote_enum, nullable=False)  # Enum: yes, no
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     # Relationships
     user = relationship("User", back_populates="votes")
@@ -72,6 +95,13 @@ class UserVote(Base):
     
     __table_args__ = (
         UniqueConstraint('user_id', 'measure_id', name='uq_user_vote_user_measure'),
+        CheckConstraint('vote IN (0, 1)', name='ck_user_vote_value'),
+        # Recent votes per user (dashboard, My Votes) as an index-only scan;
+        # id breaks created_at ties for the My Votes keyset cursor
+        Index(
+            'idx_user_votes_user_created_id_covering', 'user_id', created_at.desc(), id.desc(),
+            postgresql_include=['measure_id', 'vote'],
+        ),
     )
     
     def __repr__(self):
@@ -88,13 +118,80 @@ class MatchResult(Base):
     measure_id = Column(UUID(as_uuid=True), ForeignKey("measures.id", ondelete="CASCADE"), primary_key=True)
     
     computed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    match_score = Column(Numeric(4, 3), nullable=False, default=0.000)  # 0.000 to 1.000
-    breakdown = Column(JSONB, nullable=False, default={})  # Per-official comparison details
+    match_score = Column(Float(precision=24), nullable=False, default=0.0)  # real; 0.000 to 1.000
+    breakdown = Column(JSONB, nullable=True)  # Deprecated: superseded by match_result_officials, no longer written
     notes = Column(Text, nullable=True)
     
     # Relationships
     user = relationship("User", back_populates="match_results")
     measure = relationship("Measure", back_populates="match_results")
+    officials = relationship("MatchResultOfficial", back_populates="match_result", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Matches list keyset order: (computed_at DESC, measure_id DESC) per user
+        Index('idx_match_results_user_computed', 'user_id', computed_at.desc(), measure_id.desc()),
+    )
     
     def __repr__(self):
         return f"<MatchResult(user_id={self.user_id}, measure_id={self.measure_id}, match_score={self.match_score})>"
+
+
+class MatchResultOfficial(Base):
+    """
+    Per-official comparison behind a MatchResult
+    """
+    __tablename__ = "match_result_officials"
+    
+    # measure_id leads so a measure's rows can be replaced on recompute
+    measure_id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    official_id = Column(UUID(as_uuid=True), ForeignKey("officials.id", ondelete="CASCADE"), primary_key=True)
+    official_vote = Column(String, nullable=False, default="unknown")  # Enum: same as official_votes.vote
+    matches_user = Column(Boolean, nullable=False, default=False)
+    
+    # Relationships
+    match_result = relationship("MatchResult", back_populates="officials")
+    official = relationship("Official")
+    
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['user_id', 'measure_id'],
+            ['match_results.user_id', 'match_results.measure_id'],
+            ondelete="CASCADE",
+        ),
+        # Per-official alignment across all of a user's measures
+        Index('idx_match_result_officials_user_official', 'user_id', 'official_id'),
+    )
+    
+    def __repr__(self):
+        return f"<MatchResultOfficial(user_id={self.user_id}, measure_id={self.measure_id}, official_id={self.official_id})>"
+
+
+class UserStats(Base):
+    """
+    Per-user dashboard counters, maintained incrementally on each vote
+    change and measure status change (see app/services/user_stats.py)
+    """
+    __tablename__ = "user_stats"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total_votes = Column(Integer, nullable=False, default=0)
+    yea_votes = Column(Integer, nullable=False, default=0)
+    nay_votes = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+    measures_passed = Column(Integer, nullable=False, default=0)
+    measures_failed = Column(Integer, nullable=False, default=0)
+    measures_pending = Column(Integer, nullable=False, default=0)
+    # Alignment numerators (vote matched outcome) and denominators (measure has an outcome)
+    alignment_matches = Column(Integer, nullable=False, default=0)
+    alignment_total = Column(Integer, nullable=False, default=0)
+    house_matches = Column(Integer, nullable=False, default=0)
+    house_total = Column(Integer, nullable=False, default=0)
+    senate_matches = Column(Integer, nullable=False, default=0)
+    senate_total = Column(Integer, nullable=False, default=0)
+    congress_matches = Column(Integer, nullable=False, default=0)
+    congress_total = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow, server_default=func.now())
+    
+    def __repr__(self):
+        return f"<UserStats(user_id={self.user_id}, total_votes={self.total_votes})>"
@@ -9,6 +9,18 @@ from uuid import UUID
 import re
 
 
+# Validator lookups, built once at import
+_VALID_STATES = frozenset({
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC',
+})
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_NAME_RE = re.compile(r"^[a-zA-Z\s\-'.]+$")
+
+
 # Enums
 class JurisdictionLevel(str, Enum):
     FEDERAL = "federal"
@@ -64,6 +76,13 @@ class Address(BaseModel):
     postal_code: str = Field(..., min_length=5, max_length=10)
     country: str = Field(default="US", min_length=2, max_length=2)
 
+    @field_validator('state')
+    @classmethod
+    def validate_state(cls, v):
+        if v.upper() not in _VALID_STATES:
+            raise ValueError('Invalid US state code')
+        return v.upper()
+
 
 class AddressPublic(BaseModel):
     """Public address info (no line1/line2)"""
@@ -86,14 +105,7 @@ class UserSignup(BaseModel):
     @field_validator('state')
     @classmethod
     def validate_state(cls, v):
-        valid_states = [
-            'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-            'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-            'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-            'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
-        ]
-        if v.upper() not in valid_states:
+        if v.upper() not in _VALID_STATES:
             raise ValueError('Invalid US state code')
         return v.upper()
 
@@ -176,14 +188,14 @@ class ProfileUpdateRequest(BaseModel):
         if v is None:
             return v
         # Strip HTML tags
-        v = re.sub(r'<[^>]+>', '', v)
+        v = _HTML_TAG_RE.sub('', v)
         # Strip leading/trailing whitespace
         v = v.strip()
         # Reject if empty after stripping
         if not v:
             raise ValueError('Name cannot be empty')
         # Only allow letters, spaces, hyphens, apostrophes, periods
-        if not re.match(r"^[a-zA-Z\s\-'.]+$", v):
+        if not _NAME_RE.match(v):
             raise ValueError('Name contains invalid characters')
         return v
 
@@ -9,15 +9,25 @@ Works for all 50 US states + DC.
 API docs: https://api.congress.gov/
 Census Geocoder: https://geocoding.geo.census.gov/geocoder/
 """
-import httpx
-from typing import Optional, List, Dict, Any
+import asyncio
+import re
+import time
+import aiohttp
+import orjson
+from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import update, tuple_
+from sqlalchemy.dialects.postgresql import insert
 import logging
 
 from app.core.config import settings
-from app.core.cache import cache_get, cache_set, cache_delete, congress_members_key, reps_key
+from app.core.database import utcnow
+from app.core.cache import (
+    cache_get, cache_set, cache_delete, cache_delete_many, cache_delete_pattern, jittered_ttl,
+    congress_members_key, census_district_key, reps_key,
+)
 from app.models import Official, UserOfficial, OfficialDivision, Division
+from app.schemas import _VALID_STATES
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +37,201 @@ CENSUS_GEOCODER_BASE = "https://geocoding.geo.census.gov/geocoder"
 # Current congress number
 CURRENT_CONGRESS = 119
 
+# Census geographies key for the current districts; other vintages are
+# found by scanning for "Congressional"
+PREFERRED_CD_KEY = f"{CURRENT_CONGRESS}th Congressional Districts"
+
+# Both upstreams are idempotent GETs: give each attempt a tight per-phase
+# budget and retry a hung or failed attempt rather than waiting out a long
+# single-shot timeout
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_connect=3, sock_read=5)
+MAX_RETRIES = 2
+BACKOFF_BASE_SECONDS = 0.2
+BACKOFF_MAX_SECONDS = 2.0
+
+# Open a breaker after this many consecutive failures; retry after the cooldown
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 30.0
+
+# Member cache warm-up: concurrent Congress.gov requests, and how often to
+# re-check for states whose entry expired or was invalidated
+WARM_CONCURRENCY = 8
+WARM_INTERVAL_SECONDS = 3600
+
+# Bulk refresh: concurrent Census lookups, and users per link-replace statement
+BULK_GEOCODE_CONCURRENCY = 8
+BULK_LINK_CHUNK = 1000
+
+# Census district cache lifetimes (seconds)
+DISTRICT_CACHE_TTL = 30 * 24 * 3600
+DISTRICT_MISS_TTL = 3600
+
+# USPS-style abbreviations so "123 Main Street" and "123 main st." share a cache entry
+_STREET_ABBREVIATIONS = {
+    "STREET": "ST", "AVENUE": "AVE", "ROAD": "RD", "DRIVE": "DR",
+    "BOULEVARD": "BLVD", "LANE": "LN", "COURT": "CT", "PLACE": "PL",
+    "PARKWAY": "PKWY", "HIGHWAY": "HWY", "CIRCLE": "CIR", "TERRACE": "TER",
+    "TRAIL": "TRL", "SUITE": "STE", "APARTMENT": "APT",
+    "NORTH": "N", "SOUTH": "S", "EAST": "E", "WEST": "W",
+    "NORTHEAST": "NE", "NORTHWEST": "NW", "SOUTHEAST": "SE", "SOUTHWEST": "SW",
+}
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9 ]+")
+
+
+def _normalize_street(street: str) -> str:
+    """Uppercase, drop punctuation, collapse whitespace and abbreviate street words."""
+    words = _NON_ALNUM_RE.sub(" ", (street or "").upper()).split()
+    return " ".join(_STREET_ABBREVIATIONS.get(w, w) for w in words)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Timeouts, connection errors and 5xx responses are worth another attempt."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500
+    return isinstance(exc, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+
+
+def _district_from(districts: Optional[List[Dict]]) -> Optional[int]:
+    """District number from a Census geographies entry, or None."""
+    if not districts:
+        return None
+    cd = districts[0].get("BASENAME", districts[0].get("CD119FP", districts[0].get("CD", "")))
+    if cd is not None and str(cd).isdigit():
+        return int(cd)
+    return None
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """
+    aiohttp session for Congress.gov and the Census Geocoder. Idle
+    connections to both hosts stay warm between user refreshes, and DNS
+    answers are cached instead of resolved per request.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=32,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Fails fast after `threshold` consecutive upstream failures instead of
+    letting every caller wait out the timeout. After `cooldown` seconds one
+    trial call is let through (half-open); its outcome closes the circuit
+    or re-opens it for another cooldown.
+
+    Used as `async with breaker:` around a request. Timeouts, connection
+    errors and 5xx responses count as failures; 4xx responses mean the
+    upstream is up, so they don't.
+    """
+
+    def __init__(self, name: str, threshold: int = BREAKER_FAILURE_THRESHOLD, cooldown: float = BREAKER_COOLDOWN_SECONDS):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    async def __aenter__(self):
+        if self.opened_at is not None:
+            if self._trial_in_flight or time.monotonic() - self.opened_at < self.cooldown:
+                raise CircuitOpenError(f"{self.name} circuit open, skipping request")
+            self._trial_in_flight = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._trial_in_flight = False
+        if exc is not None and not isinstance(exc, Exception):
+            return False  # cancelled, says nothing about the upstream
+        upstream_ok = exc is None or (
+            isinstance(exc, aiohttp.ClientResponseError) and exc.status < 500
+        )
+        if upstream_ok:
+            if self.opened_at is not None:
+                logger.info(f"{self.name} circuit closed")
+            self.failures = 0
+            self.opened_at = None
+        else:
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.threshold:
+                if self.opened_at is None:
+                    logger.warning(f"{self.name} circuit opened after {self.failures} consecutive failures")
+                self.opened_at = time.monotonic()
+        return False
+
+
+def _parse_member(member: Dict, term: Dict, state_code: str = "") -> Dict[str, Any]:
+    """Parse a Congress.gov member response into our standard format."""
+    bioguide_id = member.get("bioguideId", "")
+    chamber = term.get("chamber", "")
+    district = member.get("district")  # top-level, not in term
+
+    if chamber == "Senate":
+        office = "U.S. Senator"
+        chamber_key = "us_senate"
+        district_label = state_code.upper()
+    else:
+        office = "U.S. Representative"
+        chamber_key = "us_house"
+        district_label = f"CD-{int(district):02d}" if district else ""
+
+    return {
+        "bioguide_id": bioguide_id,
+        "name": member.get("name", ""),
+        "party": term.get("party", member.get("partyName", "")),
+        "office": office,
+        "chamber": chamber_key,
+        "district_label": district_label,
+        "state": state_code.upper(),
+        "photo_url": member.get("depiction", {}).get("imageUrl", ""),
+    }
+
+
+def _index_members(members: List[Dict], state_code: str) -> Dict[str, Any]:
+    """
+    Parse a state's raw member list once, at cache-fill time:
+    {"senators": [rep, ...], "house_by_district": {"3": rep, ...}}.
+
+    Senators are identified by the absence of a top-level 'district' field
+    and by having at least one Senate term; House reps are keyed by
+    member['district'] (a string, since the index is stored as JSON).
+    """
+    senators = []
+    house_by_district: Dict[str, Dict[str, Any]] = {}
+    for member in members:
+        terms = member.get("terms", {}).get("item", [])
+        # Keep the first listed term per chamber
+        terms_by_chamber: Dict[str, Dict] = {}
+        for t in terms:
+            terms_by_chamber.setdefault(t.get("chamber"), t)
+        member_district = member.get("district")
+
+        if member_district is None:
+            senate_term = terms_by_chamber.get("Senate")
+            if senate_term:
+                senators.append(_parse_member(member, senate_term, state_code))
+            continue
+
+        try:
+            district_key = str(int(member_district))
+        except (TypeError, ValueError):
+            logger.warning(f"Skipping member with unparseable district {member_district!r} in {state_code}")
+            continue
+        if district_key in house_by_district:
+            continue
+        term = terms_by_chamber.get("House of Representatives") or (terms[0] if terms else {})
+        house_by_district[district_key] = _parse_member(member, term, state_code)
+
+    return {"senators": senators, "house_by_district": house_by_district}
+
 
 class CongressApiService:
     """
@@ -34,39 +239,92 @@ class CongressApiService:
     using Congress.gov API and Census Geocoder for district resolution.
     Works for all 50 US states + DC.
 
-    Maintains a shared httpx connection pool (created at startup).
+    Maintains a shared aiohttp session / connection pool (created at startup).
     """
 
     def __init__(self):
-        self._client: Optional[httpx.AsyncClient] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # The two upstreams fail independently, so each gets its own breaker
+        self._congress_breaker = CircuitBreaker("Congress.gov")
+        self._census_breaker = CircuitBreaker("Census Geocoder")
+        self._warm_task: Optional[asyncio.Task] = None
 
     async def startup(self):
-        """Create persistent httpx pool (called from lifespan)."""
-        self._client = httpx.AsyncClient(timeout=30.0)
+        """
+        Create persistent aiohttp session and start warming the member
+        cache in the background (called from lifespan).
+        """
+        self._session = _new_session()
+        self._session_loop = asyncio.get_running_loop()
+        self._warm_task = asyncio.create_task(self._warm_loop())
 
     async def shutdown(self):
-        """Close httpx pool on app shutdown."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Stop the warm-up loop and close aiohttp session on app shutdown."""
+        if self._warm_task:
+            self._warm_task.cancel()
+            await asyncio.gather(self._warm_task, return_exceptions=True)
+            self._warm_task = None
+        if self._session:
+            await self._session.close()
+            self._session = None
 
     @property
-    def client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            # Fallback for tests or if startup wasn't called
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+    def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # Fallback for tests, if startup wasn't called, or for Celery
+            # tasks, which run each task on a fresh event loop that the
+            # previous session isn't bound to
+            self._retire_session(loop)
+            self._session = _new_session()
+            self._session_loop = loop
+        return self._session
+
+    def _retire_session(self, loop: asyncio.AbstractEventLoop):
+        """
+        Close a session left over from another event loop before it's
+        replaced. A live loop closes it itself; a closed loop (a finished
+        Celery task) has nothing left to wait on, so the close only marks
+        the pool closed and can run here.
+        """
+        old, old_loop = self._session, self._session_loop
+        self._session = None
+        if old is None or old.closed:
+            return
+        if old_loop is not None and not old_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(old.close(), old_loop)
+        else:
+            loop.create_task(old.close())
 
     async def _congress_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Make a request to the Congress.gov API."""
         url = f"{CONGRESS_API_BASE}{endpoint}"
         params = params or {}
-        params["api_key"] = settings.CONGRESS_API_KEY
+        params["api_key"] = settings.CONGRESS_API_KEY or ""
         params["format"] = "json"
 
-        response = await self.client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params, self._congress_breaker)
+
+    async def _get_json(self, url: str, params: Dict, breaker: CircuitBreaker) -> Dict:
+        """
+        GET url and decode the JSON body, retrying timeouts, connection errors
+        and 5xx responses up to MAX_RETRIES times with exponential backoff.
+        The breaker wraps the whole retried call, so one exhausted request
+        counts as a single failure.
+        """
+        async with breaker:
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    async with self.session.get(url, params=params) as response:
+                        response.raise_for_status()
+                        return orjson.loads(await response.read())
+                except Exception as e:
+                    if attempt == MAX_RETRIES or not _is_retryable(e):
+                        raise
+                    backoff = min(BACKOFF_BASE_SECONDS * 2 ** attempt, BACKOFF_MAX_SECONDS)
+                    logger.warning(f"{breaker.name} request failed ({e!r}), retrying in {backoff:.1f}s")
+                    await asyncio.sleep(backoff)
 
     async def get_congressional_district(
         self,
@@ -79,53 +337,80 @@ class CongressApiService:
         Use Census Geocoder to determine congressional district from address.
         Works for any US address.
 
+        Results are cached per normalized address: 30 days for a district
+        (boundaries only move with redistricting), 1 hour for addresses the
+        geocoder can't place. Lookup errors are not cached.
+
         Returns:
             Congressional district number, or None if lookup fails.
         """
-        try:
-            url = f"{CENSUS_GEOCODER_BASE}/geographies/address"
-            params = {
-                "street": street,
-                "city": city,
-                "state": state,
-                "zip": zip_code,
-                "benchmark": "Public_AR_Current",
-                "vintage": "Current_Current",
-                "layers": "54",  # Congressional Districts
-                "format": "json",
-            }
+        key = census_district_key(state, zip_code, _normalize_street(street))
+        cached = await cache_get(key)
+        if cached is not None:
+            return cached["cd"]
 
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        try:
+            district = await self._lookup_district(street, city, state, zip_code)
+        except Exception as e:
+            logger.error(f"Census Geocoder lookup failed: {e}")
+            return None
 
-            matches = data.get("result", {}).get("addressMatches", [])
-            if not matches:
-                logger.warning(f"No address match from Census Geocoder for {city}, {state}")
-                return None
+        if district is not None:
+            ttl = jittered_ttl(DISTRICT_CACHE_TTL, 24 * 3600)
+        else:
+            ttl = jittered_ttl(DISTRICT_MISS_TTL, 300)
+        await cache_set(key, {"cd": district}, ttl=ttl)
+        return district
 
-            geographies = matches[0].get("geographies", {})
+    async def _lookup_district(
+        self,
+        street: str,
+        city: str,
+        state: str,
+        zip_code: str
+    ) -> Optional[int]:
+        """Census Geocoder request; None when the address has no district, raises on errors."""
+        url = f"{CENSUS_GEOCODER_BASE}/geographies/address"
+        params = {
+            "street": street,
+            "city": city,
+            "state": state,
+            "zip": zip_code,
+            "benchmark": "Public_AR_Current",
+            "vintage": "Current_Current",
+            "layers": "54",  # Congressional Districts
+            "format": "json",
+        }
 
-            # Look for congressional district in any matching key
-            for key in geographies:
-                if "Congressional" in key:
-                    districts = geographies[key]
-                    if districts:
-                        cd = districts[0].get("BASENAME", districts[0].get("CD119FP", districts[0].get("CD", "")))
-                        if cd is not None and str(cd).isdigit():
-                            return int(cd)
+        data = await self._get_json(url, params, self._census_breaker)
 
-            logger.warning(f"No congressional district found for {city}, {state}")
+        matches = data.get("result", {}).get("addressMatches", [])
+        if not matches:
+            logger.warning(f"No address match from Census Geocoder for {city}, {state}")
             return None
 
-        except Exception as e:
-            logger.error(f"Census Geocoder lookup failed: {e}")
-            return None
+        geographies = matches[0].get("geographies", {})
+
+        # The current vintage's key is a direct lookup; scan for any
+        # congressional district key only when it's missing
+        cd = _district_from(geographies.get(PREFERRED_CD_KEY))
+        if cd is not None:
+            return cd
+        for key in geographies:
+            if "Congressional" in key:
+                cd = _district_from(geographies[key])
+                if cd is not None:
+                    return cd
+
+        logger.warning(f"No congressional district found for {city}, {state}")
+        return None
 
-    async def _get_state_members(self, state_code: str) -> List[Dict]:
+    async def _get_state_members(self, state_code: str) -> Dict[str, Any]:
         """
-        Fetch all current Congress members for a state.
-        Cached in Redis for 1 hour to avoid hammering the Congress.gov API.
+        Fetch all current Congress members for a state, indexed by chamber
+        (see _index_members). Cached in Redis for ~24 hours; membership
+        changes are pushed out with invalidate_members_cache rather than
+        waiting on the TTL.
         """
         key = congress_members_key(state_code)
         cached = await cache_get(key)
@@ -136,100 +421,85 @@ class CongressApiService:
             f"/member/{state_code.upper()}",
             params={"currentMember": "true", "limit": 60},
         )
-        members = data.get("members", [])
-        await cache_set(key, members, ttl=3600)  # 1 hour
-        return members
+        indexed = _index_members(data.get("members", []), state_code)
+        await cache_set(key, indexed, ttl=jittered_ttl(24 * 3600, 3600))  # ~24 hours
+        return indexed
 
-    async def get_senators_by_state(self, state_code: str) -> List[Dict[str, Any]]:
+    async def _warm_caches(self):
         """
-        Fetch current senators for a given state.
-
-        Senators are identified by the absence of a top-level 'district' field
-        and by having at least one Senate term.
+        Fill the member cache for every state, WARM_CONCURRENCY at a time, so
+        the first user from each state gets a cache hit. States that are
+        already cached cost one Redis GET.
         """
-        try:
-            members = await self._get_state_members(state_code)
-
-            senators = []
-            for member in members:
-                if member.get("district") is not None:
-                    continue
+        semaphore = asyncio.Semaphore(WARM_CONCURRENCY)
 
-                terms = member.get("terms", {}).get("item", [])
-                senate_term = None
-                for t in terms:
-                    if t.get("chamber") == "Senate":
-                        senate_term = t
-                        break
+        async def warm(state_code: str):
+            async with semaphore:
+                await self._get_state_members(state_code)
 
-                if senate_term:
-                    senators.append(self._parse_member(member, senate_term, state_code))
+        results = await asyncio.gather(
+            *(warm(s) for s in sorted(_VALID_STATES)), return_exceptions=True
+        )
+        failed = sum(isinstance(r, Exception) for r in results)
+        if failed:
+            logger.warning(f"Congress member cache warm-up failed for {failed} states")
+
+    async def _warm_loop(self):
+        """Warm at startup, then hourly to refill expired or invalidated states."""
+        while True:
+            try:
+                await self._warm_caches()
+            except Exception as e:
+                logger.error(f"Congress member cache warm-up error: {e}")
+            await asyncio.sleep(WARM_INTERVAL_SECONDS)
+
+    async def invalidate_members_cache(self, state_code: Optional[str] = None):
+        """
+        Drop the cached member list for one state, or for every state when
+        state_code is None (admin action after a resignation/special
+        election, and the nightly refresh task).
+        """
+        if state_code:
+            await cache_delete(congress_members_key(state_code))
+        else:
+            await cache_delete_pattern(congress_members_key("*"))
 
-            return senators
+    async def get_senators_by_state(
+        self, state_code: str, members: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch current senators for a given state. Pass members (the indexed
+        form from _get_state_members) to skip fetching it again.
+        """
+        try:
+            if members is None:
+                members = await self._get_state_members(state_code)
+            return members["senators"]
 
         except Exception as e:
             logger.error(f"Failed to fetch senators for {state_code}: {e}")
             return []
 
     async def get_house_rep_by_district(
-        self, state_code: str, district: int
+        self, state_code: str, district: int, members: Optional[Dict[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
-        Fetch the House representative for a state + district.
-
-        Uses the cached state member list and matches on member['district'].
+        Fetch the House representative for a state + district from the
+        indexed state member list (fetched unless members is given).
         """
         try:
-            members = await self._get_state_members(state_code)
-
-            for member in members:
-                member_district = member.get("district")
-                if member_district is None:
-                    continue
-
-                if int(member_district) == district:
-                    terms = member.get("terms", {}).get("item", [])
-                    house_term = None
-                    for t in terms:
-                        if t.get("chamber") == "House of Representatives":
-                            house_term = t
-                            break
-                    term = house_term or (terms[0] if terms else {})
-                    return self._parse_member(member, term, state_code)
-
-            logger.warning(f"No House rep found for {state_code}-{district}")
-            return None
+            if members is None:
+                members = await self._get_state_members(state_code)
+
+            rep = members["house_by_district"].get(str(district))
+            if rep is None:
+                logger.warning(f"No House rep found for {state_code}-{district}")
+            return rep
 
         except Exception as e:
             logger.error(f"Failed to fetch House rep for {state_code}-{district}: {e}")
             return None
 
-    def _parse_member(self, member: Dict, term: Dict, state_code: str = "") -> Dict[str, Any]:
-        """Parse a Congress.gov member response into our standard format."""
-        bioguide_id = member.get("bioguideId", "")
-        chamber = term.get("chamber", "")
-        district = member.get("district")  # top-level, not in term
-
-        if chamber == "Senate":
-            office = "U.S. Senator"
-            chamber_key = "us_senate"
-            district_label = state_code.upper()
-        else:
-            office = "U.S. Representative"
-            chamber_key = "us_house"
-            district_label = f"CD-{int(district):02d}" if district else ""
-
-        return {
-            "bioguide_id": bioguide_id,
-            "name": member.get("name", ""),
-            "party": term.get("party", member.get("partyName", "")),
-            "office": office,
-            "chamber": chamber_key,
-            "district_label": district_label,
-            "state": state_code.upper(),
-            "photo_url": member.get("depiction", {}).get("imageUrl", ""),
-        }
-
     async def refresh_user_representatives(
         self,
         db: AsyncSession,
@@ -249,14 +519,28 @@ class CongressApiService:
         """
         representatives = []
 
-        # 1. Get senators by state (works for all 50 states + DC)
-        senators = await self.get_senators_by_state(state)
+        # 1. Fetch the state's members (Congress.gov) and resolve the district
+        #    (Census Geocoder) concurrently; they are independent services.
+        #    Senators and the House rep are both selected from this one list.
+        members, district = await asyncio.gather(
+            self._get_state_members(state),
+            self.get_congressional_district(street, city, state, zip_code),
+            return_exceptions=True,
+        )
+        if isinstance(members, BaseException):
+            logger.error(f"Failed to fetch Congress members for {state}: {members}")
+            members = {"senators": [], "house_by_district": {}}
+        if isinstance(district, BaseException):
+            logger.error(f"Census Geocoder lookup failed: {district}")
+            district = None
+
+        # 2. Get senators by state (works for all 50 states + DC)
+        senators = await self.get_senators_by_state(state, members)
         representatives.extend(senators)
 
-        # 2. Get congressional district and house rep
-        district = await self.get_congressional_district(street, city, state, zip_code)
+        # 3. Get house rep for the district
         if district is not None:
-            house_rep = await self.get_house_rep_by_district(state, district)
+            house_rep = await self.get_house_rep_by_district(state, district, members)
             if house_rep:
                 representatives.append(house_rep)
         else:
@@ -266,16 +550,14 @@ class CongressApiService:
             logger.warning(f"No representatives found for user {user_id} in {state}")
             return []
 
-        # 3. Upsert officials and link to user
-        official_ids = []
-        for rep in representatives:
-            official = await self._upsert_official(db, rep)
-            official_ids.append(official.id)
-
-        # 4. Replace user_officials links (deactivate old, add new)
-        await self._replace_user_officials(db, user_id, official_ids)
-
-        await db.flush()
+        # 4-5. Upsert officials and replace the user's links (deactivate old,
+        #      add new). Both are Core statements that run as they're issued,
+        #      so there is nothing left in the session to flush; the savepoint
+        #      lets callers that catch a failure here still commit their own
+        #      work (geocoding, divisions) in the same transaction.
+        async with db.begin_nested():
+            official_ids = list((await self._upsert_officials(db, representatives)).values())
+            await self._replace_user_officials(db, user_id, official_ids)
 
         # Invalidate cached reps for this user so GET /representatives re-fetches
         await cache_delete(reps_key(user_id))
@@ -284,70 +566,196 @@ class CongressApiService:
 
         return representatives
 
-    async def _upsert_official(self, db: AsyncSession, rep: Dict[str, Any]) -> Official:
-        """Insert or update an official based on bioguide_id."""
-        external_id = f"congress:{rep['bioguide_id']}"
+    async def refresh_user_representatives_bulk(
+        self,
+        db: AsyncSession,
+        users: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """
+        refresh_user_representatives for many users at once (bulk imports).
 
-        stmt = select(Official).where(Official.external_id == external_id)
-        result = await db.execute(stmt)
-        official = result.scalar_one_or_none()
-
-        if official:
-            official.name = rep["name"]
-            official.party = rep["party"]
-            official.office = rep["office"]
-            official.chamber = rep["chamber"]
-            official.district_label = rep["district_label"]
-            official.photo_url = rep.get("photo_url")
-            official.bioguide_id = rep["bioguide_id"]
-        else:
-            official = Official(
-                external_id=external_id,
-                name=rep["name"],
-                party=rep["party"],
-                office=rep["office"],
-                chamber=rep["chamber"],
-                district_label=rep["district_label"],
-                photo_url=rep.get("photo_url"),
-                bioguide_id=rep["bioguide_id"],
+        users holds dicts with user_id, state, street, city and zip_code.
+        Member lists are fetched once per state, distinct addresses are
+        geocoded BULK_GEOCODE_CONCURRENCY at a time (through the district
+        cache), and the officials upsert and link replacement are a few
+        set-based statements for the whole batch.
+
+        Returns:
+            user_id -> number of representatives linked. Users for whom
+            nothing was found are left untouched and map to 0.
+        """
+        states = {u["state"] for u in users}
+        state_results = await asyncio.gather(
+            *(self._get_state_members(s) for s in states), return_exceptions=True
+        )
+        members_by_state = {}
+        for state, members in zip(states, state_results):
+            if isinstance(members, BaseException):
+                logger.error(f"Failed to fetch Congress members for {state}: {members}")
+                members = {"senators": [], "house_by_district": {}}
+            members_by_state[state] = members
+
+        # Users at the same address share one Census lookup
+        def address_key(u: Dict[str, Any]) -> str:
+            return census_district_key(u["state"], u["zip_code"], _normalize_street(u["street"]))
+
+        semaphore = asyncio.Semaphore(BULK_GEOCODE_CONCURRENCY)
+
+        async def lookup(u: Dict[str, Any]) -> Optional[int]:
+            async with semaphore:
+                return await self.get_congressional_district(
+                    u["street"], u["city"], u["state"], u["zip_code"]
+                )
+
+        by_address = {address_key(u): u for u in users}
+        districts = dict(zip(
+            by_address,
+            await asyncio.gather(*(lookup(u) for u in by_address.values())),
+        ))
+
+        reps_by_user: Dict[str, List[Dict[str, Any]]] = {}
+        for u in users:
+            members = members_by_state[u["state"]]
+            reps = list(members["senators"])
+            district = districts[address_key(u)]
+            if district is not None:
+                house_rep = members["house_by_district"].get(str(district))
+                if house_rep:
+                    reps.append(house_rep)
+            if reps:
+                reps_by_user[str(u["user_id"])] = reps
+
+        counts = {str(u["user_id"]): 0 for u in users}
+        if not reps_by_user:
+            return counts
+
+        async with db.begin_nested():
+            ids_by_external = await self._upsert_officials(
+                db, [rep for reps in reps_by_user.values() for rep in reps]
             )
-            db.add(official)
-            await db.flush()
+            links = [
+                (user_id, ids_by_external[f"congress:{rep['bioguide_id']}"])
+                for user_id, reps in reps_by_user.items()
+                for rep in reps
+            ]
+            user_ids = list(reps_by_user)
+            for i in range(0, len(user_ids), BULK_LINK_CHUNK):
+                chunk = set(user_ids[i:i + BULK_LINK_CHUNK])
+                await self._replace_user_officials_bulk(
+                    db, list(chunk), [link for link in links if link[0] in chunk]
+                )
+
+        await cache_delete_many([reps_key(user_id) for user_id in reps_by_user])
+
+        for user_id, reps in reps_by_user.items():
+            counts[user_id] = len(reps)
+        logger.info(f"Bulk-linked representatives for {len(reps_by_user)}/{len(users)} users")
+        return counts
+
+    async def _upsert_officials(self, db: AsyncSession, reps: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Insert or update officials by external_id (congress:{bioguide_id}) in
+        one INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement.
+
+        Returns:
+            external_id -> official id.
+        """
+        # Keyed by external_id: a statement can't touch the same row twice
+        rows = {
+            f"congress:{rep['bioguide_id']}": {
+                "external_id": f"congress:{rep['bioguide_id']}",
+                "name": rep["name"],
+                "party": rep["party"],
+                "office": rep["office"],
+                "chamber": rep["chamber"],
+                "district_label": rep["district_label"],
+                "photo_url": rep.get("photo_url"),
+                "bioguide_id": rep["bioguide_id"],
+            }
+            for rep in reps
+        }
 
-        return official
+        stmt = insert(Official).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Official.external_id],
+            set_={
+                "name": stmt.excluded.name,
+                "party": stmt.excluded.party,
+                "office": stmt.excluded.office,
+                "chamber": stmt.excluded.chamber,
+                "district_label": stmt.excluded.district_label,
+                "photo_url": stmt.excluded.photo_url,
+                "bioguide_id": stmt.excluded.bioguide_id,
+                "updated_at": utcnow(),
+            },
+        ).returning(Official.external_id, Official.id)
+
+        result = await db.execute(stmt)
+        return dict(result.all())
 
     async def _replace_user_officials(
         self, db: AsyncSession, user_id: str, official_ids: List
     ):
-        """Deactivate old user_officials and create new active links."""
-        # Deactivate all existing
-        stmt = select(UserOfficial).where(
-            UserOfficial.user_id == user_id,
-            UserOfficial.active == True,
-        )
-        result = await db.execute(stmt)
-        existing = result.scalars().all()
-        for uo in existing:
-            uo.active = False
-
-        # Create new active links
-        for official_id in official_ids:
-            # Check if link already exists
-            stmt = select(UserOfficial).where(
+        """
+        Make official_ids the user's active officials: deactivate every other
+        link in one UPDATE, then insert-or-reactivate these in one
+        INSERT ... ON CONFLICT, regardless of how many officials there are.
+        """
+        # Deactivate links that are no longer current
+        await db.execute(
+            update(UserOfficial)
+            .where(
                 UserOfficial.user_id == user_id,
-                UserOfficial.official_id == official_id,
+                UserOfficial.active == True,
+                UserOfficial.official_id.notin_(official_ids),
             )
-            result = await db.execute(stmt)
-            existing_link = result.scalar_one_or_none()
-
-            if existing_link:
-                existing_link.active = True
-            else:
-                db.add(UserOfficial(
-                    user_id=user_id,
-                    official_id=official_id,
-                    active=True,
-                ))
+            .values(active=False)
+        )
+
+        if not official_ids:
+            return
+
+        # Create new active links, reactivating any that already exist
+        stmt = insert(UserOfficial).values([
+            {"user_id": user_id, "official_id": official_id, "active": True}
+            for official_id in official_ids
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserOfficial.user_id, UserOfficial.official_id],
+            set_={"active": True},
+        )
+        await db.execute(stmt)
+
+
+    async def _replace_user_officials_bulk(
+        self, db: AsyncSession, user_ids: List[str], links: List[Tuple[str, Any]]
+    ):
+        """
+        _replace_user_officials for several users: links holds every
+        (user_id, official_id) pair that should be active for user_ids.
+        """
+        await db.execute(
+            update(UserOfficial)
+            .where(
+                UserOfficial.user_id.in_(user_ids),
+                UserOfficial.active == True,
+                tuple_(UserOfficial.user_id, UserOfficial.official_id).notin_(links),
+            )
+            .values(active=False)
+        )
+
+        if not links:
+            return
+
+        stmt = insert(UserOfficial).values([
+            {"user_id": user_id, "official_id": official_id, "active": True}
+            for user_id, official_id in links
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserOfficial.user_id, UserOfficial.official_id],
+            set_={"active": True},
+        )
+        await db.execute(stmt)
 
 
 # Global instance
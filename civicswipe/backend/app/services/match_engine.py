@@ -3,13 +3,14 @@ Match engine service - compares user votes to official votes
 """
 from typing import List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
 from uuid import UUID
 import logging
 
 from app.models import (
     UserVote, VoteEvent, OfficialVote, Official, 
-    UserOfficial, MatchResult, Measure
+    UserOfficial, MatchResult, MatchResultOfficial, Measure
 )
 
 logger = logging.getLogger(__name__)
@@ -62,7 +63,8 @@ class MatchEngine:
                 return 0
             
             # Compute match for each user
-            matches_computed = 0
+            match_rows = []
+            official_rows = []
             for user_vote in user_votes:
                 match_result = await self._compute_user_match(
                     db,
@@ -72,27 +74,43 @@ class MatchEngine:
                 )
                 
                 if match_result:
-                    # Upsert match result
-                    existing = await db.get(
-                        MatchResult,
-                        {"user_id": user_vote.user_id, "measure_id": measure_id}
+                    match_rows.append({
+                        "user_id": user_vote.user_id,
+                        "measure_id": measure_id,
+                        "match_score": match_result["score"],
+                        "notes": match_result["notes"],
+                    })
+                    official_rows.extend(
+                        {
+                            "measure_id": measure_id,
+                            "user_id": user_vote.user_id,
+                            "official_id": UUID(o["official_id"]),
+                            "official_vote": o["official_vote"],
+                            "matches_user": o["matches_user"],
+                        }
+                        for o in match_result["breakdown"]["officials"]
                     )
-                    
-                    if existing:
-                        existing.match_score = match_result["score"]
-                        existing.breakdown = match_result["breakdown"]
-                        existing.notes = match_result["notes"]
-                    else:
-                        new_match = MatchResult(
-                            user_id=user_vote.user_id,
-                            measure_id=measure_id,
-                            match_score=match_result["score"],
-                            breakdown=match_result["breakdown"],
-                            notes=match_result["notes"]
-                        )
-                        db.add(new_match)
-                    
-                    matches_computed += 1
+            
+            matches_computed = len(match_rows)
+            if match_rows:
+                # Upsert all match results, then replace the measure's
+                # per-official rows, as batched statements
+                stmt = insert(MatchResult)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[MatchResult.user_id, MatchResult.measure_id],
+                    set_={
+                        "match_score": stmt.excluded.match_score,
+                        "breakdown": None,
+                        "notes": stmt.excluded.notes,
+                    },
+                )
+                await db.execute(stmt, match_rows)
+                
+                await db.execute(
+                    delete(MatchResultOfficial).where(MatchResultOfficial.measure_id == measure_id)
+                )
+                if official_rows:
+                    await db.execute(insert(MatchResultOfficial), official_rows)
             
             await db.commit()
             logger.info(f"Computed {matches_computed} matches for measure {measure_id}")
@@ -12,13 +12,15 @@ import asyncio
 import re
 import xml.etree.ElementTree as ET
 from typing import Optional, Dict, Any, List
-from uuid import UUID, uuid4
+from uuid import UUID
 import logging
 
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 
+from app.core.database import uuid7
 from app.models import Measure, Official, VoteEvent, OfficialVote
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,9 @@ VOTE_MAP = {
     "not_voting": "not_voting",
 }
 
+# Rows per INSERT when writing official votes (a full House roll call is ~435)
+OFFICIAL_VOTE_BATCH_SIZE = 1000
+
 
 class RollCallVoteService:
     """
@@ -156,7 +161,7 @@ class RollCallVoteService:
 
         # Create VoteEvent
         vote_event = VoteEvent(
-            id=uuid4(),
+            id=uuid7(),
             measure_id=measure_id,
             body="U.S. House",
             external_id=external_id,
@@ -166,7 +171,9 @@ class RollCallVoteService:
         self.db.add(vote_event)
         await self.db.flush()
 
-        # Parse individual votes
+        # Parse individual votes (keyed by official, so a repeated member can't
+        # collide on the primary key within one batch)
+        votes: Dict[UUID, str] = {}
         for recorded_vote in root.findall(".//recorded-vote"):
             legislator = recorded_vote.find("legislator")
             if legislator is None:
@@ -179,17 +186,9 @@ class RollCallVoteService:
             if not official_id:
                 continue  # Unknown legislator
 
-            mapped_vote = VOTE_MAP.get(vote_text, "unknown")
-
-            official_vote = OfficialVote(
-                vote_event_id=vote_event.id,
-                official_id=official_id,
-                vote=mapped_vote,
-            )
-            self.db.add(official_vote)
-            stats["official_votes_created"] += 1
+            votes[official_id] = VOTE_MAP.get(vote_text, "unknown")
 
-        await self.db.flush()
+        await self._insert_official_votes(vote_event.id, votes, stats)
 
     # ──────────────────── Senate Roll Call Votes ────────────────────
 
@@ -297,7 +296,7 @@ class RollCallVoteService:
                 result = "failed"
 
         vote_event = VoteEvent(
-            id=uuid4(),
+            id=uuid7(),
             measure_id=measure_id,
             body="U.S. Senate",
             external_id=external_id,
@@ -308,6 +307,7 @@ class RollCallVoteService:
         await self.db.flush()
 
         # Parse member votes
+        votes: Dict[UUID, str] = {}
         for member in root.findall(".//members/member"):
             lis_id_el = member.find("lis_member_id")
             lis_id = lis_id_el.text.strip() if lis_id_el is not None and lis_id_el.text else ""
@@ -336,17 +336,32 @@ class RollCallVoteService:
             if not official_id:
                 continue
 
-            mapped_vote = VOTE_MAP.get(vote_text, "unknown")
+            votes[official_id] = VOTE_MAP.get(vote_text, "unknown")
 
-            official_vote = OfficialVote(
-                vote_event_id=vote_event.id,
-                official_id=official_id,
-                vote=mapped_vote,
-            )
-            self.db.add(official_vote)
-            stats["official_votes_created"] += 1
+        await self._insert_official_votes(vote_event.id, votes, stats)
+        await self.db.flush()  # Persist any lis_member_id backfills
 
-        await self.db.flush()
+    async def _insert_official_votes(self, vote_event_id: UUID, votes: Dict[UUID, str], stats: Dict):
+        """
+        Write a roll call's member votes with batched INSERT ... ON CONFLICT
+        instead of one ORM insert per member. Re-running a roll call updates
+        the recorded votes in place.
+        """
+        rows = [
+            {"vote_event_id": vote_event_id, "official_id": official_id, "vote": vote}
+            for official_id, vote in votes.items()
+        ]
+        if not rows:
+            return
+
+        stmt = insert(OfficialVote)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OfficialVote.vote_event_id, OfficialVote.official_id],
+            set_={"vote": stmt.excluded.vote},
+        )
+        for start in range(0, len(rows), OFFICIAL_VOTE_BATCH_SIZE):
+            await self.db.execute(stmt, rows[start:start + OFFICIAL_VOTE_BATCH_SIZE])
+        stats["official_votes_created"] += len(rows)
 
     # ──────────────────── Matching Helpers ────────────────────
 
@@ -0,0 +1,242 @@
+"""
+User stats service - incrementally maintained dashboard counters
+
+Each vote contributes a fixed set of counts to its user's user_stats row,
+determined by the vote value and the measure's status, level and chamber.
+Vote changes apply the difference between the old and new contribution;
+measure status changes shift the counts of everyone who voted on it. The
+dashboard then reads one row instead of aggregating over user_votes.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, case, and_, or_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.database import utcnow
+from app.models import UserStats, UserVote, Measure
+
+STAT_COLUMNS = (
+    "total_votes", "yea_votes", "nay_votes", "skipped",
+    "measures_passed", "measures_failed", "measures_pending",
+    "alignment_matches", "alignment_total",
+    "house_matches", "house_total",
+    "senate_matches", "senate_total",
+    "congress_matches", "congress_total",
+)
+
+# Bill type segments of federal external_ids, e.g. "119-hr-1234"
+_HOUSE_TYPES = ("-hr-", "-hjres-", "-hconres-", "-hres-")
+_SENATE_TYPES = ("-s-", "-sjres-", "-sconres-", "-sres-")
+
+_stats = UserStats.__table__
+_votes = UserVote.__table__
+
+
+def vote_contribution(
+    vote: Optional[str],
+    status: str,
+    level: str,
+    external_id: Optional[str],
+) -> Dict[str, int]:
+    """Counts a single vote adds to its user's stats; all zero for vote=None."""
+    counts = dict.fromkeys(STAT_COLUMNS, 0)
+    if vote is None:
+        return counts
+
+    counts["total_votes"] = 1
+    if vote == "yes":
+        counts["yea_votes"] = 1
+    elif vote == "no":
+        counts["nay_votes"] = 1
+    elif vote == "skip":
+        counts["skipped"] = 1
+
+    if status == "passed":
+        counts["measures_passed"] = 1
+    elif status == "failed":
+        counts["measures_failed"] = 1
+    else:
+        counts["measures_pending"] = 1
+        return counts
+
+    matched = int((vote == "yes" and status == "passed") or (vote == "no" and status == "failed"))
+    prefixes = ["alignment"]
+    if level == "federal":
+        prefixes.append("congress")
+        eid = external_id or ""
+        if any(t in eid for t in _HOUSE_TYPES):
+            prefixes.append("house")
+        if any(t in eid for t in _SENATE_TYPES):
+            prefixes.append("senate")
+    for prefix in prefixes:
+        counts[f"{prefix}_matches"] = matched
+        counts[f"{prefix}_total"] = 1
+    return counts
+
+
+def _delta(old: Dict[str, int], new: Dict[str, int]) -> Dict[str, int]:
+    return {col: new[col] - old[col] for col in STAT_COLUMNS}
+
+
+async def record_vote_change(
+    db: AsyncSession,
+    user_id: UUID,
+    old_vote: Optional[str],
+    new_vote: Optional[str],
+    status: str,
+    level: str,
+    external_id: Optional[str],
+) -> None:
+    """
+    Apply a user's vote change on one measure to their stats row in a single
+    INSERT ... ON CONFLICT DO UPDATE. old_vote is None for a first vote,
+    new_vote is None for a removed vote.
+    """
+    delta = _delta(
+        vote_contribution(old_vote, status, level, external_id),
+        vote_contribution(new_vote, status, level, external_id),
+    )
+    if not any(delta.values()):
+        return
+
+    stmt = insert(UserStats).values(user_id=user_id, **delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserStats.user_id],
+        set_={
+            **{col: _stats.c[col] + stmt.excluded[col] for col in STAT_COLUMNS},
+            "updated_at": utcnow(),
+        },
+    )
+    await db.execute(stmt)
+
+
+# One executemany row per changed measure: every voter's stats shift by the
+# delta for their vote value (user_votes is unique per user and measure, so
+# each user_stats row joins at most one vote). The bindparams are typed so
+# asyncpg sends integers, not text that "integer + text" would reject.
+_STATUS_SHIFT_STMT = (
+    update(_stats)
+    .where(
+        _stats.c.user_id == _votes.c.user_id,
+        _votes.c.measure_id == bindparam("b_measure_id", type_=PG_UUID(as_uuid=True)),
+    )
+    .values({
+        col: _stats.c[col] + case(
+            (_votes.c.vote == "yes", bindparam(f"{col}_yes", type_=Integer)),
+            (_votes.c.vote == "no", bindparam(f"{col}_no", type_=Integer)),
+            else_=bindparam(f"{col}_skip", type_=Integer),
+        )
+        for col in STAT_COLUMNS
+    })
+)
+
+
+async def record_status_changes(
+    db: AsyncSession,
+    changes: Iterable[Tuple[UUID, str, Optional[str], str, str]],
+) -> None:
+    """
+    Shift stats for everyone who voted on measures whose status changed.
+
+    changes holds (measure_id, level, external_id, old_status, new_status);
+    transitions that don't cross pending/passed/failed are no-ops.
+    """
+    params = []
+    for measure_id, level, external_id, old_status, new_status in changes:
+        row = {"b_measure_id": measure_id}
+        for vote in ("yes", "no", "skip"):
+            delta = _delta(
+                vote_contribution(vote, old_status, level, external_id),
+                vote_contribution(vote, new_status, level, external_id),
+            )
+            for col, value in delta.items():
+                row[f"{col}_{vote}"] = value
+        if any(v for k, v in row.items() if k != "b_measure_id"):
+            params.append(row)
+
+    if params:
+        await db.execute(_STATUS_SHIFT_STMT, params)
+
+
+# --- Full recompute, for users without a stats row yet ---
+
+_is_federal = Measure.level == "federal"
+_is_house = and_(_is_federal, or_(*[Measure.external_id.like(f"%{t}%") for t in _HOUSE_TYPES]))
+_is_senate = and_(_is_federal, or_(*[Measure.external_id.like(f"%{t}%") for t in _SENATE_TYPES]))
+_alignment_match = (
+    ((UserVote.vote == "yes") & (Measure.status == "passed"))
+    | ((UserVote.vote == "no") & (Measure.status == "failed"))
+)
+_has_outcome = Measure.status.in_(["passed", "failed"])
+
+
+def _alignment_cols(chamber_filter, prefix: str):
+    """Return (matches, total) aggregate columns for a chamber filter."""
+    return [
+        func.count(
+            case((and_(chamber_filter, _has_outcome, _alignment_match), 1))
+        ).label(f"{prefix}_matches"),
+        func.count(
+            case((and_(chamber_filter, _has_outcome), 1))
+        ).label(f"{prefix}_total"),
+    ]
+
+
+async def rebuild_user_stats(db: AsyncSession, user_id: UUID) -> Dict[str, int]:
+    """Recompute a user's stats from user_votes in one aggregate query and store them."""
+    stmt = (
+        select(
+            func.count(UserVote.measure_id).label("total_votes"),
+            func.count(case((UserVote.vote == "yes", 1))).label("yea_votes"),
+            func.count(case((UserVote.vote == "no", 1))).label("nay_votes"),
+            func.count(case((UserVote.vote == "skip", 1))).label("skipped"),
+            func.count(case((Measure.status == "passed", 1))).label("measures_passed"),
+            func.count(case((Measure.status == "failed", 1))).label("measures_failed"),
+            func.count(case((Measure.status.notin_(["passed", "failed"]), 1))).label("measures_pending"),
+            func.count(case((_alignment_match, 1))).label("alignment_matches"),
+            func.count(case((_has_outcome, 1))).label("alignment_total"),
+            *_alignment_cols(_is_house, "house"),
+            *_alignment_cols(_is_senate, "senate"),
+            *_alignment_cols(_is_federal, "congress"),
+        )
+        .join(Measure, UserVote.measure_id == Measure.id)
+        .where(UserVote.user_id == user_id)
+    )
+    row = (await db.execute(stmt)).one()
+    counts = {col: getattr(row, col) or 0 for col in STAT_COLUMNS}
+
+    upsert = insert(UserStats).values(user_id=user_id, **counts)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[UserStats.user_id],
+        set_={**{col: upsert.excluded[col] for col in STAT_COLUMNS}, "updated_at": utcnow()},
+    )
+    await db.execute(upsert)
+    return counts
+
+
+async def get_user_stats(db: AsyncSession, user_id: UUID) -> Dict[str, int]:
+    """A user's stats row as a dict (primary key lookup), rebuilt if missing."""
+    result = await db.execute(
+        select(*[_stats.c[col] for col in STAT_COLUMNS]).where(_stats.c.user_id == user_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return await rebuild_user_stats(db, user_id)
+    return dict(row._mapping)
+
+
+async def current_statuses(db: AsyncSession, source: str, external_ids: Iterable[str]) -> Dict[str, str]:
+    """
+    external_id -> status for existing measures, read before an ingestion
+    upsert so status changes can be passed to record_status_changes.
+    """
+    result = await db.execute(
+        select(Measure.external_id, Measure.status).where(
+            Measure.source == source,
+            Measure.external_id.in_(list(external_ids)),
+        )
+    )
+    return dict(result.all())
@@ -47,7 +47,7 @@ celery_app.conf.beat_schedule = {
     "ingest-federal-hourly": {
         "task": "app.tasks.ingestion.ingest_federal_data",
         "schedule": crontab(minute=0),  # Every hour at :00
-        "kwargs": {"congress": 118, "limit": 100},
+        "kwargs": {"congress": 118, "limit": 100, "force": True},
     },
 
     # Arizona data ingestion - every 2 hours
@@ -64,6 +64,13 @@ celery_app.conf.beat_schedule = {
         "kwargs": {"days": 14, "max_events": 10},
     },
 
+    # Congress member lists - dropped nightly so membership changes are
+    # picked up within a day (admins can also invalidate on demand)
+    "invalidate-congress-members-nightly": {
+        "task": "app.tasks.ingestion.invalidate_congress_members",
+        "schedule": crontab(minute=30, hour=3),  # Daily at 3:30
+    },
+
     # Summarization - every hour at :45
     "summarize-pending-hourly": {
         "task": "app.tasks.summarization.summarize_pending_measures",
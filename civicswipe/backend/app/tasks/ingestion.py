@@ -4,7 +4,7 @@ Data ingestion tasks
 These tasks run periodically to fetch legislative data from external sources.
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import asyncio
 
 from app.tasks.celery_app import celery_app
@@ -24,7 +24,9 @@ def run_async(coro):
 
 
 @celery_app.task(bind=True, name="app.tasks.ingestion.ingest_federal_data")
-def ingest_federal_data(self, congress: int = 119, limit: int = 50, fetch_all: bool = False) -> Dict[str, Any]:
+def ingest_federal_data(
+    self, congress: int = 119, limit: int = 50, fetch_all: bool = False, force: bool = False
+) -> Dict[str, Any]:
     """
     Ingest federal legislation data from Congress.gov.
 
@@ -32,6 +34,7 @@ def ingest_federal_data(self, congress: int = 119, limit: int = 50, fetch_all: b
         congress: Congress number (default: 119)
         limit: Maximum bills to fetch per page
         fetch_all: If True, paginate through ALL bills
+        force: Bypass the cached recent-bills response
 
     Returns:
         Ingestion statistics
@@ -41,7 +44,9 @@ def ingest_federal_data(self, congress: int = 119, limit: int = 50, fetch_all: b
     async def _run():
         from app.connectors.federal import run_federal_connector
         async with async_session_maker() as db:
-            stats = await run_federal_connector(db, congress=congress, limit=limit, fetch_all=fetch_all)
+            stats = await run_federal_connector(
+                db, congress=congress, limit=limit, fetch_all=fetch_all, force=force
+            )
             return stats
 
     try:
@@ -232,6 +237,21 @@ def run_connector(self, run_id: str, connector_name: str) -> Dict[str, Any]:
         raise self.retry(exc=e, countdown=60, max_retries=3)
 
 
+@celery_app.task(name="app.tasks.ingestion.invalidate_congress_members")
+def invalidate_congress_members(state: Optional[str] = None) -> None:
+    """
+    Drop cached Congress.gov member lists (one state, or all when state is
+    None). Scheduled nightly so membership changes show up within a day
+    even if nobody invalidates them by hand.
+    """
+    async def _run():
+        from app.services.congress_api import congress_api_service
+        await congress_api_service.invalidate_members_cache(state)
+
+    run_async(_run())
+    logger.info(f"Invalidated Congress member cache ({state or 'all states'})")
+
+
 @celery_app.task(bind=True, name="app.tasks.ingestion.ingest_all_sources")
 def ingest_all_sources(self) -> Dict[str, Dict[str, Any]]:
     """
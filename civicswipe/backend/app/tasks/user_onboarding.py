@@ -5,7 +5,7 @@ Background tasks triggered after signup to resolve a user's
 geographic location, political divisions, and congressional representatives.
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 import asyncio
 
 from app.tasks.celery_app import celery_app
@@ -100,8 +100,8 @@ def resolve_user_location(
                 profile = row.scalar_one_or_none()
 
                 if profile:
-                    profile.lat = str(lat)
-                    profile.lon = str(lon)
+                    profile.lat = float(lat)
+                    profile.lon = float(lon)
 
                 # Step 2: Resolve divisions
                 divisions = await division_resolver.resolve_divisions(
@@ -148,3 +148,77 @@ def resolve_user_location(
     except Exception as e:
         logger.error(f"Location resolution failed for user {user_id}: {e}")
         raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.user_onboarding.refresh_representatives_bulk",
+    max_retries=3,
+)
+def refresh_representatives_bulk(self, user_ids: List[str]) -> Dict[str, Any]:
+    """
+    Resolve congressional representatives for many users at once (e.g.
+    after an admin import), instead of one resolve_user_location run each.
+
+    Addresses are read from user_profile and decrypted here, so plaintext
+    addresses never pass through the broker.
+
+    Args:
+        user_ids: UUID strings of the users to refresh
+
+    Returns:
+        Dict with user and linked-representative counts
+    """
+    async def _run():
+        from sqlalchemy import select
+        from sqlalchemy.orm import undefer
+        from app.models import UserProfile
+        from app.core.security import decrypt_address
+        from app.services.congress_api import congress_api_service
+
+        async with async_session_maker() as db:
+            rows = await db.execute(
+                select(UserProfile)
+                .options(undefer(UserProfile.address_line1_enc))
+                .where(UserProfile.user_id.in_(user_ids))
+            )
+            users = []
+            skipped = []
+            for profile in rows.scalars():
+                try:
+                    street = decrypt_address(profile.address_line1_enc)
+                except Exception:
+                    # An empty street would geocode to no district and drop
+                    # the user's House rep link, so leave these users as-is
+                    skipped.append(str(profile.user_id))
+                    continue
+                users.append({
+                    "user_id": str(profile.user_id),
+                    "state": profile.state,
+                    "street": street,
+                    "city": profile.city,
+                    "zip_code": profile.postal_code,
+                })
+
+            if skipped:
+                logger.warning(
+                    f"Skipping {len(skipped)} users whose address could not be decrypted: {skipped}"
+                )
+
+            counts = await congress_api_service.refresh_user_representatives_bulk(db, users)
+            await db.commit()
+
+        return {
+            "users": len(users),
+            "users_skipped": len(skipped),
+            "users_linked": sum(1 for n in counts.values() if n),
+            "representatives_linked": sum(counts.values()),
+        }
+
+    try:
+        stats = run_async(_run())
+        logger.info(f"Bulk representative refresh completed: {stats}")
+        return stats
+    except Exception as e:
+        logger.error(f"Bulk representative refresh failed: {e}")
+        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
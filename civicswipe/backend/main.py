@@ -4,8 +4,9 @@ Main application entry point
 """
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 import time
 import uuid
@@ -29,6 +30,11 @@ async def lifespan(app: FastAPI):
     # Initialize Sentry for error tracking
     init_sentry()
 
+    # Derive the address-encryption key off the event loop while the rest of
+    # startup proceeds, instead of on the first signup/profile request
+    from app.core.security import warm_encryption_keys
+    key_warmup = asyncio.create_task(asyncio.to_thread(warm_encryption_keys))
+
     # Initialize database connection
     await init_db()
     logger.info("Database initialized")
@@ -37,12 +43,14 @@ async def lifespan(app: FastAPI):
     from app.core.cache import get_redis, close_redis
     await get_redis()
 
-    # Initialize shared httpx connection pools on service singletons
+    # Initialize shared HTTP connection pools on service singletons
     from app.services.congress_api import congress_api_service
     from app.services.geocoding import geocoding_service
     await congress_api_service.startup()
     await geocoding_service.startup()
 
+    await key_warmup
+
     yield
 
     # Cleanup
@@ -63,6 +71,8 @@ app = FastAPI(
     docs_url=None if _is_production else "/docs",
     redoc_url=None if _is_production else "/redoc",
     openapi_url=None if _is_production else "/openapi.json",
+    # Serialize response bodies with orjson (datetime/UUID encoded in C)
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -0,0 +1,69 @@
+"""
+User stats SQL against a real, migrated Postgres.
+
+Set TEST_DATABASE_URL (postgresql+asyncpg://...) to a database with
+database/*.sql applied; each test runs in a transaction that is rolled back.
+"""
+import os
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models import User, Measure, UserVote, UserStats
+from app.services.user_stats import STAT_COLUMNS, record_status_changes
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False, autoflush=False)
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_record_status_changes_shifts_voter_stats(db):
+    user = User(id=uuid4(), email=f"stats-{uuid4().hex}@example.com")
+    measure = Measure(
+        id=uuid4(), source="congress", external_id=f"119-hr-{uuid4().hex[:8]}",
+        title="Test bill", level="federal", status="introduced",
+    )
+    db.add_all([user, measure])
+    await db.flush()
+    db.add_all([
+        UserVote(user_id=user.id, measure_id=measure.id, vote="yes"),
+        UserStats(user_id=user.id, **{
+            **dict.fromkeys(STAT_COLUMNS, 0),
+            "total_votes": 1, "yea_votes": 1, "measures_pending": 1,
+        }),
+    ])
+    await db.flush()
+
+    await record_status_changes(db, [
+        (measure.id, "federal", measure.external_id, "introduced", "passed"),
+    ])
+
+    row = (await db.execute(
+        select(*[UserStats.__table__.c[col] for col in STAT_COLUMNS])
+        .where(UserStats.user_id == user.id)
+    )).one()._mapping
+    assert row["measures_pending"] == 0
+    assert row["measures_passed"] == 1
+    for prefix in ("alignment", "congress", "house"):
+        assert row[f"{prefix}_matches"] == 1
+        assert row[f"{prefix}_total"] == 1
+    assert row["senate_total"] == 0
+    assert row["total_votes"] == 1
@@ -0,0 +1,19 @@
+-- Migration 005: Composite indexes for connector/artifact lookups
+-- Replaces the single-column connector_id indexes with composites that lead on
+-- connector_id, so they also serve the plain connector_id lookups
+
+-- Raw artifact dedup: (connector_id, sha256)
+CREATE INDEX IF NOT EXISTS idx_raw_artifacts_connector_sha256
+    ON raw_artifacts(connector_id, sha256);
+
+-- Most recent artifacts per connector
+CREATE INDEX IF NOT EXISTS idx_raw_artifacts_connector_fetched
+    ON raw_artifacts(connector_id, fetched_at DESC);
+
+-- Most recent ingestion runs per connector
+CREATE INDEX IF NOT EXISTS idx_ingestion_runs_connector_started
+    ON ingestion_runs(connector_id, started_at DESC);
+
+-- Now redundant (only present on databases created from the ORM metadata)
+DROP INDEX IF EXISTS ix_raw_artifacts_connector_id;
+DROP INDEX IF EXISTS ix_ingestion_runs_connector_id;
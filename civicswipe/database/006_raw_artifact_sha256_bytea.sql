@@ -0,0 +1,12 @@
+-- Migration 006: Store raw artifact digests as bytea
+-- 32 raw bytes instead of 64 hex characters halves the column and its indexes.
+-- Existing hex values are decoded in place; the (connector_id, sha256) index
+-- from 005 is rebuilt automatically by the type change.
+
+ALTER TABLE raw_artifacts
+    ALTER COLUMN sha256 TYPE bytea USING decode(sha256, 'hex');
+
+-- Equality-only lookups: hash index instead of the default B-tree
+DROP INDEX IF EXISTS ix_raw_artifacts_sha256;
+CREATE INDEX IF NOT EXISTS idx_raw_artifacts_sha256
+    ON raw_artifacts USING hash (sha256);
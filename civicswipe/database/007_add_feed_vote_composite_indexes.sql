@@ -0,0 +1,25 @@
+-- Migration 007: Composite and partial indexes for feed / My Votes queries
+
+-- Recent votes per user, covering the columns dashboard and My Votes read
+CREATE INDEX IF NOT EXISTS idx_user_votes_user_created_covering
+    ON user_votes(user_id, created_at DESC) INCLUDE (measure_id, vote);
+
+-- Upcoming feed: partial index matching the FeedMode.UPCOMING status filter
+CREATE INDEX IF NOT EXISTS idx_measures_level_scheduled_upcoming
+    ON measures(level, scheduled_for)
+    WHERE status IN ('introduced', 'scheduled', 'in_committee');
+
+-- Timeline lookups (databases created from the ORM metadata lack this one)
+CREATE INDEX IF NOT EXISTS idx_measure_status_events_measure
+    ON measure_status_events(measure_id, effective_at DESC);
+
+-- Superseded by the covering index above
+DROP INDEX IF EXISTS idx_user_votes_user_created;
+
+-- Now redundant (only present on databases created from the ORM metadata):
+-- user_id leads both the covering index and the (user_id, measure_id) unique
+-- constraint, and created_at is only ever queried per user
+DROP INDEX IF EXISTS ix_user_votes_user_id;
+DROP INDEX IF EXISTS ix_user_votes_created_at;
+DROP INDEX IF EXISTS ix_measure_status_events_measure_id;
+DROP INDEX IF EXISTS ix_measure_status_events_effective_at;
@@ -0,0 +1,57 @@
+-- Migration 008: Store enum columns as SMALLINT codes
+-- The codes match the IntEnum classes in app/models/measure.py and
+-- app/models/user.py; they are append-only and must never be renumbered.
+-- The PostgreSQL enum types stay in place: divisions.level and
+-- vote_events.result still use jurisdiction_level / measure_status.
+
+-- The partial index predicate compares status to enum literals; rebuild it
+-- against the integer codes once the column is converted
+DROP INDEX IF EXISTS idx_measures_level_scheduled_upcoming;
+
+-- Defaults are enum literals and cannot be cast, so drop them first
+ALTER TABLE measures ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE measure_sources ALTER COLUMN ctype DROP DEFAULT;
+ALTER TABLE users ALTER COLUMN provider DROP DEFAULT;
+
+ALTER TABLE measures
+    ALTER COLUMN source TYPE smallint USING (CASE source
+        WHEN 'congress' THEN 1 WHEN 'govinfo' THEN 2 WHEN 'openstates' THEN 3
+        WHEN 'legiscan' THEN 4 WHEN 'legistar' THEN 5 WHEN 'custom' THEN 6 END),
+    ALTER COLUMN level TYPE smallint USING (CASE level
+        WHEN 'federal' THEN 1 WHEN 'state' THEN 2 WHEN 'county' THEN 3 WHEN 'city' THEN 4 END),
+    ALTER COLUMN status TYPE smallint USING (CASE status
+        WHEN 'introduced' THEN 1 WHEN 'scheduled' THEN 2 WHEN 'in_committee' THEN 3
+        WHEN 'passed' THEN 4 WHEN 'failed' THEN 5 WHEN 'tabled' THEN 6
+        WHEN 'withdrawn' THEN 7 WHEN 'unknown' THEN 8 END);
+
+ALTER TABLE measure_status_events
+    ALTER COLUMN status TYPE smallint USING (CASE status
+        WHEN 'introduced' THEN 1 WHEN 'scheduled' THEN 2 WHEN 'in_committee' THEN 3
+        WHEN 'passed' THEN 4 WHEN 'failed' THEN 5 WHEN 'tabled' THEN 6
+        WHEN 'withdrawn' THEN 7 WHEN 'unknown' THEN 8 END);
+
+ALTER TABLE measure_sources
+    ALTER COLUMN ctype TYPE smallint USING (CASE ctype
+        WHEN 'html' THEN 1 WHEN 'pdf' THEN 2 WHEN 'api' THEN 3 WHEN 'text' THEN 4 END);
+
+ALTER TABLE raw_artifacts
+    ALTER COLUMN ctype TYPE smallint USING (CASE ctype
+        WHEN 'html' THEN 1 WHEN 'pdf' THEN 2 WHEN 'api' THEN 3 WHEN 'text' THEN 4 END);
+
+ALTER TABLE connectors
+    ALTER COLUMN source TYPE smallint USING (CASE source
+        WHEN 'congress' THEN 1 WHEN 'govinfo' THEN 2 WHEN 'openstates' THEN 3
+        WHEN 'legiscan' THEN 4 WHEN 'legistar' THEN 5 WHEN 'custom' THEN 6 END);
+
+ALTER TABLE users
+    ALTER COLUMN provider TYPE smallint USING (CASE provider
+        WHEN 'password' THEN 1 WHEN 'google' THEN 2 WHEN 'apple' THEN 3 END);
+
+ALTER TABLE measures ALTER COLUMN status SET DEFAULT 8;        -- unknown
+ALTER TABLE measure_sources ALTER COLUMN ctype SET DEFAULT 1;  -- html
+ALTER TABLE users ALTER COLUMN provider SET DEFAULT 1;         -- password
+
+-- Upcoming feed: introduced, scheduled, in_committee
+CREATE INDEX IF NOT EXISTS idx_measures_level_scheduled_upcoming
+    ON measures(level, scheduled_for)
+    WHERE status IN (1, 2, 3);
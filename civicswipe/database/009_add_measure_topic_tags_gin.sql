@@ -0,0 +1,5 @@
+-- Migration 009: GIN index for topic/category feed filters
+-- The feed filters with topic_tags && ARRAY[...]; a B-tree cannot serve
+-- array overlap, so without this every filtered request scans measures
+CREATE INDEX IF NOT EXISTS idx_measures_topic_tags_gin
+    ON measures USING gin (topic_tags);
@@ -0,0 +1,33 @@
+-- Migration 010: Normalize match_results.breakdown into match_result_officials
+-- One row per (measure, user, official) comparison, so per-official queries
+-- can use an index instead of unpacking every breakdown blob.
+-- match_results.breakdown is no longer written (the match engine sets it to
+-- NULL on recompute, see 017) and will be dropped once nothing reads it.
+
+CREATE TABLE IF NOT EXISTS match_result_officials (
+  measure_id     uuid NOT NULL,
+  user_id        uuid NOT NULL,
+  official_id    uuid NOT NULL REFERENCES officials(id) ON DELETE CASCADE,
+  official_vote  text NOT NULL DEFAULT 'unknown',
+  matches_user   boolean NOT NULL DEFAULT false,
+  PRIMARY KEY (measure_id, user_id, official_id),
+  FOREIGN KEY (user_id, measure_id)
+    REFERENCES match_results(user_id, measure_id) ON DELETE CASCADE
+);
+
+-- Per-official alignment across all of a user's measures
+CREATE INDEX IF NOT EXISTS idx_match_result_officials_user_official
+    ON match_result_officials(user_id, official_id);
+
+-- Backfill from the existing JSONB breakdowns (skipping officials that have
+-- since been deleted)
+INSERT INTO match_result_officials (measure_id, user_id, official_id, official_vote, matches_user)
+SELECT mr.measure_id,
+       mr.user_id,
+       (o->>'official_id')::uuid,
+       COALESCE(o->>'official_vote', 'unknown'),
+       COALESCE((o->>'matches_user')::boolean, false)
+FROM match_results mr
+CROSS JOIN LATERAL jsonb_array_elements(mr.breakdown->'officials') AS o
+WHERE EXISTS (SELECT 1 FROM officials WHERE id = (o->>'official_id')::uuid)
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,28 @@
+-- Migration 011: Store vote columns as SMALLINT codes
+-- Codes match UserVoteCode / OfficialVoteCode in app/models/vote.py and
+-- MeasureStatusCode in app/models/measure.py; append-only.
+-- official_votes is the largest table in the schema, so the 2-byte column
+-- matters most there.
+
+ALTER TABLE official_votes ALTER COLUMN vote DROP DEFAULT;
+ALTER TABLE vote_events ALTER COLUMN result DROP DEFAULT;
+
+ALTER TABLE user_votes
+    ALTER COLUMN vote TYPE smallint USING (CASE vote WHEN 'no' THEN 0 WHEN 'yes' THEN 1 END);
+
+ALTER TABLE user_votes
+    ADD CONSTRAINT ck_user_vote_value CHECK (vote IN (0, 1));
+
+ALTER TABLE official_votes
+    ALTER COLUMN vote TYPE smallint USING (CASE vote
+        WHEN 'yea' THEN 1 WHEN 'nay' THEN 2 WHEN 'abstain' THEN 3 WHEN 'absent' THEN 4
+        WHEN 'present' THEN 5 WHEN 'not_voting' THEN 6 WHEN 'unknown' THEN 7 END);
+
+ALTER TABLE vote_events
+    ALTER COLUMN result TYPE smallint USING (CASE result
+        WHEN 'introduced' THEN 1 WHEN 'scheduled' THEN 2 WHEN 'in_committee' THEN 3
+        WHEN 'passed' THEN 4 WHEN 'failed' THEN 5 WHEN 'tabled' THEN 6
+        WHEN 'withdrawn' THEN 7 WHEN 'unknown' THEN 8 END);
+
+ALTER TABLE official_votes ALTER COLUMN vote SET DEFAULT 7;    -- unknown
+ALTER TABLE vote_events ALTER COLUMN result SET DEFAULT 8;     -- unknown
@@ -0,0 +1,11 @@
+-- Migration 012: Native floating point for match scores and coordinates
+-- numeric arithmetic runs in software; AVG/SUM over real/double precision
+-- does not. match_score only carries three decimals, so real is plenty.
+
+ALTER TABLE match_results ALTER COLUMN match_score DROP DEFAULT;
+ALTER TABLE match_results ALTER COLUMN match_score TYPE real USING match_score::real;
+ALTER TABLE match_results ALTER COLUMN match_score SET DEFAULT 0;
+
+ALTER TABLE user_profile
+    ALTER COLUMN lat TYPE double precision USING lat::double precision,
+    ALTER COLUMN lon TYPE double precision USING lon::double precision;
@@ -0,0 +1,11 @@
+-- Migration 013: Derived birth_year for age-range queries
+-- Kept in sync by the signup and profile-update handlers; an indexed
+-- smallint range scan replaces computing age from every users.birthday
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS birth_year smallint;
+
+UPDATE users
+SET birth_year = EXTRACT(YEAR FROM birthday)::smallint
+WHERE birthday IS NOT NULL AND birth_year IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_users_birth_year ON users(birth_year);
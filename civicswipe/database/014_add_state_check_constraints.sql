@@ -0,0 +1,26 @@
+-- Migration 014: Restrict users.state / user_profile.state to US state codes
+-- Profile states were only length-checked before, so normalize case first.
+-- Constraints are added NOT VALID so existing rows don't block the deploy;
+-- new writes are checked immediately. Once any stray codes are fixed, run:
+--   ALTER TABLE users VALIDATE CONSTRAINT ck_user_valid_state;
+--   ALTER TABLE user_profile VALIDATE CONSTRAINT ck_user_profile_valid_state;
+
+UPDATE user_profile SET state = upper(state) WHERE state <> upper(state);
+
+ALTER TABLE users
+    ADD CONSTRAINT ck_user_valid_state CHECK (state IN (
+        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
+    )) NOT VALID;
+
+ALTER TABLE user_profile
+    ADD CONSTRAINT ck_user_profile_valid_state CHECK (state IN (
+        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
+    )) NOT VALID;
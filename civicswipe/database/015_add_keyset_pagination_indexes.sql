@@ -0,0 +1,12 @@
+-- Migration 015: Indexes matching the keyset pagination order of list endpoints
+-- My Votes pages on (created_at DESC, id DESC) and Matches on
+-- (computed_at DESC, measure_id DESC), both per user
+
+CREATE INDEX IF NOT EXISTS idx_user_votes_user_created_id_covering
+    ON user_votes(user_id, created_at DESC, id DESC) INCLUDE (measure_id, vote);
+
+CREATE INDEX IF NOT EXISTS idx_match_results_user_computed
+    ON match_results(user_id, computed_at DESC, measure_id DESC);
+
+-- Superseded by the covering index above (same leading columns plus id)
+DROP INDEX IF EXISTS idx_user_votes_user_created_covering;
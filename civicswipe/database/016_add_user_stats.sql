@@ -0,0 +1,66 @@
+-- Migration 016: Per-user dashboard counters
+-- Maintained incrementally by the app on each vote change and measure status
+-- change (app/services/user_stats.py); the dashboard reads one row by PK.
+-- Codes: user_votes.vote 0=no 1=yes 2=skip; measures.status 4=passed
+-- 5=failed; measures.level 1=federal (see 008 and 011)
+
+CREATE TABLE IF NOT EXISTS user_stats (
+    user_id uuid PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    total_votes integer NOT NULL DEFAULT 0,
+    yea_votes integer NOT NULL DEFAULT 0,
+    nay_votes integer NOT NULL DEFAULT 0,
+    skipped integer NOT NULL DEFAULT 0,
+    measures_passed integer NOT NULL DEFAULT 0,
+    measures_failed integer NOT NULL DEFAULT 0,
+    measures_pending integer NOT NULL DEFAULT 0,
+    alignment_matches integer NOT NULL DEFAULT 0,
+    alignment_total integer NOT NULL DEFAULT 0,
+    house_matches integer NOT NULL DEFAULT 0,
+    house_total integer NOT NULL DEFAULT 0,
+    senate_matches integer NOT NULL DEFAULT 0,
+    senate_total integer NOT NULL DEFAULT 0,
+    congress_matches integer NOT NULL DEFAULT 0,
+    congress_total integer NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+-- Backfill from existing votes
+INSERT INTO user_stats (
+    user_id, total_votes, yea_votes, nay_votes, skipped,
+    measures_passed, measures_failed, measures_pending,
+    alignment_matches, alignment_total,
+    house_matches, house_total, senate_matches, senate_total,
+    congress_matches, congress_total
+)
+SELECT
+    v.user_id,
+    count(*),
+    count(*) FILTER (WHERE v.vote = 1),
+    count(*) FILTER (WHERE v.vote = 0),
+    count(*) FILTER (WHERE v.vote = 2),
+    count(*) FILTER (WHERE m.status = 4),
+    count(*) FILTER (WHERE m.status = 5),
+    count(*) FILTER (WHERE m.status NOT IN (4, 5)),
+    count(*) FILTER (WHERE v.matched),
+    count(*) FILTER (WHERE m.status IN (4, 5)),
+    count(*) FILTER (WHERE v.matched AND v.house),
+    count(*) FILTER (WHERE m.status IN (4, 5) AND v.house),
+    count(*) FILTER (WHERE v.matched AND v.senate),
+    count(*) FILTER (WHERE m.status IN (4, 5) AND v.senate),
+    count(*) FILTER (WHERE v.matched AND m.level = 1),
+    count(*) FILTER (WHERE m.status IN (4, 5) AND m.level = 1)
+FROM measures m
+JOIN LATERAL (
+    SELECT
+        uv.user_id,
+        uv.vote,
+        (uv.vote = 1 AND m.status = 4) OR (uv.vote = 0 AND m.status = 5) AS matched,
+        m.level = 1 AND (m.external_id LIKE '%-hr-%' OR m.external_id LIKE '%-hjres-%'
+                         OR m.external_id LIKE '%-hconres-%' OR m.external_id LIKE '%-hres-%') AS house,
+        m.level = 1 AND (m.external_id LIKE '%-s-%' OR m.external_id LIKE '%-sjres-%'
+                         OR m.external_id LIKE '%-sconres-%' OR m.external_id LIKE '%-sres-%') AS senate
+    FROM user_votes uv
+    WHERE uv.measure_id = m.id
+) v ON true
+GROUP BY v.user_id
+ON CONFLICT (user_id) DO NOTHING;
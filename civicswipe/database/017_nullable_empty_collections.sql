@@ -0,0 +1,14 @@
+-- Migration 017: Store empty tag/topic arrays and the deprecated match
+-- breakdown as NULL instead of '{}' on every row
+-- Readers coerce NULL to an empty list. Existing empty values are left as
+-- they are rather than rewriting every row; both forms read the same.
+
+ALTER TABLE measures ALTER COLUMN topic_tags DROP NOT NULL;
+ALTER TABLE measures ALTER COLUMN topic_tags DROP DEFAULT;
+
+ALTER TABLE user_preferences ALTER COLUMN topics DROP NOT NULL;
+ALTER TABLE user_preferences ALTER COLUMN topics DROP DEFAULT;
+
+-- Superseded by match_result_officials (010); no longer written
+ALTER TABLE match_results ALTER COLUMN breakdown DROP NOT NULL;
+ALTER TABLE match_results ALTER COLUMN breakdown DROP DEFAULT;